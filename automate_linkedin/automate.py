@@ -1,25 +1,22 @@
 import argparse
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from hydra import initialize, compose
 
 from automate_linkedin.cache import JobCache
-from automate_linkedin.scraper import LinkedInScraper
+from automate_linkedin.config import ConfigError, load_configs
 from automate_linkedin.utils import Colors
 
 """
 LinkedIn Job Automation Script
 ================================
 
-This script automates job searching, ranking, and suggestion processes on LinkedIn. It supports three modes: `scan`, `apply`, and `stats`.
+This script automates job searching, ranking, and suggestion processes on LinkedIn. It supports four modes: `scan`, `apply`, `stats`, and `rescore`.
 
 USAGE:
 ------
-Run the script with one of the three modes:
+Run the script with one of the four modes:
 - `scan`: Scrapes LinkedIn jobs based on filters and stores them in a database.
 - `apply`: Suggests jobs to apply for based on rankings and recommends a resume.
 - `stats`: Displays statistics of the jobs in the database.
+- `rescore`: Re-applies the keyword filters to the jobs already in the database.
 
 CONFIGURATION FILES:
 --------------------
@@ -27,6 +24,11 @@ CONFIGURATION FILES:
 2. `xpaths.yaml`: Stores XPaths for LinkedIn UI elements. This allows quick updates if LinkedIn's UI changes.
 3. `job_filters.yaml`: Contains filters for job search, such as keywords, experience levels, and locations.
 4. `resume.yaml`: Maps keywords to resumes and defines the number of applications to suggest in `apply` mode.
+5. `scan.yaml`: Wait timeouts, anti-detection jitter, and session reuse used while scanning.
+
+The files are validated and cached as a JSON snapshot (`configs/.snapshot.json`) that is
+rebuilt whenever one of them changes. Browser dependencies (Selenium, webdriver-manager)
+are only imported in `scan` mode.
 
 MODES EXPLAINED:
 ----------------
@@ -37,8 +39,14 @@ MODES EXPLAINED:
    - Scrapes job details such as title, company, posting date, location, and link.
    - Ranks jobs based on positive keywords in the description and skips irrelevant jobs with negative keywords.
    - Skips jobs already viewed using their unique job ID.
+   - Runs every search profile listed under `searches` in `job_filters.yaml`, ordered by
+     the hit rate of earlier scans; a job found by several searches is fetched once.
    - Saves relevant jobs to the database (`job_cache.db`) with details like:
      - Title, company, date of posting, location, and link.
+   - `--workers N` runs N browser sessions in parallel, each scanning its own share of the
+     result pages, and reports jobs/minute per worker and in total.
+   - Progress is checkpointed in the database as the scan goes. After a crash or Ctrl-C,
+     `--resume` continues from the last completed job instead of starting over.
 
 2. **Apply Mode**:
    - Suggests jobs to apply for based on ranking and posting date.
@@ -54,6 +62,12 @@ MODES EXPLAINED:
      - Number of jobs applied to.
      - Number of unique companies.
 
+4. **Rescore Mode**:
+   - Recomputes points and matched keywords for stored jobs from their saved descriptions,
+     without opening LinkedIn. Run it after editing the keywords in `job_filters.yaml`.
+   - Jobs already scored with the current keywords are skipped.
+   - `--workers N` sets the number of scoring processes (defaults to the number of CPUs).
+
 """
 
 def main():
@@ -61,41 +75,111 @@ def main():
     parser.add_argument(
         "--mode",
         required=True,
-        choices=["scan", "apply", "stats"],
-        help="Select mode: scan, apply, or stats",
+        choices=["scan", "apply", "stats", "rescore"],
+        help="Select mode: scan, apply, stats, or rescore",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel browser sessions in scan mode (default 1), "
+        "or scoring processes in rescore mode (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="In scan mode, continue the last interrupted scan from its last completed job",
     )
     args = parser.parse_args()
 
-    # Load configuration files
-    with initialize(config_path="configs"):
-        filters = compose(config_name="job_filters")
-        credentials = compose(config_name="credentials")
-        xpaths = compose(config_name="xpaths")
-        resume = compose(config_name="resume")
+    # Load configuration files (from the validated snapshot when they are unchanged)
+    try:
+        configs = load_configs()
+    except ConfigError as e:
+        print(f"{Colors.FAIL}Invalid configuration: {e}{Colors.ENDC}")
+        return
+    filters = configs["job_filters"]
+    credentials = configs["credentials"]
+    xpaths = configs["xpaths"]
+    resume = configs["resume"]
+    scan_config = configs["scan"]
 
     # Initialize database
-    cache = JobCache()
+    database_config = scan_config.get("database", {})
+    cache = JobCache(
+        journal_mode=database_config.get("journal_mode", "WAL"),
+        synchronous=database_config.get("synchronous", "NORMAL"),
+        description_codec=database_config.get("description_codec"),
+    )
 
     if args.mode == "scan":
         """
         SCAN MODE:
         ----------
-        - Logs into LinkedIn using credentials from `credentials.yaml`.
-        - Generates a job search query based on `job_filters.yaml`.
+        - Reuses the saved LinkedIn session, or logs in using credentials from `credentials.yaml`.
+        - Generates a job search query for every search profile in `job_filters.yaml`,
+          best past hit rate first, and fetches each job at most once per scan.
         - Scrapes jobs using the XPaths from `xpaths.yaml`.
         - Filters jobs based on description keywords.
         - Saves relevant jobs to the database.
+        - With `--workers N`, shards the result pages across N browser sessions.
+        - Checkpoints progress; `--resume` continues an interrupted scan.
         """
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-        try:
-            scraper = LinkedInScraper(driver, xpaths, filters, credentials)
-            scraper.login()
-            scraper.search_jobs()
-            scraper.extract_job_details(filters, cache)
-        except Exception as e:
-            print(f"{Colors.FAIL}An error occurred during scan: {e}{Colors.ENDC}")
-        finally:
-            driver.quit()
+        from automate_linkedin.browser import new_chrome
+        from automate_linkedin.checkpoint import ScanCheckpoint
+        from automate_linkedin.metrics import create_metrics
+        from automate_linkedin.planner import ScanPlanner
+        from automate_linkedin.scraper import LinkedInScraper
+        from automate_linkedin.session import SessionStore
+        from automate_linkedin.workers import ScanWorkerPool
+
+        browser_config = scan_config.get("browser", {})
+        # Stage timings; a no-op unless enabled in the `metrics` section of `scan.yaml`
+        metrics = create_metrics(scan_config.get("metrics"))
+        cache.metrics = metrics
+        # Group database writes into transactions; the batch is flushed on exit or error
+        with cache.batch(
+            flush_rows=database_config.get("batch_rows", 100),
+            flush_seconds=database_config.get("batch_seconds", 5),
+        ):
+            # Progress is checkpointed as the scan goes so an interrupted scan can be resumed
+            checkpoint = ScanCheckpoint.resume(cache) if args.resume else None
+            if args.resume and checkpoint is None:
+                print(f"{Colors.WARNING}No interrupted scan to resume; starting a new scan{Colors.ENDC}")
+            if checkpoint is None:
+                checkpoint = ScanCheckpoint.start(cache)
+
+            if args.workers and args.workers > 1:
+                try:
+                    pool = ScanWorkerPool(
+                        lambda: new_chrome(browser_config),
+                        xpaths,
+                        filters,
+                        credentials,
+                        workers=args.workers,
+                        scan_config=scan_config,
+                        metrics=metrics,
+                    )
+                    pool.run(cache, checkpoint)
+                except Exception as e:
+                    print(f"{Colors.FAIL}An error occurred during scan: {e}{Colors.ENDC}")
+            else:
+                # A single session can reuse the Chrome profile configured in `scan.yaml`
+                driver = new_chrome(
+                    browser_config, SessionStore(scan_config.get("session")).chrome_arguments()
+                )
+                try:
+                    scraper = LinkedInScraper(driver, xpaths, filters, credentials, scan_config, metrics)
+                    scraper.login()
+                    ScanPlanner(filters, cache).run(scraper, checkpoint=checkpoint)
+                except KeyboardInterrupt:
+                    print(f"{Colors.WARNING}Scan interrupted; run again with --resume to continue{Colors.ENDC}")
+                except Exception as e:
+                    print(f"{Colors.FAIL}An error occurred during scan: {e}{Colors.ENDC}")
+                finally:
+                    driver.quit()
+        metrics.report()
+        metrics.close()
 
     elif args.mode == "apply":
         """
@@ -109,10 +193,9 @@ def main():
         - Stops after suggesting the number of jobs specified in `resume.yaml`.
         """
         try:
-            scraper = LinkedInScraper(
-                None, xpaths, filters, credentials
-            )  # Pass None as driver is not needed
-            scraper.recommend_and_apply_jobs(cache, resume)
+            from automate_linkedin.reports import recommend_and_apply_jobs
+
+            recommend_and_apply_jobs(cache, resume)
         except Exception as e:
             print(f"{Colors.FAIL}An error occurred during apply: {e}{Colors.ENDC}")
 
@@ -126,13 +209,27 @@ def main():
           - Number of unique companies.
         """
         try:
-            scraper = LinkedInScraper(
-                None, xpaths, filters, credentials
-            )  # Pass None as driver is not needed
-            scraper.generate_stats(cache)
+            from automate_linkedin.reports import generate_stats
+
+            generate_stats(cache)
         except Exception as e:
             print(f"{Colors.FAIL}An error occurred during stats: {e}{Colors.ENDC}")
 
+    elif args.mode == "rescore":
+        """
+        RESCORE MODE:
+        -------------
+        - Re-scores stored jobs with the current keywords from `job_filters.yaml`.
+        - Skips jobs whose score was computed with the same keywords.
+        - With `--workers N`, scores descriptions in N processes.
+        """
+        try:
+            from automate_linkedin.rescore import JobRescorer
+
+            JobRescorer(cache, filters, workers=args.workers).run()
+        except Exception as e:
+            print(f"{Colors.FAIL}An error occurred during rescore: {e}{Colors.ENDC}")
+
     # Close the database connection
     cache.close()
 
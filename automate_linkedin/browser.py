@@ -0,0 +1,87 @@
+import json
+import os
+import time
+from automate_linkedin.utils import Colors
+
+"""
+Browser Setup
+=============
+
+Creates Chrome sessions for scan mode. Selenium and webdriver-manager are imported only
+here, and only when a browser is actually started, so modes that never open a browser
+(`apply`, `stats`, `rescore`) start without loading them.
+
+`ChromeDriverManager().install()` checks online for driver updates on every call; the
+resolved driver path is cached and re-checked only every `driver_max_age_days`, or right
+away if the cached driver no longer starts Chrome.
+"""
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "automate_linkedin")
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+
+
+def cached_driver_path(max_age_days, cache_file=DRIVER_CACHE_FILE):
+    """
+    :param max_age_days: Maximum age of the cached entry in days.
+    :param cache_file: JSON file holding the cached driver path.
+    :return: The cached chromedriver path, or None if it is missing, stale, or deleted.
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        path, resolved_at = cached["path"], cached["resolved_at"]
+    except (OSError, ValueError, KeyError):
+        return None
+    if time.time() - resolved_at > max_age_days * 86400 or not os.path.exists(path):
+        return None
+    return path
+
+
+def chromedriver_path(max_age_days=7, refresh=False, cache_file=DRIVER_CACHE_FILE):
+    """
+    Returns the chromedriver path, resolving it with webdriver-manager only when the
+    cached path is missing, older than `max_age_days`, or `refresh` is set.
+    :param max_age_days: How long a resolved path is trusted without checking for updates.
+    :param refresh: If True, ignore the cached path.
+    :param cache_file: JSON file holding the cached driver path.
+    :return: Path to the chromedriver executable.
+    """
+    path = None if refresh else cached_driver_path(max_age_days, cache_file)
+    if path:
+        return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "resolved_at": time.time()}, f)
+    except OSError as e:
+        print(f"{Colors.WARNING}Could not cache the chromedriver path: {e}{Colors.ENDC}")
+    return path
+
+
+def new_chrome(browser_config=None, arguments=()):
+    """
+    Starts a Chrome session. If the cached driver cannot start Chrome (e.g. after a
+    Chrome update), the driver is resolved again and the start is retried once.
+    :param browser_config: `browser` section of `scan.yaml` with `driver_max_age_days`.
+    :param arguments: Extra Chrome command-line arguments.
+    :return: Selenium WebDriver instance.
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+
+    browser_config = browser_config or {}
+    max_age_days = browser_config.get("driver_max_age_days", 7)
+
+    options = webdriver.ChromeOptions()
+    for argument in arguments:
+        options.add_argument(argument)
+    try:
+        return webdriver.Chrome(service=Service(chromedriver_path(max_age_days)), options=options)
+    except SessionNotCreatedException:
+        driver_path = chromedriver_path(max_age_days, refresh=True)
+        return webdriver.Chrome(service=Service(driver_path), options=options)
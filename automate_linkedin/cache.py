@@ -1,5 +1,70 @@
 import sqlite3
 import datetime
+import threading
+import time
+from contextlib import contextmanager
+from automate_linkedin.dedup import DuplicateIndex, minhash, pack_signature, unpack_signature
+from automate_linkedin.descriptions import DescriptionCodec
+from automate_linkedin.metrics import NULL_METRICS
+from automate_linkedin.migrations import migrate, to_timestamp
+from automate_linkedin.utils import Colors
+
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+class BatchWriter:
+    """
+    Buffers write statements and commits them together in a single transaction.
+
+    The buffer is flushed once it holds `flush_rows` statements or when a statement is
+    queued more than `flush_seconds` after the last flush. Use it through
+    `JobCache.batch()`, which also flushes on exit.
+    """
+
+    def __init__(self, cache, flush_rows=100, flush_seconds=5.0):
+        """
+        Args:
+            cache (JobCache): Cache whose connection the statements are written to.
+            flush_rows (int): Number of queued statements that triggers a flush.
+            flush_seconds (float): Maximum age of the buffer before a flush.
+        """
+        self.cache = cache
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+    def add(self, query, params):
+        """
+        Queues a write statement and flushes if the buffer is full or old enough.
+
+        Args:
+            query (str): SQL statement.
+            params (tuple): Parameters for the statement.
+        """
+        with self.cache.lock:
+            self.pending.append((query, params))
+            if (
+                len(self.pending) >= self.flush_rows
+                or time.monotonic() - self.last_flush >= self.flush_seconds
+            ):
+                self.flush()
+
+    def flush(self):
+        """
+        Writes all queued statements in one transaction.
+        """
+        with self.cache.lock:
+            if self.pending:
+                with self.cache.metrics.span("db.commit"), self.cache.connection:
+                    cursor = self.cache.connection.cursor()
+                    for query, params in self.pending:
+                        cursor.execute(query, params)
+                self.pending = []
+            self.last_flush = time.monotonic()
+
 
 class JobCache:
     """
@@ -8,52 +73,134 @@ class JobCache:
     This class provides methods to create and interact with a SQLite database 
     that stores job details. It includes functionality for adding jobs, updating 
     their application status, querying data, and managing the database connection.
+
+    A single instance can be shared by several scan workers: the connection is opened
+    with `check_same_thread=False` and every statement runs under one lock, which gives
+    all workers a single serialized write path into the database.
+
+    By default the database runs in WAL mode with `synchronous=NORMAL`, so readers such
+    as `database.py` do not block the scanner and commits do not fsync on every row.
+    Inside `with cache.batch():` writes are buffered and committed in groups.
     """
 
-    def __init__(self, db_path="job_cache.db"):
+    def __init__(self, db_path="job_cache.db", journal_mode="WAL", synchronous="NORMAL", description_codec=None):
         """
         Initializes the JobCache instance and creates the database table if it doesn't exist.
 
         Args:
             db_path (str): Path to the SQLite database file. Defaults to "job_cache.db".
+            journal_mode (str): SQLite journal mode. Defaults to "WAL".
+            synchronous (str): SQLite synchronous level. Defaults to "NORMAL".
+            description_codec (str): Compression of new descriptions, "zlib" or "zstd".
+                Defaults to None, which stores them as plain text in `jobs.full_description`.
         """
-        self.connection = sqlite3.connect(db_path)
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal mode: {journal_mode}")
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unsupported synchronous level: {synchronous}")
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.connection.execute(f"PRAGMA synchronous={synchronous}")
+        # The codec also decompresses stored descriptions, so it is registered either way
+        self.compress_descriptions = description_codec is not None
+        self.descriptions = DescriptionCodec(self.connection, description_codec or "zlib")
+        self.descriptions.register()
+        self.lock = threading.RLock()
+        self.writer = None
+        self.duplicates = None
+        # Replaced with a `metrics.Metrics` instance to time database calls
+        self.metrics = NULL_METRICS
         self.create_table()
 
     def create_table(self):
         """
-        Creates the `jobs` table in the database if it does not already exist.
+        Creates the database tables, or upgrades an existing database to the current
+        schema, by applying any pending migrations from `migrations.py`.
 
-        The table includes the following columns:
+        The `jobs` table includes the following columns:
         - `job_id`: Unique identifier for the job (Primary Key).
         - `title`: Job title.
         - `company`: Company offering the job.
         - `location`: Job location.
-        - `date_posted`: Date the job was posted.
+        - `date_posted`: Date the job was posted, as an ISO-8601 timestamp.
         - `points`: A score assigned to the job based on keyword matching.
         - `matched_keywords`: Keywords from the job description that matched user-defined filters.
-        - `full_description`: Full job description.
+        - `full_description`: Full job description as plain text, or NULL once compressed.
+        - `description_hash`: Key of the compressed description in the `descriptions`
+          table, or NULL for plain text. The `job_descriptions` view returns the text of
+          either form as `full_description`.
         - `job_link`: URL to the job posting.
         - `applied`: Boolean flag indicating if the job has been applied to.
         - `date_applied`: Date the job was marked as applied.
+        - `cluster_id`: ID of the first job with a near-identical description (see `dedup.py`).
+
+        The `seen_jobs` table records the outcome of every job the scanner has opened
+        (saved, irrelevant, blacklisted, or failed) so later scans can skip them without
+        opening the job again.
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id TEXT PRIMARY KEY,
-                title TEXT,
-                company TEXT,
-                location TEXT,
-                date_posted TEXT,
-                points INTEGER,
-                matched_keywords TEXT,
-                full_description TEXT,
-                job_link TEXT,
-                applied BOOLEAN DEFAULT 0,
-                date_applied TEXT
+        with self.lock:
+            for version, description in migrate(self.connection):
+                print(f"{Colors.OKCYAN}Database upgraded to version {version}: {description}{Colors.ENDC}")
+            self.search_index = bool(
+                self.connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchall()
             )
-        """)
-        self.connection.commit()
+
+    def write(self, query, params=()):
+        """
+        Executes a write statement, either immediately or through the active batch writer.
+
+        Args:
+            query (str): SQL statement.
+            params (tuple): Parameters for the statement.
+        """
+        with self.lock:
+            if self.writer is not None:
+                self.writer.add(query, params)
+                return
+            with self.metrics.span("db.write"):
+                cursor = self.connection.cursor()
+                cursor.execute(query, params)
+                self.connection.commit()
+
+    def flush(self):
+        """
+        Commits any writes buffered by the active batch writer.
+        """
+        with self.lock:
+            if self.writer is not None:
+                self.writer.flush()
+
+    @contextmanager
+    def batch(self, flush_rows=100, flush_seconds=5.0):
+        """
+        Buffers writes made inside the block and commits them in groups.
+
+        Buffered rows are flushed every `flush_rows` rows, when a write arrives more than
+        `flush_seconds` after the last flush, before every read, and always when the block
+        exits, including on errors.
+
+        Args:
+            flush_rows (int): Number of buffered writes that triggers a commit.
+            flush_seconds (float): Maximum time between commits while writes keep arriving.
+
+        Yields:
+            BatchWriter: The active writer.
+        """
+        with self.lock:
+            if self.writer is not None:
+                # Nested batches share the outer writer
+                yield self.writer
+                return
+            self.writer = BatchWriter(self, flush_rows, flush_seconds)
+        try:
+            yield self.writer
+        finally:
+            with self.lock:
+                writer, self.writer = self.writer, None
+                writer.flush()
 
     def add_job(
         self,
@@ -66,6 +213,7 @@ class JobCache:
         matched_keywords,
         full_description,
         job_link,
+        score_hash=None,
     ):
         """
         Adds a job to the database if it doesn't already exist.
@@ -75,32 +223,122 @@ class JobCache:
             title (str): Job title.
             company (str): Company offering the job.
             location (str): Job location.
-            date_posted (str): Date the job was posted.
+            date_posted (datetime | str): Date the job was posted.
             points (int): Score assigned to the job based on keyword matching.
             matched_keywords (str): Comma-separated list of matched keywords.
-            full_description (str): Full job description.
+            full_description (str): Full job description; stored as plain text, or
+                compressed and once per distinct text if the cache has a description codec.
             job_link (str): URL to the job posting.
+            score_hash (str): Hash of the keyword filters the job was scored with.
+
+        Returns:
+            str: Cluster ID of the job: the ID of an earlier job with a near-identical
+                description, or its own ID.
+        """
+        signature = minhash(full_description)
+        with self.lock:
+            duplicates = self.duplicate_index()
+            if job_id in duplicates.clusters:
+                # Already stored; INSERT OR IGNORE keeps the existing row
+                return duplicates.clusters[job_id]
+            description = None
+            if self.compress_descriptions and full_description is not None:
+                # Compressors are not thread-safe, so compress under the lock
+                description = self.descriptions.compress(full_description)
+                self.write(
+                    "INSERT OR IGNORE INTO descriptions (hash, codec, dictionary_id, size, data) VALUES (?, ?, ?, ?, ?)",
+                    description,
+                )
+            cluster_id = duplicates.add(job_id, signature)
+            self.write(
+                """
+                INSERT OR IGNORE INTO jobs 
+                (job_id, title, company, location, date_posted, points, matched_keywords, full_description, description_hash, job_link, score_hash, cluster_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    job_id,
+                    title,
+                    company,
+                    location,
+                    to_timestamp(date_posted),
+                    points,
+                    matched_keywords,
+                    full_description if description is None else None,
+                    description[0] if description is not None else None,
+                    job_link,
+                    score_hash,
+                    cluster_id,
+                ),
+            )
+            if description is not None and self.search_index:
+                # The index triggers only index plain text. The row ID is looked up in SQL,
+                # since the insert above may still be buffered
+                self.write(
+                    """
+                    INSERT INTO jobs_fts (rowid, title, company, full_description)
+                    SELECT rowid, title, company, ? FROM jobs WHERE job_id = ?
+                """,
+                    (full_description, job_id),
+                )
+            if signature is not None:
+                self.write(
+                    "INSERT OR REPLACE INTO job_signatures (job_id, signature) VALUES (?, ?)",
+                    (job_id, pack_signature(signature)),
+                )
+        return cluster_id
+
+    def duplicate_index(self):
+        """
+        Returns the near-duplicate index of the stored jobs, loading it on first use.
+        Jobs stored before clustering existed are signed and clustered in insertion order
+        while loading.
+
+        Returns:
+            DuplicateIndex: Index shared by every `add_job` call of this cache.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
+        with self.lock:
+            if self.duplicates is not None:
+                return self.duplicates
+            duplicates = DuplicateIndex()
+            for job_id, signature, cluster_id in self.query_jobs(
+                """
+                SELECT jobs.job_id, job_signatures.signature, jobs.cluster_id
+                FROM jobs LEFT JOIN job_signatures USING (job_id)
+                WHERE jobs.cluster_id IS NOT NULL
+                ORDER BY jobs.rowid
             """
-            INSERT OR IGNORE INTO jobs 
-            (job_id, title, company, location, date_posted, points, matched_keywords, full_description, job_link)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                job_id,
-                title,
-                company,
-                location,
-                date_posted,
-                points,
-                matched_keywords,
-                full_description,
-                job_link,
-            ),
-        )
-        self.connection.commit()
+            ):
+                duplicates.add(job_id, unpack_signature(signature) if signature else None, cluster_id)
+
+            unclustered = self.query_jobs("SELECT COUNT(*) FROM jobs WHERE cluster_id IS NULL")[0][0]
+            if unclustered:
+                print(f"{Colors.OKCYAN}Clustering {unclustered} stored jobs by description...{Colors.ENDC}")
+            last_rowid = 0
+            with self.batch(flush_rows=1000, flush_seconds=60):
+                # Descriptions are read in chunks so large databases are not loaded at once
+                while unclustered:
+                    rows = self.query_jobs(
+                        """
+                        SELECT jobs.rowid, jobs.job_id, job_descriptions.full_description
+                        FROM jobs JOIN job_descriptions ON job_descriptions.job_rowid = jobs.rowid
+                        WHERE jobs.cluster_id IS NULL AND jobs.rowid > ? ORDER BY jobs.rowid LIMIT 500
+                    """,
+                        (last_rowid,),
+                    )
+                    if not rows:
+                        break
+                    for last_rowid, job_id, full_description in rows:
+                        signature = minhash(full_description)
+                        cluster_id = duplicates.add(job_id, signature)
+                        self.write("UPDATE jobs SET cluster_id = ? WHERE job_id = ?", (cluster_id, job_id))
+                        if signature is not None:
+                            self.write(
+                                "INSERT OR REPLACE INTO job_signatures (job_id, signature) VALUES (?, ?)",
+                                (job_id, pack_signature(signature)),
+                            )
+            self.duplicates = duplicates
+            return duplicates
 
     def update_job_as_applied(self, job_id):
         """
@@ -109,31 +347,162 @@ class JobCache:
         Args:
             job_id (str): Unique identifier for the job.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
+        self.write(
             """
             UPDATE jobs SET applied = 1, date_applied = ? WHERE job_id = ?
         """,
             (datetime.date.today().isoformat(), job_id),
         )
-        self.connection.commit()
 
-    def query_jobs(self, query):
+    def mark_seen(self, job_id, outcome):
+        """
+        Records the outcome of scanning a job.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+            outcome (str): One of "saved", "irrelevant", "blacklisted", or "failed".
+        """
+        self.write(
+            """
+            INSERT OR REPLACE INTO seen_jobs (job_id, outcome, seen_at) VALUES (?, ?, ?)
+        """,
+            (job_id, outcome, to_timestamp(datetime.datetime.now())),
+        )
+
+    def seen_job_ids(self, job_ids, retry_failed=True):
+        """
+        Returns which of the given jobs have already been scanned, using a single query.
+
+        Args:
+            job_ids (list): Job IDs to check, typically the cards of one results page.
+            retry_failed (bool): If True, jobs whose last scan failed are not reported as
+                seen so they are tried again.
+
+        Returns:
+            set: The subset of `job_ids` that should be skipped.
+        """
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return set()
+
+        placeholders = ", ".join("?" for _ in job_ids)
+        outcome_filter = "AND outcome != 'failed'" if retry_failed else ""
+        with self.lock, self.metrics.span("db.seen_job_ids"):
+            self.flush()
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"""
+                SELECT job_id FROM jobs WHERE job_id IN ({placeholders})
+                UNION
+                SELECT job_id FROM seen_jobs WHERE job_id IN ({placeholders}) {outcome_filter}
+            """,
+                job_ids + job_ids,
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def record_search_run(self, search_url, name, scanned, new_jobs, saved, new_run=True):
+        """
+        Adds the counters of one scan of a search to its running totals.
+
+        Args:
+            search_url (str): Search URL the counters belong to.
+            name (str): Name of the search profile.
+            scanned (int): Job cards processed.
+            new_jobs (int): Cards that had not been seen before.
+            saved (int): Relevant jobs saved.
+            new_run (bool): If False, the counters belong to a run that was already
+                recorded (e.g. another worker of the same scan).
+        """
+        self.write(
+            """
+            INSERT INTO search_stats (search_url, name, runs, scanned, new_jobs, saved, last_run_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (search_url) DO UPDATE SET
+                name = excluded.name,
+                runs = runs + excluded.runs,
+                scanned = scanned + excluded.scanned,
+                new_jobs = new_jobs + excluded.new_jobs,
+                saved = saved + excluded.saved,
+                last_run_at = excluded.last_run_at
+        """,
+            (
+                search_url,
+                name,
+                int(new_run),
+                scanned,
+                new_jobs,
+                saved,
+                to_timestamp(datetime.datetime.now()),
+            ),
+        )
+
+    def search_stats(self):
+        """
+        Returns the accumulated counters of every search scanned so far.
+
+        Returns:
+            dict: Search URL -> dictionary with `runs`, `scanned`, `new_jobs` and `saved`.
+        """
+        with self.lock:
+            self.flush()
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT search_url, runs, scanned, new_jobs, saved FROM search_stats")
+            return {
+                row[0]: {"runs": row[1], "scanned": row[2], "new_jobs": row[3], "saved": row[4]}
+                for row in cursor.fetchall()
+            }
+
+    def advance_scan_cursor(self, search_url, newest_job_id):
+        """
+        Raises the high-water mark of a search to `newest_job_id`; a lower value is ignored.
+
+        Args:
+            search_url (str): Search URL the mark belongs to.
+            newest_job_id (int): Newest job ID found by a complete scan of the search.
+        """
+        self.write(
+            """
+            INSERT INTO scan_cursors (search_url, newest_job_id, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (search_url) DO UPDATE SET
+                newest_job_id = MAX(newest_job_id, excluded.newest_job_id),
+                updated_at = excluded.updated_at
+        """,
+            (search_url, int(newest_job_id), to_timestamp(datetime.datetime.now())),
+        )
+
+    def scan_cursors(self):
+        """
+        Returns the high-water mark of every search scanned incrementally.
+
+        Returns:
+            dict: Search URL -> newest job ID (int).
+        """
+        with self.lock:
+            self.flush()
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT search_url, newest_job_id FROM scan_cursors")
+            return dict(cursor.fetchall())
+
+    def query_jobs(self, query, params=()):
         """
         Executes a custom SQL query on the `jobs` table.
 
         Args:
             query (str): The SQL query to execute.
+            params (tuple): Parameters for the query.
 
         Returns:
             list: Results of the query as a list of tuples.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor.fetchall()
+        with self.lock, self.metrics.span("db.query"):
+            self.flush()
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchall()
 
     def close(self):
         """
-        Closes the database connection.
+        Flushes buffered writes and closes the database connection.
         """
+        self.flush()
         self.connection.close()
@@ -0,0 +1,172 @@
+import datetime
+import json
+from automate_linkedin.migrations import to_timestamp
+from automate_linkedin.utils import Colors
+
+"""
+Scan Checkpoints
+================
+
+Records the progress of a scan in `job_cache.db` as it goes, so a scan interrupted by a
+browser crash, a network error or Ctrl-C can be continued with `--resume`:
+
+- `scan_jobs` holds the outcome of every processed card (saved, irrelevant, blacklisted,
+  skipped, duplicate or failed) with the details shown in the scan summary.
+- `scan_pages` holds the result pages that were finished.
+
+A resumed scan restores the counters and outcome lists of its ScanState from these rows,
+skips the finished pages without loading them, and skips the cards it already processed
+on the page it was interrupted on. The rows are written through `JobCache.write`, so they
+are committed together with the jobs they describe, and they are deleted once the scan
+finishes.
+"""
+
+
+class ScanCheckpoint:
+    """
+    Progress of one scan, stored in the `scans`, `scan_pages` and `scan_jobs` tables.
+    """
+
+    def __init__(self, cache, scan_id):
+        """
+        :param cache: Database instance holding the checkpoint tables.
+        :param scan_id: ID of the scan in the `scans` table.
+        """
+        self.cache = cache
+        self.scan_id = scan_id
+        self.resumed = False
+        self.done_pages = set()
+
+    @classmethod
+    def start(cls, cache):
+        """
+        Starts a new scan. Earlier scans that never finished can no longer be resumed.
+        :param cache: Database instance.
+        :return: ScanCheckpoint of the new scan.
+        """
+        now = to_timestamp(datetime.datetime.now())
+        with cache.lock:
+            cls.abandon_unfinished(cache)
+            cache.write(
+                "INSERT INTO scans (status, started_at, updated_at) VALUES ('running', ?, ?)",
+                (now, now),
+            )
+            scan_id = cache.query_jobs("SELECT MAX(scan_id) FROM scans")[0][0]
+        return cls(cache, scan_id)
+
+    @classmethod
+    def resume(cls, cache):
+        """
+        :param cache: Database instance.
+        :return: ScanCheckpoint of the most recent unfinished scan, or None if there is none.
+        """
+        rows = cache.query_jobs(
+            "SELECT scan_id FROM scans WHERE status = 'running' ORDER BY scan_id DESC LIMIT 1"
+        )
+        if not rows:
+            return None
+        checkpoint = cls(cache, rows[0][0])
+        checkpoint.resumed = True
+        checkpoint.done_pages = {
+            (search_url, page)
+            for search_url, page in cache.query_jobs(
+                "SELECT search_url, page FROM scan_pages WHERE scan_id = ?", (checkpoint.scan_id,)
+            )
+        }
+        return checkpoint
+
+    @staticmethod
+    def abandon_unfinished(cache):
+        """
+        Marks unfinished scans as abandoned and deletes their progress rows.
+        :param cache: Database instance.
+        """
+        with cache.lock:
+            for table in ("scan_jobs", "scan_pages"):
+                cache.write(
+                    f"DELETE FROM {table} WHERE scan_id IN (SELECT scan_id FROM scans WHERE status = 'running')"
+                )
+            cache.write("UPDATE scans SET status = 'abandoned' WHERE status = 'running'")
+
+    def restore(self, state):
+        """
+        Loads the counters and outcome lists recorded so far into a ScanState.
+        :param state: ScanState of the resumed scan.
+        """
+        rows = self.cache.query_jobs(
+            "SELECT search_url, job_id, outcome, details FROM scan_jobs WHERE scan_id = ? ORDER BY rowid",
+            (self.scan_id,),
+        )
+        for search_url, job_id, outcome, details in rows:
+            state.restored_jobs.add((search_url, job_id))
+            state.seen_jobs.claim(job_id)
+            state.total_scans += 1
+            if outcome == "saved":
+                state.jobs_scanned += 1
+            elif outcome in state.OUTCOME_LISTS:
+                getattr(state, state.OUTCOME_LISTS[outcome]).append(
+                    json.loads(details) if details else job_id
+                )
+        print(
+            f"{Colors.OKCYAN}Resuming scan {self.scan_id}: {len(rows)} jobs and "
+            f"{len(self.done_pages)} pages already processed, {state.jobs_scanned} saved{Colors.ENDC}"
+        )
+
+    def page_done(self, search_url, page):
+        """
+        :return: True if the page of the search was finished before the scan was interrupted.
+        """
+        return (search_url, page) in self.done_pages
+
+    def record_job(self, search_url, page, job_id, outcome, details=None):
+        """
+        Records the outcome of one card.
+        :param search_url: Search URL the card was found with.
+        :param page: Zero-based result page of the card.
+        :param job_id: Job ID of the card.
+        :param outcome: One of "saved", "irrelevant", "blacklisted", "skipped", "duplicate" or "failed".
+        :param details: Optional dictionary kept in the outcome list (title, company, ...).
+        """
+        self.cache.write(
+            """
+            INSERT OR REPLACE INTO scan_jobs (scan_id, search_url, job_id, page, outcome, details)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (
+                self.scan_id,
+                search_url,
+                job_id,
+                page,
+                outcome,
+                json.dumps(details, default=to_timestamp) if details is not None else None,
+            ),
+        )
+
+    def complete_page(self, search_url, page):
+        """
+        Records that every card of a result page was processed.
+        :param search_url: Search URL of the page.
+        :param page: Zero-based page number.
+        """
+        self.done_pages.add((search_url, page))
+        self.cache.write(
+            "INSERT OR IGNORE INTO scan_pages (scan_id, search_url, page) VALUES (?, ?, ?)",
+            (self.scan_id, search_url, page),
+        )
+        self.cache.write(
+            "UPDATE scans SET updated_at = ? WHERE scan_id = ?",
+            (to_timestamp(datetime.datetime.now()), self.scan_id),
+        )
+
+    def finish(self):
+        """
+        Marks the scan as finished and deletes its progress rows, which are only needed
+        to resume it.
+        """
+        with self.cache.lock:
+            self.cache.write("DELETE FROM scan_jobs WHERE scan_id = ?", (self.scan_id,))
+            self.cache.write("DELETE FROM scan_pages WHERE scan_id = ?", (self.scan_id,))
+            self.cache.write(
+                "UPDATE scans SET status = 'finished', updated_at = ? WHERE scan_id = ?",
+                (to_timestamp(datetime.datetime.now()), self.scan_id),
+            )
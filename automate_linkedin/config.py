@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+from automate_linkedin.utils import Colors
+
+"""
+Configuration Loading
+=====================
+
+Loads the YAML files in `configs/` into plain dictionaries. The first load after a file
+changes parses and validates that file and stores it in a JSON snapshot; later runs read
+each config from the snapshot as long as the modification time and size of its YAML file
+are unchanged. This keeps the YAML parser out of the startup path of every invocation.
+"""
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs")
+CONFIG_NAMES = ("job_filters", "credentials", "xpaths", "resume", "scan")
+SNAPSHOT_FILE = ".snapshot.json"
+# Bump when REQUIRED_KEYS change, so snapshots of configs validated against older keys are rebuilt
+SNAPSHOT_VERSION = 2
+
+# Keys every config file must define; nested keys are written as "section.key"
+REQUIRED_KEYS = {
+    "job_filters": (
+        "keywords",
+        "max_jobs",
+        "description.positive",
+        "description.negative",
+        "description.best",
+    ),
+    "credentials": ("email", "password"),
+    "xpaths": (
+        "login.username",
+        "login.password",
+        "login.submit",
+        "login.logged_in",
+        "job_search.total_jobs",
+        "job_search.job_card",
+        "job_search.job_card_by_id",
+        "job_search.card_title",
+        "job_search.card_company",
+        "job_search.job_title",
+        "job_search.company",
+        "job_search.primary_description",
+        "job_search.show_more_button",
+        "job_search.full_description",
+        "job_search.static_description",
+    ),
+    "resume": ("resumes",),
+    "scan": (),
+}
+
+
+class ConfigError(ValueError):
+    """
+    Raised when a configuration file is missing, unreadable, or lacks required keys.
+    """
+
+
+def source_stamps(config_dir, names):
+    """
+    :param config_dir: Directory containing the YAML files.
+    :param names: Config names (file names without `.yaml`).
+    :return: Dictionary of name -> [modification time in ns, size] for every file.
+    """
+    stamps = {}
+    for name in names:
+        path = os.path.join(config_dir, f"{name}.yaml")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise ConfigError(f"Missing configuration file: {path}")
+        stamps[name] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+
+def validate(name, config):
+    """
+    Checks that a parsed config defines the keys the scanner relies on.
+    :param name: Config name, e.g. "job_filters".
+    :param config: Parsed YAML content.
+    :raises ConfigError: If the file is not a mapping or a required key is missing.
+    """
+    if not isinstance(config, dict):
+        raise ConfigError(f"{name}.yaml must contain a mapping of settings")
+    for key in REQUIRED_KEYS.get(name, ()):
+        value = config
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                raise ConfigError(f"{name}.yaml is missing the required key `{key}`")
+            value = value[part]
+    if name == "job_filters" and not isinstance(config["max_jobs"], int):
+        raise ConfigError("job_filters.yaml: `max_jobs` must be an integer")
+    if name == "job_filters" and not all(
+        isinstance(search, dict) for search in config.get("searches") or []
+    ):
+        raise ConfigError("job_filters.yaml: every entry of `searches` must be a mapping of filters")
+    if name == "job_filters" and not isinstance(config.get("sub_locations") or {}, dict):
+        raise ConfigError("job_filters.yaml: `sub_locations` must map a location to a list of locations")
+
+
+def parse_configs(config_dir, names):
+    """
+    Parses and validates the YAML files.
+    :param config_dir: Directory containing the YAML files.
+    :param names: Config names to load.
+    :return: Dictionary of name -> parsed config.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    configs = {}
+    for name in names:
+        path = os.path.join(config_dir, f"{name}.yaml")
+        try:
+            with open(path, encoding="utf-8") as f:
+                configs[name] = yaml.load(f, Loader=loader) or {}
+        except yaml.YAMLError as e:
+            raise ConfigError(f"Could not parse {path}: {e}")
+        validate(name, configs[name])
+    return configs
+
+
+def write_snapshot(path, stamps, configs):
+    """
+    Writes the snapshot atomically. It contains the credentials, so it is only readable
+    by the current user. Failures (e.g. a read-only install) only disable the snapshot.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sources": stamps, "configs": configs}, f)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"{Colors.WARNING}Could not write the config snapshot: {e}{Colors.ENDC}")
+        os.remove(tmp_path)
+
+
+def load_configs(names=CONFIG_NAMES, config_dir=CONFIG_DIR, use_snapshot=True):
+    """
+    Loads the configuration files, from the snapshot when it is up to date.
+    :param names: Config names to load.
+    :param config_dir: Directory containing the YAML files.
+    :param use_snapshot: If False, always parse the YAML files.
+    :return: Dictionary of name -> config dictionary.
+    :raises ConfigError: If a file is missing, invalid, or lacks a required key.
+    """
+    names = tuple(names)
+    stamps = source_stamps(config_dir, names)
+    if not use_snapshot:
+        return parse_configs(config_dir, names)
+
+    snapshot_path = os.path.join(config_dir, SNAPSHOT_FILE)
+    sources, cached = {}, {}
+    try:
+        with open(snapshot_path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") == SNAPSHOT_VERSION:
+            sources, cached = snapshot["sources"], snapshot["configs"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Only the files that changed since the snapshot was written are parsed again
+    stale = [name for name in names if sources.get(name) != stamps[name] or name not in cached]
+    if stale:
+        cached.update(parse_configs(config_dir, stale))
+        sources.update({name: stamps[name] for name in stale})
+        write_snapshot(snapshot_path, sources, cached)
+    return {name: cached[name] for name in names}
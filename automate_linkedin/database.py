@@ -1,7 +1,13 @@
+import argparse
 import sqlite3
 import datetime
 import csv
+import json
 import os
+import tempfile
+from contextlib import contextmanager
+from automate_linkedin.descriptions import CODECS, DICTIONARY_SAMPLE_SIZE, DescriptionCodec, train_dictionary
+from automate_linkedin.migrations import TIMESTAMP_FORMAT, create_search_index, migrate, to_timestamp
 
 
 class Colors:
@@ -15,9 +21,86 @@ class Colors:
     BOLD = '\033[1m'
 
 
+DEFAULT_EXPORT_COLUMNS = ["title", "company", "location", "date_posted", "applied", "job_link"]
+EXPORT_CHUNK_SIZE = 1000
+# Description of a job in `jobs`, whether stored as plain text or compressed
+DESCRIPTION_TEXT = (
+    "COALESCE(jobs.full_description, (SELECT description_text(codec, dictionary_id, data) "
+    "FROM descriptions WHERE hash = jobs.description_hash))"
+)
+# Exported columns that are computed instead of read as stored: (declared type, SQL expression)
+COMPUTED_EXPORT_COLUMNS = {
+    "full_description": ("TEXT", f"{DESCRIPTION_TEXT} AS full_description"),
+}
+
+# bm25 weights of the indexed columns: a match in the title counts most
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+SEARCH_COLUMNS = ["job_id", "title", "company", "points", "applied", "job_link"]
+
+
+def write_csv(path, headers, types, chunks):
+    with open(path, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)  # Write header row
+        for rows in chunks:
+            writer.writerows(rows)
+
+
+def write_jsonl(path, headers, types, chunks):
+    with open(path, mode='w', encoding='utf-8') as file:
+        for rows in chunks:
+            for row in rows:
+                file.write(json.dumps(dict(zip(headers, row)), ensure_ascii=False) + "\n")
+
+
+def write_parquet(path, headers, types, chunks):
+    # pyarrow is only needed for Parquet exports, so it is imported on demand
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from e
+
+    # Use the declared SQLite types so every chunk has the same schema
+    schema = pa.schema([
+        (header, pa.int64() if declared.upper() in ("INTEGER", "BOOLEAN") else pa.string())
+        for header, declared in zip(headers, types)
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in chunks:
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema,
+            ))
+
+
+EXPORT_WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "parquet": write_parquet}
+
+
+@contextmanager
+def updated_at_paused(cursor):
+    """
+    Suspends the trigger that sets `jobs.updated_at` while rows are rewritten without
+    changing what they say (e.g. moving descriptions between plain text and compressed),
+    so incremental exports do not pick them up again.
+    """
+    trigger = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'jobs_set_updated_at_update'"
+    ).fetchall()
+    cursor.execute("DROP TRIGGER IF EXISTS jobs_set_updated_at_update")
+    # On errors the caller's rollback restores the trigger
+    yield
+    if trigger:
+        cursor.execute(trigger[0][0])
+
+
 class JobViewer:
     def __init__(self, db_path="job_cache.db"):
         self.connection = sqlite3.connect(db_path)
+        self.descriptions = DescriptionCodec(self.connection)
+        self.descriptions.register()
+        migrate(self.connection)
 
     def query_jobs(self, query):
         """
@@ -27,6 +110,14 @@ class JobViewer:
         cursor.execute(query)
         return cursor.fetchall()
 
+    def query_jobs_params(self, query, params=()):
+        """
+        Run a parameterized query on the jobs database.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
     def update_job_score(self, job_id, increment):
         """
         Increment the score of a job by a specified amount.
@@ -35,31 +126,422 @@ class JobViewer:
         cursor.execute("UPDATE jobs SET points = points + ? WHERE job_id = ?", (increment, job_id))
         self.connection.commit()
 
+    def boost_expiring_jobs(self, days=25, increment=5):
+        """
+        Increase the score of pending jobs posted more than `days` days ago, once per job.
+
+        Expiring jobs are found and boosted with one UPDATE inside a single transaction;
+        which index to use is left to the query planner. The boost is recorded
+        in `boosted_at`, so running the analysis again does not raise the same job's score
+        a second time.
+        Returns the newly boosted jobs (with their scores before the boost).
+        """
+        # A job is expiring once at least `days + 1` whole days have passed since posting
+        cutoff = (datetime.datetime.now() - datetime.timedelta(days=days + 1)).strftime(TIMESTAMP_FORMAT)
+        expiring = """
+            applied = 0 AND boosted_at IS NULL
+            AND date_posted IS NOT NULL AND date_posted <= ?
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                f"""
+                SELECT job_id, title, company, date_posted, points
+                FROM jobs WHERE {expiring}
+                ORDER BY points DESC
+                """,
+                (cutoff,),
+            )
+            rows = cursor.fetchall()
+            cursor.execute(
+                f"""
+                UPDATE jobs
+                SET points = points + ?, boosted_at = ?
+                WHERE {expiring}
+                """,
+                (increment, to_timestamp(datetime.datetime.now()), cutoff),
+            )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+        return [
+            {"job_id": job_id, "title": title, "company": company, "date_posted": date_posted, "points": points}
+            for job_id, title, company, date_posted, points in rows
+        ]
+
+    def has_search_index(self):
+        """
+        Check whether the `jobs_fts` full-text index exists.
+        """
+        return bool(self.query_jobs("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"))
+
+    def rebuild_search_index(self):
+        """
+        Create the full-text index if it is missing and rebuild it from the stored jobs.
+        Run it on databases created by a SQLite build without FTS5, after rows were
+        changed with the triggers disabled, or after other SQLite clients changed or
+        deleted jobs with compressed descriptions, which the triggers cannot index.
+        Returns the number of indexed jobs.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            create_search_index(cursor)
+            cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return self.query_jobs("SELECT COUNT(*) FROM jobs")[0][0]
+
+    def description_stats(self):
+        """
+        Size of the stored descriptions. Returns a dictionary with the number of `jobs`,
+        of those whose description is `plain` text or `compressed`, of distinct
+        `descriptions` among the compressed ones, and in bytes the `text` of all jobs'
+        descriptions, the `unique_text` of the distinct compressed ones, and what is
+        `stored` (plain text plus compressed data).
+        """
+        jobs, plain, plain_text, compressed, compressed_text = self.query_jobs(
+            """
+            SELECT COUNT(*), COUNT(jobs.full_description),
+                   COALESCE(SUM(length(CAST(jobs.full_description AS BLOB))), 0),
+                   COUNT(descriptions.hash), COALESCE(SUM(descriptions.size), 0)
+            FROM jobs LEFT JOIN descriptions ON descriptions.hash = jobs.description_hash
+            """
+        )[0]
+        descriptions, unique_text, stored = self.query_jobs(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(length(data)), 0) FROM descriptions"
+        )[0]
+        return {
+            "jobs": jobs,
+            "plain": plain,
+            "compressed": compressed,
+            "descriptions": descriptions,
+            "text": plain_text + compressed_text,
+            "unique_text": unique_text,
+            "stored": plain_text + stored,
+        }
+
+    def print_description_stats(self):
+        stats = self.description_stats()
+        print(
+            f"Descriptions: {Colors.OKBLUE}{stats['plain']}{Colors.ENDC} plain text, "
+            f"{Colors.OKBLUE}{stats['compressed']}{Colors.ENDC} compressed ({stats['descriptions']} distinct), "
+            f"{stats['stored'] / 2**20:.1f} MiB stored for {stats['text'] / 2**20:.1f} MiB of text "
+            f"({stats['text'] / max(stats['stored'], 1):.1f}x)"
+        )
+
+    def compress_descriptions(self, codec="zlib", train=False, chunk_size=500):
+        """
+        Compress every description with `codec` and its newest dictionary: plain-text
+        descriptions move from `jobs.full_description` into `descriptions`, once per
+        distinct text, and the stored ones are recompressed. With `train`, a new
+        dictionary is first built from a sample of the descriptions (see
+        `descriptions.train_dictionary`); dictionaries no longer used by any description
+        are deleted. Afterwards only clients with the `description_text` function (see
+        `descriptions.py`) can read the moved descriptions; `decompress_descriptions`
+        reverts it. Run `vacuum` afterwards to shrink the file.
+        Returns the `description_stats` after compression.
+        """
+        compressor = DescriptionCodec(self.connection, codec)
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if train:
+                # Sample row IDs first, so only the sampled descriptions are decompressed
+                samples = [
+                    text for (text,) in cursor.execute(
+                        """
+                        SELECT DISTINCT full_description FROM job_descriptions
+                        WHERE full_description IS NOT NULL AND job_rowid IN (
+                            SELECT rowid FROM jobs ORDER BY random() LIMIT ?
+                        )
+                        """,
+                        (DICTIONARY_SAMPLE_SIZE,),
+                    ).fetchall()
+                ]
+                compressor.add_dictionary(train_dictionary(codec, samples))
+            last_rowid = 0
+            while True:
+                rows = cursor.execute(
+                    """
+                    SELECT rowid, description_text(codec, dictionary_id, data) FROM descriptions
+                    WHERE rowid > ? ORDER BY rowid LIMIT ?
+                    """,
+                    (last_rowid, chunk_size),
+                ).fetchall()
+                if not rows:
+                    break
+                updates = []
+                for last_rowid, text in rows:
+                    _, new_codec, dictionary_id, _, data = compressor.compress(text)
+                    updates.append((new_codec, dictionary_id, data, last_rowid))
+                cursor.executemany(
+                    "UPDATE descriptions SET codec = ?, dictionary_id = ?, data = ? WHERE rowid = ?", updates
+                )
+            with updated_at_paused(cursor):
+                last_rowid = 0
+                while True:
+                    rows = cursor.execute(
+                        """
+                        SELECT rowid, full_description FROM jobs
+                        WHERE rowid > ? AND full_description IS NOT NULL ORDER BY rowid LIMIT ?
+                        """,
+                        (last_rowid, chunk_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    updates = []
+                    for last_rowid, text in rows:
+                        row = compressor.compress(text)
+                        cursor.execute(
+                            "INSERT OR IGNORE INTO descriptions (hash, codec, dictionary_id, size, data) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            row,
+                        )
+                        updates.append((row[0], last_rowid))
+                    cursor.executemany(
+                        "UPDATE jobs SET description_hash = ?, full_description = NULL WHERE rowid = ?", updates
+                    )
+            cursor.execute(
+                """
+                DELETE FROM description_dictionaries WHERE id NOT IN (
+                    SELECT DISTINCT dictionary_id FROM descriptions WHERE dictionary_id IS NOT NULL
+                )
+                """
+            )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        self.descriptions.load_dictionaries()
+        return self.description_stats()
+
+    def decompress_descriptions(self):
+        """
+        Store every description as plain text in `jobs.full_description` again, so any
+        SQLite client can read it, and empty `descriptions` and its dictionaries. New
+        descriptions are still compressed if `scan.yaml` sets a `description_codec`.
+        Returns the `description_stats` afterwards.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            with updated_at_paused(cursor):
+                cursor.execute(
+                    """
+                    UPDATE jobs SET
+                        full_description = (
+                            SELECT description_text(codec, dictionary_id, data) FROM descriptions
+                            WHERE hash = jobs.description_hash
+                        ),
+                        description_hash = NULL
+                    WHERE description_hash IS NOT NULL
+                    """
+                )
+            cursor.execute("DELETE FROM descriptions")
+            cursor.execute("DELETE FROM description_dictionaries")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        self.descriptions.load_dictionaries()
+        return self.description_stats()
+
+    def vacuum(self):
+        """
+        Rebuild the database file, returning the space freed by deleted rows or by
+        `compress_descriptions` to the file system. Returns the file size in bytes before
+        and after.
+        """
+        def size():
+            return self.query_jobs("PRAGMA page_count")[0][0] * self.query_jobs("PRAGMA page_size")[0][0]
+
+        before = size()
+        self.connection.execute("VACUUM")
+        return before, size()
+
+    def search(self, query, where=None, params=(), limit=20, highlight=("[", "]")):
+        """
+        Full-text search over the title, company and description of the stored jobs.
+
+        `query` uses the FTS5 query syntax: words are combined with AND by default, and
+        `"Isaac Sim"` matches a phrase, `OR` / `NOT` and `ros*` prefixes are supported.
+        Results are ranked by bm25 with title matches weighted highest, and each comes
+        with a snippet of the description around the matches, wrapped in `highlight`.
+        `where` is an optional SQL filter on `jobs`, e.g. "applied = 0".
+        Without the FTS5 index every word is matched with LIKE instead, unranked.
+        Returns a list of dictionaries with the SEARCH_COLUMNS and `snippet`.
+        """
+        if self.has_search_index():
+            # Snippets decompress the description, so they are only made for the results
+            # that are returned, not for every match
+            conditions = f"AND rowid IN (SELECT rowid FROM jobs WHERE {where})" if where else ""
+            rows = self.query_jobs_params(
+                f"""
+                WITH hits AS (
+                    SELECT rowid, bm25(jobs_fts, {", ".join(map(str, SEARCH_WEIGHTS))}) AS rank
+                    FROM jobs_fts WHERE jobs_fts MATCH ? {conditions}
+                    ORDER BY rank LIMIT ?
+                )
+                SELECT {", ".join(f"jobs.{column}" for column in SEARCH_COLUMNS)},
+                       snippet(jobs_fts, 2, ?, ?, ' ... ', 16)
+                FROM hits
+                JOIN jobs_fts ON jobs_fts.rowid = hits.rowid
+                JOIN jobs ON jobs.rowid = hits.rowid
+                WHERE jobs_fts MATCH ?
+                ORDER BY hits.rank
+                """,
+                (query, *params, limit, *highlight, query),
+            )
+        else:
+            print(f"{Colors.WARNING}No full-text index; searching with LIKE. "
+                  f"Run with --rebuild-search-index to create it.{Colors.ENDC}")
+            words = [word.strip('"') for word in query.split() if word not in ("AND", "OR", "NOT")]
+            text = f"(title || ' ' || company || ' ' || COALESCE({DESCRIPTION_TEXT}, ''))"
+            like = " AND ".join([f"{text} LIKE ?"] * len(words))
+            rows = self.query_jobs_params(
+                f"""
+                SELECT {", ".join(SEARCH_COLUMNS)}, NULL FROM jobs
+                WHERE {like or "1"} {f"AND ({where})" if where else ""}
+                ORDER BY points DESC LIMIT ?
+                """,
+                (*[f"%{word}%" for word in words], *params, limit),
+            )
+        return [dict(zip(SEARCH_COLUMNS + ["snippet"], row)) for row in rows]
+
+    def print_search_results(self, query, where=None, limit=20):
+        """
+        Print the ranked results of a full-text search with their snippets.
+        """
+        try:
+            results = self.search(query, where=where, limit=limit, highlight=(Colors.BOLD, Colors.ENDC))
+        except sqlite3.OperationalError as e:
+            print(f"{Colors.FAIL}Invalid search: {e}{Colors.ENDC}")
+            return []
+        print(f"{Colors.HEADER}{len(results)} jobs matching {query!r}:{Colors.ENDC}")
+        for job in results:
+            status = "applied" if job["applied"] else "pending"
+            print(f"{Colors.OKBLUE}{job['title']} | {job['company']} | {job['points']} points | {status}{Colors.ENDC}")
+            if job["snippet"]:
+                print(f"  {job['snippet']}")
+            print(f"  {Colors.OKCYAN}{job['job_link']}{Colors.ENDC}")
+        return results
+
     def export_to_csv(self, output_file="jobs.csv"):
         """
-        Export selected job details to a CSV file, deleting any existing file first.
+        Export selected job details to a CSV file, replacing any existing file.
         """
+        self.export(
+            output_file,
+            columns=DEFAULT_EXPORT_COLUMNS,
+            headers=["Title", "Company", "Location", "Date Posted", "Applied", "Link"],
+        )
+
+    def export(
+        self,
+        output_file,
+        fmt=None,
+        columns=None,
+        where=None,
+        params=(),
+        since_last_export=False,
+        headers=None,
+        chunk_size=EXPORT_CHUNK_SIZE,
+    ):
+        """
+        Stream jobs to a CSV, JSONL, or Parquet file without loading the whole table.
+
+        Rows are read with `fetchmany` in chunks of `chunk_size` and written as they
+        arrive. The output is written to a temporary file next to `output_file` and
+        renamed over it only once complete, so an existing export is never left half
+        written. With `since_last_export`, only rows changed since the previous export to
+        the same file are written. Returns the number of rows exported.
+        """
+        fmt = (fmt or os.path.splitext(output_file)[1].lstrip(".") or "csv").lower()
+        if fmt not in EXPORT_WRITERS:
+            print(f"{Colors.FAIL}Unsupported export format: {fmt}{Colors.ENDC}")
+            return 0
+
         try:
-            # Delete the existing file if it exists
-            if os.path.exists(output_file):
-                os.remove(output_file)
+            declared_types = {row[1]: row[2] for row in self.query_jobs("PRAGMA table_info(jobs)")}
+            declared_types.update({column: declared for column, (declared, _) in COMPUTED_EXPORT_COLUMNS.items()})
+            available = list(declared_types)
+            columns = list(columns or available)
+            unknown = [column for column in columns if column not in available]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
 
-            # Query the database for selected fields
-            jobs = self.query_jobs("SELECT title, company, location, date_posted, applied, job_link FROM jobs")
+            target = os.path.abspath(output_file)
+            conditions, query_params = [], list(params)
+            if where:
+                conditions.append(f"({where})")
+            if since_last_export:
+                last = self.query_jobs_params(
+                    "SELECT last_updated_at FROM exports WHERE target = ?", (target,)
+                )
+                if last and last[0][0]:
+                    conditions.append("updated_at > ?")
+                    query_params.append(last[0][0])
 
-            # Define column headers
-            headers = ["Title", "Company", "Location", "Date Posted", "Applied", "Link"]
+            # updated_at is selected last so the export mark can be advanced afterwards
+            selected = [
+                COMPUTED_EXPORT_COLUMNS[column][1] if column in COMPUTED_EXPORT_COLUMNS else column
+                for column in columns
+            ]
+            query = f"SELECT {', '.join(selected)}, updated_at FROM jobs"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY updated_at"
 
-            # Write to CSV
-            with open(output_file, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(headers)  # Write header row
-                writer.writerows(jobs)   # Write job rows
+            cursor = self.connection.cursor()
+            cursor.execute(query, query_params)
+            progress = {"rows": 0, "last_updated_at": None}
 
-            print(f"{Colors.OKGREEN}Database exported to {output_file}.{Colors.ENDC}")
+            def chunks():
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    progress["rows"] += len(rows)
+                    progress["last_updated_at"] = rows[-1][-1]
+                    yield [row[:-1] for row in rows]
+
+            directory = os.path.dirname(target)
+            handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".export-", suffix=f".{fmt}")
+            os.close(handle)
+            try:
+                EXPORT_WRITERS[fmt](
+                    temp_path,
+                    headers or columns,
+                    [declared_types[column] for column in columns],
+                    chunks(),
+                )
+                os.replace(temp_path, target)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            if progress["last_updated_at"] is not None or not since_last_export:
+                self.connection.execute(
+                    """
+                    INSERT OR REPLACE INTO exports (target, last_updated_at, exported_at)
+                    VALUES (?, COALESCE(?, (SELECT MAX(updated_at) FROM jobs)), ?)
+                    """,
+                    (target, progress["last_updated_at"], to_timestamp(datetime.datetime.now())),
+                )
+                self.connection.commit()
+
+            print(f"{Colors.OKGREEN}Exported {progress['rows']} jobs to {output_file}.{Colors.ENDC}")
+            return progress["rows"]
 
         except Exception as e:
-            print(f"{Colors.FAIL}Error exporting database to CSV: {e}{Colors.ENDC}")
+            print(f"{Colors.FAIL}Error exporting database to {fmt.upper()}: {e}{Colors.ENDC}")
+            return 0
 
     def analyze_jobs(self):
         """
@@ -75,38 +557,10 @@ class JobViewer:
             print(f"Total Jobs: {Colors.OKBLUE}{total_jobs}{Colors.ENDC}")
             print(f"Applied Jobs: {Colors.OKCYAN}{applied_jobs}{Colors.ENDC}")
             print(f"Pending Jobs: {Colors.OKGREEN}{pending_jobs}{Colors.ENDC}")
+            self.print_description_stats()
 
-            # Detect high-ranking jobs close to their expiration
-            today = datetime.datetime.now()
-            expiring_jobs = []
-            pending_jobs_query = """
-                SELECT job_id, title, company, date_posted, points 
-                FROM jobs 
-                WHERE applied = 0 
-                ORDER BY points DESC
-            """
-            pending_jobs_list = self.query_jobs(pending_jobs_query)
-
-            for job_id, title, company, date_posted, points in pending_jobs_list:
-                if date_posted:
-                    try:
-                        # Parse datetime and calculate the difference in days
-                        posted_datetime = datetime.datetime.strptime(date_posted, "%Y-%m-%d %H:%M:%S.%f")
-                        days_since_posted = (today - posted_datetime).days
-
-                        # If a job is more than 25 days old, it's considered close to expiring
-                        if days_since_posted > 25:
-                            expiring_jobs.append({
-                                "job_id": job_id,
-                                "title": title,
-                                "company": company,
-                                "date_posted": date_posted,
-                                "points": points,
-                            })
-                            # Increase the score of the job for prioritization
-                            self.update_job_score(job_id, 5)
-                    except ValueError as e:
-                        print(f"{Colors.WARNING}Error parsing date for job {job_id}: {e}{Colors.ENDC}")
+            # Detect high-ranking jobs close to their expiration and boost their scores
+            expiring_jobs = self.boost_expiring_jobs(days=25, increment=5)
 
             if expiring_jobs:
                 print(f"\n{Colors.WARNING}High-ranking jobs close to expiration:{Colors.ENDC}")
@@ -115,7 +569,7 @@ class JobViewer:
                           f"Company: {job['company']}, Date Posted: {job['date_posted']}, "
                           f"Points: {job['points']} -> {job['points'] + 5}")
             else:
-                print(f"{Colors.OKCYAN}No high-ranking jobs close to expiration.{Colors.ENDC}")
+                print(f"{Colors.OKCYAN}No new high-ranking jobs close to expiration.{Colors.ENDC}")
 
         except Exception as e:
             print(f"{Colors.FAIL}Error analyzing jobs: {e}{Colors.ENDC}")
@@ -125,9 +579,88 @@ class JobViewer:
 
 
 def main():
-    viewer = JobViewer()
+    parser = argparse.ArgumentParser(description="Analyze and export the job database")
+    parser.add_argument("--db", default="job_cache.db", help="Path to the job database")
+    parser.add_argument("--export", metavar="FILE", help="Export jobs to FILE without prompting")
+    parser.add_argument(
+        "--format",
+        choices=sorted(EXPORT_WRITERS),
+        help="Export format (defaults to the file extension of --export)",
+    )
+    parser.add_argument("--columns", help="Comma-separated list of columns to export")
+    parser.add_argument("--where", help="SQL filter for exported rows, e.g. \"applied = 0 AND points > 2\"")
+    parser.add_argument(
+        "--since-last-export",
+        action="store_true",
+        help="Only export rows changed since the previous export to the same file",
+    )
+    parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        help="Full-text search of titles, companies and descriptions, e.g. 'ROS2 \"Isaac Sim\"' "
+        "(combine with --where to filter, e.g. \"applied = 0\")",
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of search results")
+    parser.add_argument(
+        "--rebuild-search-index",
+        action="store_true",
+        help="Create or rebuild the full-text index from the stored jobs",
+    )
+    parser.add_argument(
+        "--compress-descriptions",
+        metavar="CODEC",
+        choices=CODECS,
+        help="Compress the plain-text descriptions, and recompress the stored ones, with CODEC "
+        "(zlib, or zstd with zstandard installed)",
+    )
+    parser.add_argument(
+        "--decompress-descriptions",
+        action="store_true",
+        help="Store every description as plain text again, readable by any SQLite client",
+    )
+    parser.add_argument(
+        "--train-dictionary",
+        action="store_true",
+        help="With --compress-descriptions, train a dictionary on the stored descriptions first",
+    )
+    parser.add_argument("--vacuum", action="store_true", help="Shrink the database file after deleting or recompressing")
+    args = parser.parse_args()
+
+    viewer = JobViewer(args.db)
 
     try:
+        if args.compress_descriptions or args.decompress_descriptions or args.vacuum:
+            if args.compress_descriptions:
+                viewer.compress_descriptions(args.compress_descriptions, train=args.train_dictionary)
+                viewer.print_description_stats()
+            elif args.decompress_descriptions:
+                viewer.decompress_descriptions()
+                viewer.print_description_stats()
+            if args.vacuum:
+                before, after = viewer.vacuum()
+                print(f"{Colors.OKGREEN}Database file: {before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB{Colors.ENDC}")
+            return
+
+        if args.rebuild_search_index:
+            indexed = viewer.rebuild_search_index()
+            print(f"{Colors.OKGREEN}Indexed {indexed} jobs for full-text search.{Colors.ENDC}")
+            if not args.search:
+                return
+
+        if args.search:
+            viewer.print_search_results(args.search, where=args.where, limit=args.limit)
+            return
+
+        if args.export:
+            viewer.export(
+                args.export,
+                fmt=args.format,
+                columns=args.columns.split(",") if args.columns else None,
+                where=args.where,
+                since_last_export=args.since_last_export,
+            )
+            return
+
         # Analyze jobs
         viewer.analyze_jobs()
 
@@ -0,0 +1,181 @@
+import functools
+import re
+import struct
+import zlib
+
+"""
+Near-Duplicate Jobs
+===================
+
+Staffing agencies and multi-location postings publish the same description under many
+job IDs. `DuplicateIndex` groups such reposts into clusters:
+
+- Every description is reduced to a MinHash signature of its 5-word shingles. Each
+  shingle is hashed once and falls into one of `NUM_PERM` bins by its top bits; the
+  smallest hash in every bin is one position of the signature (one-permutation MinHash,
+  a single pass over the shingles instead of one per position). Two signatures agree in
+  a position with probability close to the Jaccard similarity of the shingle sets.
+- The signature is cut into `BANDS` bands of `ROWS` values (locality-sensitive hashing).
+  Descriptions sharing any band are candidates; a candidate whose signature agrees in at
+  least `THRESHOLD` of the positions is a near-duplicate. With 16 bands of 4 rows, pairs
+  at 80% similarity become candidates with 99.98% probability, while pairs below 30%
+  are compared only 12% of the time.
+- A job joins the cluster of the most similar indexed job, or starts a new one. Only
+  the first job of every cluster and members that agree with their match in fewer than
+  `REPOST` of the positions are put in the bands. Near-identical reposts add nothing to
+  the buckets, so adding a job costs the same however many reposts its cluster has,
+  while edited variants still extend the cluster to their own near-duplicates.
+
+`JobCache.add_job` maintains the index as jobs are inserted and stores the signatures in
+`job_signatures` and the cluster in `jobs.cluster_id`, so apply mode can suggest one job
+per cluster.
+"""
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+THRESHOLD = 0.8
+# Members at least this similar to their match are not indexed themselves
+REPOST = 0.9
+
+# Signatures are stored, so the hashing must never change between releases
+_MIX = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+_BIN_SHIFT = 64 - (NUM_PERM - 1).bit_length()
+_EMPTY = 1 << 32
+_WORD = re.compile(r"[a-z0-9]+")
+_SIGNATURE = struct.Struct(f"<{NUM_PERM}I")
+
+
+def shingle_hashes(text):
+    """
+    :param text: Job description.
+    :return: Set of 32-bit hashes of the lowercased 5-word shingles of the text.
+    """
+    words = _WORD.findall((text or "").lower())
+    if len(words) <= SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {
+        zlib.crc32(" ".join(words[index:index + SHINGLE_SIZE]).encode("utf-8"))
+        for index in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+# Reposts often carry the very same text, so identical descriptions are hashed once
+@functools.lru_cache(maxsize=256)
+def minhash(text):
+    """
+    :param text: Job description.
+    :return: Tuple of NUM_PERM 32-bit MinHash values, or None for an empty description.
+    """
+    hashes = shingle_hashes(text)
+    if not hashes:
+        return None
+    signature = [_EMPTY] * NUM_PERM
+    for value in hashes:
+        # Multiplicative mixing spreads the CRC over 64 bits: top bits pick the bin,
+        # the middle 32 bits are the hash
+        value = (value * _MIX) & _MASK
+        index, value = value >> _BIN_SHIFT, (value >> 16) & 0xFFFFFFFF
+        if value < signature[index]:
+            signature[index] = value
+    # Short texts leave bins empty; borrow the next filled bin (rotation densification)
+    if _EMPTY in signature:
+        bins = list(signature)
+        for index in range(NUM_PERM):
+            distance = 1
+            while signature[index] == _EMPTY:
+                signature[index] = bins[(index + distance) % NUM_PERM]
+                distance += 1
+    return tuple(signature)
+
+
+def pack_signature(signature):
+    """
+    :return: Signature as bytes for the `job_signatures` table.
+    """
+    return _SIGNATURE.pack(*signature)
+
+
+def unpack_signature(data):
+    """
+    :return: Signature tuple from its stored bytes.
+    """
+    return _SIGNATURE.unpack(data)
+
+
+def similarity(first, second):
+    """
+    :return: Share of positions in which two signatures agree, an estimate of the
+        Jaccard similarity of the descriptions.
+    """
+    return sum(a == b for a, b in zip(first, second)) / NUM_PERM
+
+
+class DuplicateIndex:
+    """
+    In-memory LSH index of job signatures and the clusters they belong to. The bands
+    index the first job of each cluster and its members that are not near-identical
+    reposts.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        # Signatures of the jobs in the bands
+        self.signatures = {}
+        # Job ID -> cluster ID of every indexed job
+        self.clusters = {}
+
+    def __len__(self):
+        return len(self.clusters)
+
+    def __contains__(self, job_id):
+        return job_id in self.clusters
+
+    @staticmethod
+    def band_keys(signature):
+        return [(band, hash(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+    def match(self, signature):
+        """
+        :param signature: MinHash signature of a description.
+        :return: Tuple of (job_id, similarity) of the most similar indexed job at or
+            above THRESHOLD, or None.
+        """
+        candidates = set()
+        for key in self.band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        best = None
+        for job_id in candidates:
+            score = similarity(signature, self.signatures[job_id])
+            if score >= THRESHOLD and (best is None or score > best[1]):
+                best = (job_id, score)
+        return best
+
+    def add(self, job_id, signature, cluster_id=None):
+        """
+        Indexes a job.
+        :param job_id: Job ID.
+        :param signature: MinHash signature of its description, or None.
+        :param cluster_id: Known cluster of the job, e.g. when loading stored signatures.
+            Looked up with `match` if None.
+        :return: Cluster ID of the job; its own ID if it is not a near-duplicate.
+        """
+        if signature is None:
+            self.clusters[job_id] = cluster_id or job_id
+            return self.clusters[job_id]
+        if cluster_id is None:
+            best = self.match(signature)
+            cluster_id = self.clusters[best[0]] if best else job_id
+            score = best[1] if best else 0
+        else:
+            # Stored clusters are loaded in insertion order, so the first job is known
+            first = self.signatures.get(cluster_id)
+            score = similarity(signature, first) if first and cluster_id != job_id else 0
+        self.clusters[job_id] = cluster_id
+        if score < REPOST:
+            self.signatures[job_id] = signature
+            for key in self.band_keys(signature):
+                self.buckets.setdefault(key, []).append(job_id)
+        return cluster_id
@@ -0,0 +1,219 @@
+import hashlib
+import re
+import zlib
+from collections import Counter
+
+"""
+Description Storage
+===================
+
+Job descriptions are the bulk of `job_cache.db`. By default they are stored as plain
+text in `jobs.full_description`, readable by any SQLite client. With a
+`description_codec` in `scan.yaml`, or after `database.py --compress-descriptions`,
+they are stored once per distinct text in the `descriptions` table instead, keyed by a
+hash of the text (content addressing: reposts with the very same description share
+one row), and compressed:
+
+- `zlib` (default, standard library), optionally with a preset dictionary of the
+  sentences that recur across descriptions (benefits, equal-opportunity statements,
+  company blurbs), so even short descriptions compress well.
+- `zstd`, if `zstandard` is installed, optionally with a dictionary trained by zstd.
+
+Dictionaries are stored in `description_dictionaries` and referenced by every row
+compressed with them, so rows written with different codecs or dictionaries can be
+mixed in one database. `jobs.description_hash` references the description, and
+`jobs.full_description` is NULL.
+
+`DescriptionCodec.register` adds the `description_text(codec, dictionary_id, data)` SQL
+function, which the `job_descriptions` view uses to return the text of either form, so
+readers query `job_descriptions.full_description` and never see the compressed bytes.
+Clients without the function (the sqlite3 shell, pandas) can still read, add and delete
+jobs, but see only the plain-text descriptions. Decompressing costs about 20 µs per
+description with zlib, so reading compressed descriptions in bulk (exports, rescoring)
+is several times slower than reading plain text; `benchmarks/bench_descriptions.py`
+measures both.
+"""
+
+CODECS = ("zlib", "zstd")
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 12
+# zlib only looks back 32 KiB, so a longer preset dictionary would be wasted
+ZLIB_DICTIONARY_SIZE = 32 * 1024
+ZSTD_DICTIONARY_SIZE = 64 * 1024
+DICTIONARY_SAMPLE_SIZE = 2000
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+
+def description_hash(text):
+    """
+    :param text: Job description.
+    :return: Hex digest identifying the description in the `descriptions` table.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_zstandard():
+    # zstandard is only needed for the zstd codec, so it is imported on demand
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compression requires zstandard (pip install zstandard)") from e
+    return zstandard
+
+
+def train_dictionary(codec, samples):
+    """
+    Builds a compression dictionary from sample descriptions.
+
+    For zlib the dictionary is the sentences that appear in more than one sample, the
+    most common ones last (closest to the data, so their matches are cheapest). zstd
+    trains its own dictionary.
+    :param codec: "zlib" or "zstd".
+    :param samples: List of description texts.
+    :return: Dictionary as bytes.
+    :raises ValueError: If the samples do not share enough text to build a dictionary.
+    """
+    if codec == "zstd":
+        zstandard = load_zstandard()
+        try:
+            trained = zstandard.train_dictionary(ZSTD_DICTIONARY_SIZE, [text.encode("utf-8") for text in samples])
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Not enough descriptions to train a zstd dictionary: {e}") from e
+        return trained.as_bytes()
+
+    counts = Counter()
+    for text in samples:
+        counts.update(set(_SENTENCE.split(text)))
+    common = [sentence for sentence, count in counts.most_common() if count > 1 and len(sentence) > 20]
+    if not common:
+        raise ValueError("The descriptions share no sentences to build a zlib dictionary from")
+    chosen, size = [], 0
+    for sentence in common:
+        size += len(sentence.encode("utf-8")) + 1
+        if size > ZLIB_DICTIONARY_SIZE:
+            break
+        chosen.append(sentence)
+    return " ".join(reversed(chosen)).encode("utf-8")
+
+
+class DescriptionCodec:
+    """
+    Compresses descriptions for one database connection and decompresses them for the
+    `description_text` SQL function.
+    """
+
+    def __init__(self, connection, codec="zlib"):
+        """
+        :param connection: sqlite3 connection of the database.
+        :param codec: Codec for new descriptions, "zlib" or "zstd". New descriptions use
+            the newest stored dictionary of that codec, if any.
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported description codec: {codec}")
+        if codec == "zstd":
+            load_zstandard()
+        self.connection = connection
+        self.codec = codec
+        # dictionary_id -> (codec, bytes); loaded on first use, since the table is only
+        # created by the migrations that run after the codec is registered
+        self.dictionaries = None
+        self.current_dictionary_id = None
+        self.compressors = {}
+        self.decompressors = {}
+
+    def register(self):
+        """
+        Adds the `description_text(codec, dictionary_id, data)` function to the connection.
+        """
+        self.connection.create_function("description_text", 3, self.decompress, deterministic=True)
+
+    def load_dictionaries(self):
+        """
+        Reads the stored dictionaries and picks the newest one of the codec for new
+        descriptions. Call it again after adding a dictionary on another connection.
+        """
+        self.dictionaries = {
+            dictionary_id: (codec, bytes(data))
+            for dictionary_id, codec, data in self.connection.execute(
+                "SELECT id, codec, data FROM description_dictionaries"
+            )
+        }
+        self.current_dictionary_id = max(
+            (dictionary_id for dictionary_id, (codec, _) in self.dictionaries.items() if codec == self.codec),
+            default=None,
+        )
+        self.compressors.clear()
+        self.decompressors.clear()
+
+    def dictionary(self, dictionary_id):
+        if self.dictionaries is None or dictionary_id not in self.dictionaries:
+            self.load_dictionaries()
+        return self.dictionaries[dictionary_id][1]
+
+    def add_dictionary(self, data):
+        """
+        Stores a dictionary for the codec and uses it for new descriptions.
+        :param data: Dictionary bytes from `train_dictionary`.
+        :return: ID of the stored dictionary.
+        """
+        if self.dictionaries is None:
+            self.load_dictionaries()
+        cursor = self.connection.execute(
+            """
+            INSERT INTO description_dictionaries (codec, data, created_at)
+            VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'))
+            """,
+            (self.codec, data),
+        )
+        self.dictionaries[cursor.lastrowid] = (self.codec, data)
+        self.current_dictionary_id = cursor.lastrowid
+        return cursor.lastrowid
+
+    def compress(self, text):
+        """
+        :param text: Job description.
+        :return: Tuple of (hash, codec, dictionary_id, size, data) for the `descriptions` table.
+        """
+        if self.dictionaries is None:
+            self.load_dictionaries()
+        raw = text.encode("utf-8")
+        dictionary_id = self.current_dictionary_id
+        if self.codec == "zstd":
+            compressor = self.compressors.get(dictionary_id)
+            if compressor is None:
+                zstandard = load_zstandard()
+                dict_data = None if dictionary_id is None else zstandard.ZstdCompressionDict(self.dictionary(dictionary_id))
+                compressor = self.compressors[dictionary_id] = zstandard.ZstdCompressor(
+                    level=ZSTD_LEVEL, dict_data=dict_data
+                )
+            data = compressor.compress(raw)
+        elif dictionary_id is None:
+            data = zlib.compress(raw, ZLIB_LEVEL)
+        else:
+            compressor = zlib.compressobj(ZLIB_LEVEL, zdict=self.dictionary(dictionary_id))
+            data = compressor.compress(raw) + compressor.flush()
+        return description_hash(text), self.codec, dictionary_id, len(raw), data
+
+    def decompress(self, codec, dictionary_id, data):
+        """
+        :param codec: Codec the description was compressed with.
+        :param dictionary_id: Dictionary it was compressed with, or None.
+        :param data: Compressed bytes.
+        :return: Description text, or None if `data` is None (a job without description).
+        """
+        if data is None:
+            return None
+        if codec == "zstd":
+            decompressor = self.decompressors.get(dictionary_id)
+            if decompressor is None:
+                zstandard = load_zstandard()
+                dict_data = None if dictionary_id is None else zstandard.ZstdCompressionDict(self.dictionary(dictionary_id))
+                decompressor = self.decompressors[dictionary_id] = zstandard.ZstdDecompressor(dict_data=dict_data)
+            raw = decompressor.decompress(data)
+        elif dictionary_id is None:
+            raw = zlib.decompress(data)
+        else:
+            decompressor = zlib.decompressobj(zdict=self.dictionary(dictionary_id))
+            raw = decompressor.decompress(data) + decompressor.flush()
+        return raw.decode("utf-8")
@@ -0,0 +1,160 @@
+from selenium.common.exceptions import NoSuchElementException
+from automate_linkedin.utils import Colors
+
+"""
+Bulk DOM Extraction
+===================
+
+Every `find_element`, `.text`, `get_attribute` or `click` is a separate HTTP round trip
+to chromedriver. `BulkExtractor` replaces those per-element calls with one
+`execute_script` call that evaluates the XPaths from `xpaths.yaml` inside the page and
+returns plain JSON:
+
+- `page_cards`: the ID, title and company of every job card on a results page.
+- `click_card`: scrolls a card into view and clicks it.
+- `shown_job`: the URL and the title and company in the details pane, to tell when the
+  clicked job is shown.
+- `job_details`: title, company, primary description and the full description text.
+
+Selected with `extraction: bulk` in `scan.yaml` (the default); `extraction: elements`
+uses the per-element WebDriver calls instead.
+"""
+
+# Shared helpers prepended to every script. `text` mirrors WebElement.text (rendered
+# text, trimmed); `spanText` mirrors joining `.text` of every <span> in the description.
+HELPERS = """
+function first(path, context) {
+    return document.evaluate(path, context || document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function all(path, context) {
+    var snapshot = document.evaluate(path, context || document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+}
+function text(node) {
+    return node ? (node.innerText || "").trim() : null;
+}
+function spanText(node) {
+    return Array.prototype.map.call(node.getElementsByTagName("span"), text).join(" ");
+}
+"""
+
+PAGE_CARDS_SCRIPT = HELPERS + """
+var xp = arguments[0];
+return all(xp.job_card).map(function (card) {
+    return {
+        job_id: card.getAttribute("data-occludable-job-id"),
+        title: xp.card_title ? text(first(xp.card_title, card)) : null,
+        company: xp.card_company ? text(first(xp.card_company, card)) : null
+    };
+});
+"""
+
+CLICK_CARD_SCRIPT = HELPERS + """
+var card = first(arguments[0]);
+if (!card) return false;
+card.scrollIntoView(true);
+card.click();
+return true;
+"""
+
+SHOWN_JOB_SCRIPT = HELPERS + """
+var xp = arguments[0];
+return {url: window.location.href, title: text(first(xp.job_title)), company: text(first(xp.company))};
+"""
+
+JOB_DETAILS_SCRIPT = HELPERS + """
+var xp = arguments[0];
+var button = first(xp.show_more_button);
+if (button) button.click();
+var description = first(xp.full_description);
+return {
+    title: text(first(xp.job_title)),
+    company: text(first(xp.company)),
+    primary_description: text(first(xp.primary_description)),
+    full_description: description ? spanText(description) : null,
+    show_more: !!button
+};
+"""
+
+DESCRIPTION_SCRIPT = HELPERS + """
+var description = first(arguments[0]);
+return description ? spanText(description) : null;
+"""
+
+
+class BulkExtractor:
+    """
+    Reads job cards and job details with a single `execute_script` call each.
+    """
+
+    def __init__(self, driver, xpaths, waiter):
+        """
+        :param driver: Selenium WebDriver instance.
+        :param xpaths: Dictionary containing XPaths for interacting with the LinkedIn site.
+        :param waiter: PageWaiter used when the expanded description renders asynchronously.
+        """
+        self.driver = driver
+        self.job_search = dict(xpaths["job_search"])
+        self.waiter = waiter
+
+    def page_cards(self):
+        """
+        :return: List of dictionaries with `job_id`, `title` and `company` for every card
+            on the current results page, in page order. Title and company are None when
+            `card_title`/`card_company` are not configured or not found.
+        """
+        return self.driver.execute_script(PAGE_CARDS_SCRIPT, self.job_search) or []
+
+    def click_card(self, job_id):
+        """
+        Scrolls the card of a job into view and clicks it.
+        :param job_id: Job ID of the card.
+        :raises NoSuchElementException: If the card is not on the page.
+        """
+        xpath = self.job_search["job_card_by_id"].format(job_id=job_id)
+        if not self.driver.execute_script(CLICK_CARD_SCRIPT, xpath):
+            raise NoSuchElementException(f"Job card {job_id} not found")
+
+    def shown_job(self):
+        """
+        :return: Dictionary with the page `url` and the `title` and `company` shown in the
+            details pane (None when not rendered).
+        """
+        return self.driver.execute_script(SHOWN_JOB_SCRIPT, self.job_search) or {}
+
+    def job_details(self):
+        """
+        Expands the description and reads the details of the open job. A second script
+        call is only needed when the expanded description renders after the click.
+        :return: Dictionary with `title`, `company`, `primary_description` and `full_description`.
+        :raises NoSuchElementException: If a required element is missing.
+        """
+        details = self.driver.execute_script(JOB_DETAILS_SCRIPT, self.job_search)
+        for key in ("title", "company", "primary_description"):
+            if details.get(key) is None:
+                raise NoSuchElementException(f"Job detail element not found: {key}")
+
+        if not details.get("show_more"):
+            print(f"{Colors.WARNING}Show more button not found... {Colors.ENDC}")
+        if details.get("full_description") is None:
+            # The expanded description may render only after the click; poll for it
+            found = None
+            if details.get("show_more"):
+                found = self.waiter.try_wait_until("show_more", self.read_description)
+            if found is None:
+                raise NoSuchElementException("Job detail element not found: full_description")
+            details["full_description"] = found[0]
+        return details
+
+    def read_description(self, driver):
+        """
+        :param driver: Selenium WebDriver instance.
+        :return: One-element tuple with the full description text, or None if the
+            expanded description is not on the page yet.
+        """
+        description = driver.execute_script(DESCRIPTION_SCRIPT, self.job_search["full_description"])
+        return None if description is None else (description,)
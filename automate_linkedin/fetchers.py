@@ -0,0 +1,198 @@
+"""
+Job Fetchers
+============
+
+A fetcher turns a job ID into the job's details (title, company, primary description and
+full description). `LinkedInScraper` always reads the results pages with its WebDriver,
+but the details of each job can come from either backend, selected with `fetcher` in
+`scan.yaml`:
+
+- `SeleniumFetcher` (default): opens the job in the browser, in the details pane or on its
+  own page, and reads it with the browser.
+- `HttpFetcher`: downloads `/jobs/view/{job_id}` with a pooled HTTP client that reuses the
+  browser's authenticated cookies, and parses the HTML with lxml using the same XPaths.
+  Jobs are fetched without rendering them in Chrome, so `FetchPipeline` (in
+  `pipeline.py`) can fetch many of them concurrently.
+"""
+
+
+class JobFetcher:
+    """
+    Interface shared by the fetcher backends.
+    """
+
+    # True if fetching drives the scraper's browser. Such fetchers load one job at a time,
+    # and the results page is reloaded after a failure in the details pane.
+    uses_browser = False
+
+    def on_login(self, driver):
+        """
+        Called once the browser is logged in.
+        :param driver: Selenium WebDriver instance.
+        """
+
+    def fetch_job(self, job_id):
+        """
+        :param job_id: Job ID to fetch.
+        :return: Dictionary with `title`, `company`, `primary_description` and `full_description`.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases any resources held by the fetcher.
+        """
+
+
+class SeleniumFetcher(JobFetcher):
+    """
+    Reads job details in the scraper's browser session.
+    """
+
+    uses_browser = True
+
+    def __init__(self, scraper):
+        """
+        :param scraper: LinkedInScraper whose browser opens the jobs.
+        """
+        self.scraper = scraper
+
+    def fetch_job(self, job_id):
+        with self.scraper.metrics.span("job.open"):
+            self.scraper.open_job(job_id)
+        with self.scraper.metrics.span("job.read"):
+            details = self.scraper.read_job_details()
+        if self.scraper.recorder is not None:
+            self.scraper.recorder.record_job(job_id, self.scraper.driver.page_source)
+        return details
+
+
+class HttpFetcher(JobFetcher):
+    """
+    Fetches job pages over pooled HTTP connections and parses them with lxml.
+    """
+
+    def __init__(self, xpaths, http_config=None, cookies=None, pool_size=8):
+        """
+        :param xpaths: Dictionary containing XPaths for interacting with the LinkedIn site.
+        :param http_config: `http` section of `scan.yaml` with `base_url`, `timeout`,
+            `retries` and `user_agent`.
+        :param cookies: Optional list of WebDriver-style cookie dictionaries to start with.
+        :param pool_size: Number of pooled connections; match the pipeline concurrency.
+        """
+        # requests and lxml are only needed for this backend, so they are imported on demand
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from lxml import html
+        except ImportError as e:
+            raise ImportError("The HTTP fetcher requires requests and lxml (pip install requests lxml)") from e
+
+        http_config = http_config or {}
+        self.html = html
+        self.job_search = dict(xpaths["job_search"])
+        self.base_url = http_config.get("base_url", "https://www.linkedin.com").rstrip("/")
+        self.timeout = http_config.get("timeout", 15)
+
+        # One connection pool shared by every concurrent fetch
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=http_config.get("retries", 2),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": http_config.get("user_agent", "Mozilla/5.0"),
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+        )
+        self.set_cookies(cookies or [])
+
+    def set_cookies(self, cookies):
+        """
+        Copies browser cookies into the HTTP session.
+        :param cookies: List of WebDriver-style cookie dictionaries.
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def on_login(self, driver):
+        self.set_cookies(driver.get_cookies())
+
+    def fetch_job(self, job_id):
+        response = self.session.get(f"{self.base_url}/jobs/view/{job_id}/", timeout=self.timeout)
+        response.raise_for_status()
+        if "/login" in response.url or "/authwall" in response.url:
+            raise PermissionError("LinkedIn session expired; log in again")
+        return self.parse_job(response.content)
+
+    def parse_job(self, content):
+        """
+        Reads the job details out of a job page.
+        :param content: HTML of `/jobs/view/{job_id}`.
+        :return: Dictionary with `title`, `company`, `primary_description` and `full_description`.
+        :raises LookupError: If a required element is missing.
+        """
+        document = self.html.fromstring(content)
+
+        def first(key):
+            nodes = document.xpath(self.job_search[key])
+            if not nodes:
+                return None
+            return nodes[0]
+
+        details = {}
+        for key, xpath_key in (
+            ("title", "job_title"),
+            ("company", "company"),
+            ("primary_description", "primary_description"),
+        ):
+            node = first(xpath_key)
+            if node is None:
+                raise LookupError(f"Job detail element not found: {xpath_key}")
+            details[key] = " ".join(node.text_content().split())
+
+        # The static page has the whole description in the collapsed container
+        description = first("full_description")
+        if description is None and "static_description" in self.job_search:
+            description = first("static_description")
+        if description is None:
+            raise LookupError("Job detail element not found: full_description")
+        details["full_description"] = " ".join(
+            " ".join(span.text_content().split())
+            for span in description.iter("span")
+            if span is not description
+        )
+        return details
+
+    def close(self):
+        self.session.close()
+
+
+def create_fetcher(scraper, scan_config):
+    """
+    Builds the fetcher selected by `fetcher` in `scan.yaml`.
+    :param scraper: LinkedInScraper the fetcher works for.
+    :param scan_config: Dictionary from `scan.yaml`.
+    :return: JobFetcher instance.
+    """
+    name = scan_config.get("fetcher", "selenium")
+    if name == "selenium":
+        return SeleniumFetcher(scraper)
+    if name == "http":
+        return HttpFetcher(
+            scraper.xpaths,
+            scan_config.get("http"),
+            scraper.session.load_cookies(),
+            pool_size=(scan_config.get("pipeline") or {}).get("concurrency", 8),
+        )
+    raise ValueError(f"Unknown fetcher: {name}")
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import re
+from collections import namedtuple
+
+
+MatchResult = namedtuple("MatchResult", ["points", "positive", "negative", "best"])
+
+# Characters that may not touch a keyword when whole-word matching is enabled.
+# Using explicit alphanumeric lookarounds instead of `\b` keeps keywords such as
+# "C++" or "10+ Years" matchable, since `\b` never matches after a "+".
+_WORD_CHARS = "a-z0-9"
+_WORD_CHAR = re.compile(f"[{_WORD_CHARS}]")
+
+
+class KeywordMatcher:
+    """
+    Scores text against the positive, negative, and best keyword lists in one pass.
+
+    All keywords are compiled into a single regular expression (built as a trie so
+    the engine only tries keywords sharing the current prefix). Each text is lowercased
+    once and scanned once, and every keyword occurrence is reported, including keywords
+    nested inside longer ones (e.g. "Learning" inside "Machine Learning").
+    """
+
+    def __init__(self, positive, negative, best, whole_words=True):
+        """
+        Builds the matcher from the keyword lists.
+        :param positive: Keywords that increase the score.
+        :param negative: Keywords that mark a job as irrelevant.
+        :param best: Keywords that mark a job as a top priority.
+        :param whole_words: When True, "lead" does not match inside "leader".
+        """
+        self.positive = list(positive or [])
+        self.negative = list(negative or [])
+        self.best = list(best or [])
+        self.whole_words = whole_words
+
+        self._keywords = {word.lower() for word in self.positive + self.negative + self.best}
+
+        # Shorter keywords that are prefixes of longer ones; the regex only reports
+        # the longest keyword starting at a position, so these are checked directly.
+        self._prefixes = {
+            keyword: [other for other in self._keywords if other != keyword and keyword.startswith(other)]
+            for keyword in self._keywords
+        }
+        self._pattern = self._compile()
+        self._config_hash = None
+
+    @classmethod
+    def from_filters(cls, filters):
+        """
+        Builds a matcher from the `description` section of `job_filters.yaml`.
+        :param filters: Dictionary containing positive, negative, and best keywords.
+        :return: KeywordMatcher instance.
+        """
+        description = filters["description"]
+        return cls(
+            description["positive"],
+            description["negative"],
+            description["best"],
+            whole_words=filters.get("match_whole_words", True),
+        )
+
+    def config(self):
+        """
+        Returns the keyword configuration as plain Python values, e.g. to rebuild the
+        matcher in another process.
+        :return: Dictionary with positive, negative, best and whole_words.
+        """
+        return {
+            "positive": list(self.positive),
+            "negative": list(self.negative),
+            "best": list(self.best),
+            "whole_words": self.whole_words,
+        }
+
+    def config_hash(self):
+        """
+        Returns a stable hash of the keyword configuration. Jobs scored with the same hash
+        would get the same score again, so re-scoring can skip them.
+        :return: Hex digest string.
+        """
+        if self._config_hash is None:
+            encoded = json.dumps(self.config(), sort_keys=True).encode("utf-8")
+            self._config_hash = hashlib.sha256(encoded).hexdigest()[:16]
+        return self._config_hash
+
+    def _compile(self):
+        if not self._keywords:
+            return None
+
+        trie = {}
+        for keyword in self._keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        body = self._trie_pattern(trie)
+        if self.whole_words:
+            pattern = f"(?<![{_WORD_CHARS}])(?=({body})(?![{_WORD_CHARS}]))"
+        else:
+            pattern = f"(?=({body}))"
+        return re.compile(pattern)
+
+    def _trie_pattern(self, node):
+        """
+        Converts a trie node into a regex fragment that prefers the longest match.
+        """
+        branches = [
+            re.escape(char) + self._trie_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Keyword ends here but may continue; try the longer keyword first
+            return f"(?:{group})?"
+        return group
+
+    def _is_boundary(self, text, index):
+        return index >= len(text) or _WORD_CHAR.match(text, index) is None
+
+    def find(self, text):
+        """
+        Returns the set of lowercased keywords present in the text.
+        :param text: Text to scan.
+        :return: Set of lowercased keywords.
+        """
+        found = set()
+        if not text or self._pattern is None:
+            return found
+
+        lowered = text.lower()
+        for match in self._pattern.finditer(lowered):
+            keyword = match.group(1)
+            if keyword in found and not self._prefixes[keyword]:
+                continue
+            found.add(keyword)
+            start = match.start()
+            for prefix in self._prefixes[keyword]:
+                if not self.whole_words or self._is_boundary(lowered, start + len(prefix)):
+                    found.add(prefix)
+        return found
+
+    def match(self, text):
+        """
+        Scans the text once and scores it with the same rules as the original keyword loops:
+        +1 for every positive keyword, -1 if any negative keyword is present, and 1 if any
+        best keyword is present.
+        :param text: Job description or title.
+        :return: MatchResult(points, positive, negative, best) with keywords in config order.
+        """
+        found = self.find(text)
+        pos = [word for word in self.positive if word.lower() in found]
+        neg = [word for word in self.negative if word.lower() in found]
+        best = [word for word in self.best if word.lower() in found]
+
+        points = len(pos)
+        if neg:
+            points = -1
+        if best:
+            points = 1
+        return MatchResult(points, pos, neg, best)
@@ -0,0 +1,263 @@
+import json
+import math
+import os
+import threading
+import time
+from automate_linkedin.utils import Colors
+
+"""
+Scan Metrics
+============
+
+Timers for the stages of a scan: login, search, page loads, opening and reading jobs,
+scoring, and database calls. Every timed block is a span:
+
+    with metrics.span("job.score"):
+        ...
+
+Enable them in the `metrics` section of `scan.yaml`. Spans can be streamed to a JSON
+lines file and summarized in a Prometheus text file (for the node exporter's textfile
+collector); either way an end-of-run report prints the count, p50, p95 and total time
+of every stage, and the jobs processed per hour.
+
+When metrics are disabled `create_metrics` returns `NULL_METRICS`, whose `span` hands
+back one shared no-op context manager, so instrumented code does no timing, locking or
+allocation.
+"""
+
+
+def percentile(values, fraction):
+    """
+    :param values: Sorted list of numbers.
+    :param fraction: Percentile between 0 and 1, e.g. 0.95.
+    :return: Nearest-rank percentile, or 0.0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+class NullSpan:
+    """
+    Context manager that does nothing; shared by every disabled span.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class NullMetrics:
+    """
+    Disabled metrics: every call is a no-op.
+    """
+
+    enabled = False
+
+    def span(self, stage):
+        return NULL_SPAN
+
+    def observe(self, stage, seconds, error=False):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+    def report(self):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class Span:
+    """
+    Times one block and reports its duration to `Metrics.observe` on exit.
+    """
+
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.observe(
+            self.stage, time.perf_counter() - self.start, error=exc_type is not None
+        )
+        return False
+
+
+class Metrics:
+    """
+    Collects span durations and counters. Thread-safe, so scan workers can share one
+    instance.
+    """
+
+    enabled = True
+
+    def __init__(self, jsonl_file=None, prometheus_file=None):
+        """
+        :param jsonl_file: Optional path; every span is appended to it as a JSON line.
+        :param prometheus_file: Optional path the stage summary is written to by `close`.
+        """
+        self.durations = {}
+        self.errors = {}
+        self.counters = {}
+        self.prometheus_file = prometheus_file
+        self.started_at = time.time()
+        self.lock = threading.Lock()
+        self.jsonl = open(jsonl_file, "a", encoding="utf-8") if jsonl_file else None
+
+    def span(self, stage):
+        """
+        :param stage: Stage name, e.g. "page.load" or "db.write".
+        :return: Context manager that times the block.
+        """
+        return Span(self, stage)
+
+    def observe(self, stage, seconds, error=False):
+        """
+        Records the duration of one stage.
+        :param stage: Stage name.
+        :param seconds: Duration in seconds.
+        :param error: True if the block raised.
+        """
+        with self.lock:
+            self.durations.setdefault(stage, []).append(seconds)
+            if error:
+                self.errors[stage] = self.errors.get(stage, 0) + 1
+            if self.jsonl is not None:
+                self.jsonl.write(
+                    json.dumps(
+                        {
+                            "ts": round(time.time(), 3),
+                            "stage": stage,
+                            "seconds": round(seconds, 6),
+                            "error": error,
+                            "thread": threading.current_thread().name,
+                        }
+                    )
+                    + "\n"
+                )
+
+    def count(self, name, value=1):
+        """
+        Adds to a counter, e.g. the number of jobs processed.
+        :param name: Counter name.
+        :param value: Amount to add.
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        """
+        :return: Dictionary of stage -> dictionary with `count`, `errors`, `p50`, `p95`
+            and `total` (seconds).
+        """
+        with self.lock:
+            items = [(stage, sorted(durations)) for stage, durations in self.durations.items()]
+            errors = dict(self.errors)
+        return {
+            stage: {
+                "count": len(durations),
+                "errors": errors.get(stage, 0),
+                "p50": percentile(durations, 0.5),
+                "p95": percentile(durations, 0.95),
+                "total": sum(durations),
+            }
+            for stage, durations in sorted(items)
+        }
+
+    def jobs_per_hour(self):
+        """
+        :return: Job cards processed per hour since the metrics were created.
+        """
+        elapsed = time.time() - self.started_at
+        return self.counters.get("jobs", 0) * 3600 / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        """
+        Prints the latency of every stage and the job throughput.
+        """
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"{Colors.HEADER}Scan Profile:{Colors.ENDC}")
+        width = max(len(stage) for stage in summary)
+        for stage, stats in summary.items():
+            errors = f", {stats['errors']} errors" if stats["errors"] else ""
+            print(
+                f"{Colors.OKCYAN}{stage:<{width}}  {stats['count']:6d} calls  "
+                f"p50 {stats['p50'] * 1000:8.1f} ms  p95 {stats['p95'] * 1000:8.1f} ms  "
+                f"total {stats['total']:7.1f}s{errors}{Colors.ENDC}"
+            )
+        print(f"{Colors.OKGREEN}Throughput: {self.jobs_per_hour():.0f} jobs/hour{Colors.ENDC}")
+
+    def write_prometheus(self, path):
+        """
+        Writes the stage summary and counters in the Prometheus text format.
+        :param path: Output file; replaced atomically.
+        """
+        lines = [
+            "# HELP automate_linkedin_stage_seconds Duration of scan stages.",
+            "# TYPE automate_linkedin_stage_seconds summary",
+        ]
+        for stage, stats in self.summary().items():
+            for quantile, key in (("0.5", "p50"), ("0.95", "p95")):
+                lines.append(
+                    f'automate_linkedin_stage_seconds{{stage="{stage}",quantile="{quantile}"}} '
+                    f"{stats[key]:.6f}"
+                )
+            lines.append(f'automate_linkedin_stage_seconds_sum{{stage="{stage}"}} {stats["total"]:.6f}')
+            lines.append(f'automate_linkedin_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        with self.lock:
+            counters = dict(self.counters)
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE automate_linkedin_{name}_total counter")
+            lines.append(f"automate_linkedin_{name}_total {value}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+    def close(self):
+        """
+        Writes the Prometheus file, if configured, and closes the JSON lines file.
+        """
+        if self.prometheus_file:
+            try:
+                self.write_prometheus(self.prometheus_file)
+            except OSError as e:
+                print(f"{Colors.WARNING}Could not write metrics to {self.prometheus_file}: {e}{Colors.ENDC}")
+        with self.lock:
+            if self.jsonl is not None:
+                self.jsonl.close()
+                self.jsonl = None
+
+
+def create_metrics(metrics_config):
+    """
+    :param metrics_config: `metrics` section of `scan.yaml` with `enabled`, `jsonl_file`
+        and `prometheus_file`.
+    :return: Metrics instance, or NULL_METRICS if metrics are disabled.
+    """
+    metrics_config = metrics_config or {}
+    if not metrics_config.get("enabled", False):
+        return NULL_METRICS
+    return Metrics(metrics_config.get("jsonl_file"), metrics_config.get("prometheus_file"))
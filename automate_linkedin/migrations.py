@@ -0,0 +1,427 @@
+import datetime
+import sqlite3
+
+from automate_linkedin.descriptions import DescriptionCodec
+
+"""
+Database Migrations
+===================
+
+Versioned schema changes for `job_cache.db`. The schema version is stored in SQLite's
+`PRAGMA user_version`; `migrate()` applies every migration newer than that version, each
+in its own transaction, so existing databases are upgraded in place the next time they
+are opened by `JobCache` or `JobViewer`.
+
+To change the schema, append a new `(version, description, function)` entry to
+`MIGRATIONS`. Never edit a migration that has already been released.
+"""
+
+# Timestamps are stored as ISO-8601 text ("2025-01-31T09:30:00"), which sorts
+# chronologically and can be compared directly with SQLite's date functions.
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def to_timestamp(value):
+    """
+    Converts a datetime (or an already formatted string) into the stored timestamp format.
+    :param value: datetime, ISO string, or None.
+    :return: ISO-8601 string with second precision, or None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def create_initial_schema(cursor):
+    """
+    Version 1: the `jobs` table and the `seen_jobs` outcome table.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            date_posted TEXT,
+            points INTEGER,
+            matched_keywords TEXT,
+            full_description TEXT,
+            job_link TEXT,
+            applied BOOLEAN DEFAULT 0,
+            date_applied TEXT
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS seen_jobs (
+            job_id TEXT PRIMARY KEY,
+            outcome TEXT,
+            seen_at TEXT
+        )
+    """)
+
+
+def add_indexes_and_iso_timestamps(cursor):
+    """
+    Version 2: indexes for the hot queries and sortable ISO timestamps.
+
+    `date_posted` used to be written as `str(datetime)` ("2025-01-31 09:30:00.123456");
+    it is rewritten to the ISO format so it can be indexed and compared in SQL.
+    """
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_applied_points ON jobs (applied, points DESC)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted)")
+    cursor.execute(
+        """
+        UPDATE jobs SET date_posted = strftime(?, date_posted)
+        WHERE date_posted IS NOT NULL AND strftime(?, date_posted) IS NOT NULL
+    """,
+        (TIMESTAMP_FORMAT, TIMESTAMP_FORMAT),
+    )
+
+
+def add_boosted_at(cursor):
+    """
+    Version 3: `boosted_at` marks jobs whose score was already raised for being close to
+    expiration, so repeated analysis runs do not boost them again.
+    """
+    cursor.execute("ALTER TABLE jobs ADD COLUMN boosted_at TEXT")
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_pending_unboosted ON jobs (date_posted)
+        WHERE applied = 0 AND boosted_at IS NULL
+    """
+    )
+
+
+def add_updated_at(cursor):
+    """
+    Version 4: `updated_at` is maintained by triggers on every insert and update, so
+    exports can pick up only the rows that changed since the previous export. The
+    `exports` table remembers the newest `updated_at` written by each export target.
+    """
+    cursor.execute("ALTER TABLE jobs ADD COLUMN updated_at TEXT")
+    cursor.execute(
+        "UPDATE jobs SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs (updated_at)")
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_set_updated_at_insert AFTER INSERT ON jobs
+        BEGIN
+            UPDATE jobs SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+            WHERE job_id = NEW.job_id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_set_updated_at_update AFTER UPDATE ON jobs
+        WHEN NEW.updated_at IS OLD.updated_at
+        BEGIN
+            UPDATE jobs SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+            WHERE job_id = NEW.job_id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS exports (
+            target TEXT PRIMARY KEY,
+            last_updated_at TEXT,
+            exported_at TEXT
+        )
+    """)
+
+
+def add_score_hash(cursor):
+    """
+    Version 5: `score_hash` identifies the keyword filters a job was scored with, so
+    re-scoring can skip jobs whose filters have not changed.
+    """
+    cursor.execute("ALTER TABLE jobs ADD COLUMN score_hash TEXT")
+
+
+def add_search_stats(cursor):
+    """
+    Version 6: `search_stats` accumulates, per search URL, how many cards the scanner
+    processed, how many of them were new, and how many were saved, so the scan planner
+    can run the searches with the best past hit rate first.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_stats (
+            search_url TEXT PRIMARY KEY,
+            name TEXT,
+            runs INTEGER DEFAULT 0,
+            scanned INTEGER DEFAULT 0,
+            new_jobs INTEGER DEFAULT 0,
+            saved INTEGER DEFAULT 0,
+            last_run_at TEXT
+        )
+    """)
+
+
+def add_scan_cursors(cursor):
+    """
+    Version 7: `scan_cursors` stores, per search URL, the newest job ID of the last
+    complete incremental scan. Incremental scans stop paging once they reach jobs at or
+    below this high-water mark.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scan_cursors (
+            search_url TEXT PRIMARY KEY,
+            newest_job_id INTEGER,
+            updated_at TEXT
+        )
+    """)
+
+
+def add_scan_checkpoints(cursor):
+    """
+    Version 8: checkpoints of running scans. `scans` has one row per scan; `scan_pages`
+    lists the result pages a scan finished and `scan_jobs` the outcome of every card it
+    processed, so an interrupted scan can be resumed from the last completed card.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scans (
+            scan_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            status TEXT,
+            started_at TEXT,
+            updated_at TEXT
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scan_pages (
+            scan_id INTEGER,
+            search_url TEXT,
+            page INTEGER,
+            PRIMARY KEY (scan_id, search_url, page)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scan_jobs (
+            scan_id INTEGER,
+            search_url TEXT,
+            job_id TEXT,
+            page INTEGER,
+            outcome TEXT,
+            details TEXT,
+            PRIMARY KEY (scan_id, search_url, job_id)
+        )
+    """)
+
+
+def create_search_index(cursor):
+    """
+    Creates the `jobs_fts` full-text index over the title, company and description of
+    every job, and the triggers that keep it in sync with `jobs`. It is an external
+    content FTS5 table: it stores only the index and reads the text from the
+    `job_descriptions` view, which needs the `description_text` function registered by
+    `descriptions.DescriptionCodec`. Does nothing if it already exists.
+
+    The triggers use only plain SQL, so any SQLite client can still insert, update and
+    delete jobs. They index jobs whose description is stored as plain text in
+    `jobs.full_description`; `JobCache.add_job` indexes the jobs it stores compressed.
+    Moving a description between the two forms does not change its text, so the index
+    is left as it is.
+    :param cursor: sqlite3 cursor.
+    """
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, full_description,
+            content='job_descriptions', content_rowid='job_rowid', tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs
+        WHEN NEW.description_hash IS NULL
+        BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, full_description)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.full_description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs
+        WHEN OLD.description_hash IS NULL
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.full_description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, full_description ON jobs
+        WHEN OLD.description_hash IS NULL AND NEW.description_hash IS NULL
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.full_description);
+            INSERT INTO jobs_fts (rowid, title, company, full_description)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.full_description);
+        END
+    """)
+
+
+def add_search_index(cursor):
+    """
+    Version 9: full-text index over the stored jobs, filled from the existing rows.
+    SQLite builds without FTS5 skip it; `JobViewer.search` then falls back to LIKE, and
+    `database.py --rebuild-search-index` creates it once FTS5 is available.
+    Version 11 moves the index onto the `job_descriptions` view.
+    """
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, full_description,
+                content='jobs', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        if "fts5" not in str(e):
+            raise
+        return
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, full_description)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.full_description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.full_description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, full_description ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.full_description);
+            INSERT INTO jobs_fts (rowid, title, company, full_description)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.full_description);
+        END
+    """)
+    cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+
+def add_duplicate_clusters(cursor):
+    """
+    Version 10: `jobs.cluster_id` groups reposts of the same description, and
+    `job_signatures` stores the MinHash signature of every job (see `dedup.py`).
+    Existing jobs are clustered by `JobCache` the first time it adds a job.
+    """
+    cursor.execute("ALTER TABLE jobs ADD COLUMN cluster_id TEXT")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_cluster_id ON jobs (cluster_id)")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_signatures (
+            job_id TEXT PRIMARY KEY,
+            signature BLOB
+        )
+    """)
+
+
+def add_description_store(cursor):
+    """
+    Version 11: descriptions can be stored compressed and once per distinct text in the
+    content-addressed `descriptions` table (see `descriptions.py`), referenced by
+    `jobs.description_hash`. Existing descriptions stay as plain text in
+    `jobs.full_description` until `database.py --compress-descriptions` moves them. The
+    `job_descriptions` view returns the text of every job in either form, and the
+    full-text index reads from it.
+    """
+    DescriptionCodec(cursor.connection).register()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS descriptions (
+            hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            dictionary_id INTEGER,
+            size INTEGER,
+            data BLOB
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS description_dictionaries (
+            id INTEGER PRIMARY KEY,
+            codec TEXT NOT NULL,
+            data BLOB,
+            created_at TEXT
+        )
+    """)
+    cursor.execute("ALTER TABLE jobs ADD COLUMN description_hash TEXT")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_description_hash ON jobs (description_hash)")
+    # COALESCE only decompresses jobs without a plain-text description
+    cursor.execute("""
+        CREATE VIEW IF NOT EXISTS job_descriptions AS
+        SELECT jobs.rowid AS job_rowid, jobs.job_id, jobs.title, jobs.company,
+               COALESCE(
+                   jobs.full_description,
+                   description_text(descriptions.codec, descriptions.dictionary_id, descriptions.data)
+               ) AS full_description
+        FROM jobs LEFT JOIN descriptions ON descriptions.hash = jobs.description_hash
+    """)
+    # Descriptions are shared, so one is removed only with the last job using it
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_delete_description AFTER DELETE ON jobs
+        WHEN OLD.description_hash IS NOT NULL
+        BEGIN
+            DELETE FROM descriptions WHERE hash = OLD.description_hash
+            AND NOT EXISTS (SELECT 1 FROM jobs WHERE description_hash = OLD.description_hash);
+        END
+    """)
+
+    # The index of version 9 reads `jobs`, which has no text for compressed jobs
+    if cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchall():
+        for trigger in ("jobs_fts_insert", "jobs_fts_delete", "jobs_fts_update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute("DROP TABLE jobs_fts")
+        create_search_index(cursor)
+        cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+
+MIGRATIONS = [
+    (1, "Create jobs and seen_jobs tables", create_initial_schema),
+    (2, "Index hot queries and store ISO timestamps", add_indexes_and_iso_timestamps),
+    (3, "Track expiration score boosts", add_boosted_at),
+    (4, "Track row changes for incremental exports", add_updated_at),
+    (5, "Track the filters each job was scored with", add_score_hash),
+    (6, "Track the hit rate of each search", add_search_stats),
+    (7, "Track the newest job of each incremental search", add_scan_cursors),
+    (8, "Checkpoint running scans", add_scan_checkpoints),
+    (9, "Index job descriptions for full-text search", add_search_index),
+    (10, "Cluster reposted jobs", add_duplicate_clusters),
+    (11, "Store descriptions compressed and once per distinct text", add_description_store),
+]
+
+
+def current_version(connection):
+    """
+    :param connection: sqlite3 connection.
+    :return: Schema version of the database.
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(connection, target_version=None):
+    """
+    Applies all pending migrations to the database.
+    :param connection: sqlite3 connection.
+    :param target_version: Stop after this version, e.g. to build an older schema in a
+        benchmark. Defaults to the newest version.
+    :return: List of (version, description) tuples that were applied.
+    """
+    applied = []
+    version = current_version(connection)
+    for target, description, upgrade in MIGRATIONS:
+        if target <= version or (target_version is not None and target > target_version):
+            continue
+        cursor = connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            upgrade(cursor)
+            cursor.execute(f"PRAGMA user_version = {int(target)}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        applied.append((target, description))
+    return applied
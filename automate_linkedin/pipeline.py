@@ -0,0 +1,231 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from automate_linkedin.utils import Colors
+
+"""
+Fetch Pipeline
+==============
+
+The stage between "discover job IDs on a results page" and "score the job details".
+The pace of detail requests is set by an explicit budget instead of by sleeps:
+
+- `TokenBucket` allows `requests_per_minute` on average with bursts of up to `burst`
+  requests. The bucket is thread-safe, so parallel scan workers can share one budget.
+- At most `concurrency` requests are in flight at once (concurrent fetchers only).
+- A failed request is retried after a jittered exponential backoff.
+
+Fetchers that can run without the browser (the HTTP fetcher) are driven by an asyncio
+loop that fetches a whole results page concurrently; browser fetchers go one job at a
+time through the same budget.
+"""
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter. Each request takes one token; tokens refill continuously at
+    `requests_per_minute / 60` per second up to `burst`. Requests that find the bucket empty
+    reserve a future token and wait for it, so waiting requests are released exactly at
+    the configured rate.
+    """
+
+    def __init__(self, requests_per_minute=None, burst=1, clock=time.monotonic):
+        """
+        :param requests_per_minute: Average request budget. None or 0 disables the limit.
+        :param burst: Maximum number of requests allowed back to back.
+        :param clock: Monotonic clock in seconds, replaceable for tests.
+        """
+        self.rate = (requests_per_minute or 0) / 60.0
+        self.burst = max(1, burst or 1)
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, pipeline_config):
+        """
+        :param pipeline_config: `pipeline` section of `scan.yaml`.
+        :return: TokenBucket instance.
+        """
+        pipeline_config = pipeline_config or {}
+        return cls(pipeline_config.get("requests_per_minute"), pipeline_config.get("burst", 1))
+
+    def reserve(self):
+        """
+        Takes a token, borrowing from the future if the bucket is empty.
+        :return: Seconds the caller has to wait before making its request.
+        """
+        if not self.rate:
+            return 0.0
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self):
+        """
+        Waits asynchronously until a request is allowed.
+        :return: Seconds waited.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def acquire_blocking(self):
+        """
+        Blocks until a request is allowed.
+        :return: Seconds waited.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def backoff_delay(attempt, base, cap, rng=random):
+    """
+    Exponential backoff with full jitter.
+    :param attempt: Zero-based number of the failed attempt.
+    :param base: Delay ceiling in seconds after the first failure.
+    :param cap: Maximum delay ceiling in seconds.
+    :param rng: Random number generator.
+    :return: Random delay between 0 and min(cap, base * 2 ** attempt).
+    """
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class FetchPipeline:
+    """
+    Fetches job details through a JobFetcher within the configured request budget.
+    """
+
+    def __init__(self, fetcher, pipeline_config=None, bucket=None, rng=None):
+        """
+        :param fetcher: JobFetcher that loads a single job.
+        :param pipeline_config: `pipeline` section of `scan.yaml` with `requests_per_minute`,
+            `burst`, `concurrency`, `retries`, `backoff_base` and `backoff_max`.
+        :param bucket: Optional TokenBucket to share a budget with other pipelines.
+        :param rng: Optional random.Random instance for the backoff jitter.
+        """
+        pipeline_config = pipeline_config or {}
+        self.fetcher = fetcher
+        self.concurrency = max(1, pipeline_config.get("concurrency", 8))
+        self.retries = pipeline_config.get("retries", 2)
+        self.backoff_base = pipeline_config.get("backoff_base", 2)
+        self.backoff_max = pipeline_config.get("backoff_max", 60)
+        self.bucket = bucket or TokenBucket.from_config(pipeline_config)
+        self.rng = rng or random.Random()
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.retried = 0
+        self.failures = 0
+        self.throttled_seconds = 0.0
+        self.started_at = None
+
+    def start(self):
+        if self.started_at is None:
+            self.started_at = time.time()
+
+    def fetch_one(self, job_id):
+        """
+        Fetches one job within the budget. After a failure the pipeline backs off before
+        raising, and keeps backing off longer while failures continue.
+        :param job_id: Job ID to fetch.
+        :return: Details dictionary from the fetcher.
+        """
+        self.start()
+        self.throttled_seconds += self.bucket.acquire_blocking()
+        self.requests += 1
+        try:
+            details = self.fetcher.fetch_job(job_id)
+        except Exception:
+            self.failures += 1
+            time.sleep(
+                backoff_delay(self.consecutive_failures, self.backoff_base, self.backoff_max, self.rng)
+            )
+            self.consecutive_failures += 1
+            raise
+        self.consecutive_failures = 0
+        return details
+
+    def prefetch(self, job_ids):
+        """
+        Fetches the jobs of a results page concurrently if the fetcher does not need the
+        browser; browser fetchers are left to `fetch_one`.
+        :param job_ids: Job IDs about to be processed.
+        :return: Dictionary of job ID -> details dictionary, or the exception that made
+            the last attempt fail.
+        """
+        if self.fetcher.uses_browser or not job_ids:
+            return {}
+        self.start()
+        results = asyncio.run(self.fetch_all(job_ids))
+        failed = sum(isinstance(result, Exception) for result in results.values())
+        if failed:
+            print(f"{Colors.WARNING}{failed} of {len(job_ids)} job pages failed to load{Colors.ENDC}")
+        return results
+
+    async def fetch_all(self, job_ids):
+        """
+        Fetches every job with at most `concurrency` requests in flight. The blocking
+        fetcher runs in a thread pool of the same size.
+        :param job_ids: Job IDs to fetch.
+        :return: Dictionary of job ID -> details dictionary or exception.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(job_ids))) as executor:
+
+            async def fetch(job_id):
+                for attempt in range(self.retries + 1):
+                    # Reserve the request slot first so waiting requests keep their order.
+                    # The counter is read only after the await, or concurrent waits would be lost
+                    waited = await self.bucket.acquire()
+                    self.throttled_seconds += waited
+                    async with semaphore:
+                        self.requests += 1
+                        try:
+                            return job_id, await loop.run_in_executor(
+                                executor, self.fetcher.fetch_job, job_id
+                            )
+                        except PermissionError as e:
+                            # The session expired; retrying will not help
+                            self.failures += 1
+                            return job_id, e
+                        except Exception as e:
+                            if attempt == self.retries:
+                                self.failures += 1
+                                return job_id, e
+                    self.retried += 1
+                    await asyncio.sleep(
+                        backoff_delay(attempt, self.backoff_base, self.backoff_max, self.rng)
+                    )
+
+            return dict(await asyncio.gather(*(fetch(job_id) for job_id in job_ids)))
+
+    def requests_per_minute(self):
+        """
+        :return: Achieved request rate since the first request.
+        """
+        elapsed = time.time() - self.started_at if self.started_at else 0
+        return self.requests * 60 / elapsed if elapsed > 0 else 0.0
+
+    def print_report(self):
+        """
+        Prints the number of requests, retries and failures and the achieved request rate.
+        """
+        if not self.requests:
+            return
+        budget = f"{self.bucket.rate * 60:.0f}/minute" if self.bucket.rate else "unlimited"
+        print(
+            f"{Colors.OKCYAN}Detail requests: {self.requests} ({self.retried} retried, "
+            f"{self.failures} failed), {self.requests_per_minute():.1f}/minute "
+            f"(budget {budget}), {self.throttled_seconds:.1f}s waiting for the budget{Colors.ENDC}"
+        )
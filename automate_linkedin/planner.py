@@ -0,0 +1,305 @@
+import threading
+import time
+from collections import namedtuple
+from automate_linkedin.scraper import (
+    EXPERIENCE_LEVEL_CODES,
+    JOB_TYPE_CODES,
+    MAX_PAGES,
+    RESULTS_PER_PAGE,
+    WORK_MODE_CODES,
+    LinkedInScraper,
+    ScanState,
+)
+from automate_linkedin.utils import Colors
+
+"""
+Scan Planner
+============
+
+Runs several searches in one scan. `job_filters.yaml` can list search profiles under
+`searches`; each entry overrides some of the base filters (e.g. other `keywords` or
+another `location`) and inherits the rest. Without `searches` the base filters form the
+only profile.
+
+- All searches share one ScanState: `max_jobs` is a budget for the whole scan, and the
+  shared SeenJobs set makes sure a job returned by several searches is fetched once.
+- The hit rate of every search is stored in the `search_stats` table. Searches are run
+  in order of expected yield, i.e. saved jobs per scanned card, smoothed so that new
+  searches (without history) start at 50% and are tried early.
+- In incremental mode (`incremental` in `scan.yaml`) every search keeps a high-water
+  mark in `scan_cursors`: the newest job ID of its last complete scan. The scraper stops
+  paging once it reaches pages that hold only known jobs, and the mark is raised only
+  when a search finished without being cut short by `max_jobs` or an error, so jobs
+  below it are never skipped unseen.
+- LinkedIn shows at most 1000 results (40 pages) for a search. A search reporting more
+  is split into slices that each list one of its job types, then work modes (all three
+  if it sets none), then experience levels, then the `sub_locations` configured for its
+  location, and the slices are scanned instead, recursively, until each fits. A search
+  that cannot be split further is scanned up to 1000 results with a warning. Together the slices match
+  the same jobs as the original search; jobs in several slices are fetched once.
+"""
+
+SearchProfile = namedtuple("SearchProfile", ["name", "filters", "search_url", "expected_yield"])
+
+MAX_RESULTS = MAX_PAGES * RESULTS_PER_PAGE
+
+# List filters a search is split along, in order, with the values LinkedIn accepts and
+# whether those values cover every job, so a search without the filter can be split
+# along all of them (LinkedIn has job types and experience levels that are not listed)
+SPLIT_FILTERS = (
+    ("job_type", JOB_TYPE_CODES, False),
+    ("work_mode", WORK_MODE_CODES, True),
+    ("experience_level", EXPERIENCE_LEVEL_CODES, False),
+)
+
+
+def expected_yield(stats):
+    """
+    :param stats: Dictionary with the `scanned` and `saved` totals of a search, or None.
+    :return: Smoothed share of scanned cards that were saved, (saved + 1) / (scanned + 2).
+    """
+    stats = stats or {}
+    return (stats.get("saved", 0) + 1) / (stats.get("scanned", 0) + 2)
+
+
+class ScanPlanner:
+    """
+    Builds the search profiles from the filters, orders them by expected yield, and scans
+    them one after another with a shared ScanState.
+    """
+
+    def __init__(self, filters, cache):
+        """
+        :param filters: Dictionary from `job_filters.yaml`, optionally with `searches`.
+        :param cache: Database instance holding the search statistics.
+        """
+        self.filters = filters
+        self.cache = cache
+        self.stats = {}
+        self.cursors = {}
+        # Search URL -> slices it was split into ([] if it fits), shared by parallel workers
+        self.splits = {}
+        # Search URL -> (newest job ID found, True while every scan of it was complete)
+        self.cursor_updates = {}
+        self.lock = threading.Lock()
+
+    def profiles(self):
+        """
+        :return: List of (name, filters) tuples, one per search profile, in config order.
+        """
+        base = {key: value for key, value in self.filters.items() if key != "searches"}
+        profiles = []
+        for index, overrides in enumerate(self.filters.get("searches") or [{}]):
+            profile_filters = dict(base)
+            profile_filters.update(overrides or {})
+            name = profile_filters.pop("name", None) or (
+                ", ".join(profile_filters.get("keywords", [])) or f"search {index + 1}"
+            )
+            profiles.append((name, profile_filters))
+        return profiles
+
+    def plan(self):
+        """
+        :return: List of SearchProfile tuples, highest expected yield first. Profiles
+            that produce the same search URL are scanned once.
+        """
+        stats = self.stats = self.cache.search_stats()
+        self.cursors = self.cache.scan_cursors()
+        plan, search_urls = [], set()
+        for name, profile_filters in self.profiles():
+            search_url = LinkedInScraper.generate_search_url(profile_filters)
+            if search_url in search_urls:
+                print(f"{Colors.WARNING}Search '{name}' duplicates another search; skipping it{Colors.ENDC}")
+                continue
+            search_urls.add(search_url)
+            plan.append(
+                SearchProfile(name, profile_filters, search_url, expected_yield(stats.get(search_url)))
+            )
+        # sorted() is stable, so searches with the same yield keep their config order
+        return sorted(plan, key=lambda profile: -profile.expected_yield)
+
+    def print_plan(self, plan):
+        """
+        Prints the searches in the order they will be scanned.
+        :param plan: List of SearchProfile tuples.
+        """
+        if len(plan) < 2:
+            return
+        print(f"{Colors.HEADER}Search plan:{Colors.ENDC}")
+        for index, profile in enumerate(plan):
+            print(
+                f"{Colors.OKCYAN}{index + 1}. {profile.name} "
+                f"(expected yield {profile.expected_yield:.0%}){Colors.ENDC}"
+            )
+
+    def split_profile(self, profile):
+        """
+        Splits a search into slices that together match the same jobs: one slice per
+        listed job type, else per work mode (every work mode if none is set), else per
+        experience level, else per sub-location from `sub_locations`.
+        :param profile: SearchProfile with too many results.
+        :return: List of SearchProfile slices, or an empty list if it cannot be split.
+        """
+        filters = profile.filters
+        for key, codes, covering in SPLIT_FILTERS:
+            values = list(dict.fromkeys(value for value in filters.get(key) or [] if value in codes))
+            if not filters.get(key) and covering:
+                values = list(codes)
+            if len(values) > 1:
+                return [self.slice_profile(profile, value, dict(filters, **{key: [value]})) for value in values]
+        sub_locations = (filters.get("sub_locations") or {}).get(filters.get("location")) or []
+        if len(sub_locations) > 1:
+            return [
+                self.slice_profile(profile, location, dict(filters, location=location))
+                for location in dict.fromkeys(sub_locations)
+            ]
+        return []
+
+    def slice_profile(self, profile, label, slice_filters):
+        """
+        :return: SearchProfile of one slice of a split search.
+        """
+        search_url = LinkedInScraper.generate_search_url(slice_filters)
+        return SearchProfile(
+            f"{profile.name} / {label}",
+            slice_filters,
+            search_url,
+            expected_yield(self.stats.get(search_url)),
+        )
+
+    def get_slices(self, profile, total_results):
+        """
+        Decides whether a search has to be split. The first worker to read the result
+        count decides for all, so every worker shards the same slices.
+        :param profile: SearchProfile that was just opened.
+        :param total_results: Result count shown for it.
+        :return: List of SearchProfile slices, or an empty list to scan the search itself.
+        """
+        with self.lock:
+            if profile.search_url not in self.splits:
+                slices = []
+                if total_results > MAX_RESULTS and not self.filters.get("split_searches", True):
+                    print(
+                        f"{Colors.WARNING}{profile.name}: {total_results} results, only the first "
+                        f"{MAX_RESULTS} can be scanned; `split_searches` is off{Colors.ENDC}"
+                    )
+                elif total_results > MAX_RESULTS:
+                    slices = self.split_profile(profile)
+                    if slices:
+                        print(
+                            f"{Colors.WARNING}{profile.name}: {total_results} results exceed the "
+                            f"{MAX_RESULTS} LinkedIn shows; splitting it into {len(slices)} searches{Colors.ENDC}"
+                        )
+                    else:
+                        print(
+                            f"{Colors.WARNING}{profile.name}: {total_results} results, only the first "
+                            f"{MAX_RESULTS} can be scanned; add `sub_locations` to split it{Colors.ENDC}"
+                        )
+                self.splits[profile.search_url] = slices
+            return self.splits[profile.search_url]
+
+    def scan_profile(self, scraper, profile, state, pages=None, new_run=True):
+        """
+        Runs one search and records its counters in `search_stats`. A search with more
+        results than LinkedIn shows is scanned as slices instead (see `split_profile`).
+        :param scraper: Logged-in LinkedInScraper.
+        :param profile: SearchProfile to scan.
+        :param state: ScanState shared by all searches of the scan.
+        :param pages: Optional iterable of page numbers, or a callable that receives the
+            number of result pages and returns them. Defaults to every result page.
+        :param new_run: False when another worker already records a run of this search.
+        """
+        print(f"{Colors.HEADER}Searching: {profile.name}{Colors.ENDC}")
+        scraper.search_jobs(profile.filters)
+        total_results = scraper.get_total_results()
+        slices = self.get_slices(profile, total_results)
+
+        scanned, skipped = state.total_scans, len(state.skipped_jobs)
+        duplicates, saved = len(state.duplicate_jobs), state.jobs_scanned
+        complete = False
+        try:
+            if slices:
+                for search_slice in slices:
+                    if state.limit_reached():
+                        break
+                    self.scan_profile(scraper, search_slice, state, pages, new_run)
+            else:
+                total_pages = scraper.get_total_pages(total_results)
+                if pages is None:
+                    pages = range(total_pages)
+                elif callable(pages):
+                    pages = pages(total_pages)
+                scraper.extract_job_details(
+                    profile.filters,
+                    self.cache,
+                    pages=pages,
+                    state=state,
+                    summary=False,
+                    cursor=self.cursors.get(profile.search_url) if scraper.incremental else None,
+                )
+                complete = not state.limit_reached()
+        finally:
+            # The slices of a split search keep their own high-water marks
+            if scraper.incremental and not slices:
+                self.note_cursor(profile.search_url, scraper.newest_job_id, complete)
+            scanned = state.total_scans - scanned
+            duplicates = len(state.duplicate_jobs) - duplicates
+            self.cache.record_search_run(
+                profile.search_url,
+                profile.name,
+                scanned,
+                scanned - (len(state.skipped_jobs) - skipped) - duplicates,
+                state.jobs_scanned - saved,
+                new_run=new_run,
+            )
+
+    def note_cursor(self, search_url, newest_job_id, complete):
+        """
+        Remembers the newest job ID one scraper found for a search. Parallel workers each
+        report their own pages; the mark is only saved if all of them were complete.
+        :param search_url: Search URL of the profile.
+        :param newest_job_id: Newest job ID found, or None.
+        :param complete: False if the scan was cut short.
+        """
+        with self.lock:
+            newest, all_complete = self.cursor_updates.get(search_url, (None, True))
+            if newest_job_id is not None:
+                newest = max(newest or newest_job_id, newest_job_id)
+            self.cursor_updates[search_url] = (newest, all_complete and complete)
+
+    def save_cursors(self):
+        """
+        Raises the high-water mark of every search whose scans were all complete.
+        """
+        with self.lock:
+            for search_url, (newest, complete) in self.cursor_updates.items():
+                if complete and newest is not None:
+                    self.cache.advance_scan_cursor(search_url, newest)
+            self.cursor_updates = {}
+
+    def run(self, scraper, state=None, checkpoint=None):
+        """
+        Scans every search profile in order of expected yield until `max_jobs` relevant
+        jobs are saved, then prints one summary for the whole scan.
+        :param scraper: Logged-in LinkedInScraper.
+        :param state: Optional ScanState to accumulate counters into.
+        :param checkpoint: Optional ScanCheckpoint to record progress in; a resumed
+            checkpoint also restores the progress made before the interruption.
+        :return: ScanState of the scan.
+        """
+        plan = self.plan()
+        self.print_plan(plan)
+        if state is None:
+            state = ScanState(self.filters["max_jobs"], checkpoint=checkpoint)
+        if checkpoint is not None and checkpoint.resumed:
+            checkpoint.restore(state)
+        for profile in plan:
+            if state.limit_reached():
+                break
+            self.scan_profile(scraper, profile, state)
+        self.save_cursors()
+        if checkpoint is not None:
+            checkpoint.finish()
+        state.finished_at = time.time()
+        scraper.print_scan_summary(state)
+        return state
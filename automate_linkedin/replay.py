@@ -0,0 +1,335 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+from automate_linkedin import extraction
+
+"""
+Recorded Scans
+==============
+
+`PageRecorder` saves the pages a real scan reads: every search results page and, for
+every job opened in the browser, the page as it looked once the job's details were
+shown. Set `replay.record_dir` in `scan.yaml` to record a scan.
+
+`ReplayDriver` serves such a recording through the subset of the WebDriver API the
+scraper uses (`get`, `find_element(s)`, `execute_script`, `back`, `current_url`,
+`page_source`, cookies), evaluating the XPaths from `xpaths.yaml` with lxml. Scans then
+run end to end (search, extraction, scoring and database writes) without a browser or a
+LinkedIn account; `benchmarks/bench_replay.py` uses it to measure throughput and memory.
+
+Recording layout:
+
+    index.json                  {"search": {search page URL: file name}}
+    search/<hash>.html.gz       results pages
+    jobs/<job_id>.html.gz       job pages
+"""
+
+INDEX_FILE = "index.json"
+
+
+def search_file_name(url):
+    """
+    :param url: Search results page URL.
+    :return: File name of the recorded page, derived from the URL.
+    """
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html.gz"
+
+
+def page_offset(url):
+    """
+    :param url: Search results page URL.
+    :return: The `start` offset of the page (0 if absent).
+    """
+    try:
+        return int(parse_qs(urlparse(url).query).get("start", ["0"])[-1])
+    except ValueError:
+        return 0
+
+
+class PageRecorder:
+    """
+    Writes the pages of a scan to a recording directory.
+    """
+
+    def __init__(self, record_dir):
+        """
+        :param record_dir: Directory of the recording; created if missing. Recording into
+            an existing directory adds to it.
+        """
+        self.record_dir = os.path.expanduser(record_dir)
+        os.makedirs(os.path.join(self.record_dir, "search"), exist_ok=True)
+        os.makedirs(os.path.join(self.record_dir, "jobs"), exist_ok=True)
+        self.lock = threading.Lock()
+        self.index = {"search": {}}
+        try:
+            with open(os.path.join(self.record_dir, INDEX_FILE), encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def write_page(self, path, page_source):
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(page_source)
+
+    def record_search(self, url, page_source):
+        """
+        Saves a search results page.
+        :param url: URL the page was loaded from.
+        :param page_source: HTML of the page.
+        """
+        name = search_file_name(url)
+        self.write_page(os.path.join(self.record_dir, "search", name), page_source)
+        with self.lock:
+            self.index["search"][url] = name
+            fd, tmp_path = tempfile.mkstemp(dir=self.record_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, indent=1)
+            os.replace(tmp_path, os.path.join(self.record_dir, INDEX_FILE))
+
+    def record_job(self, job_id, page_source):
+        """
+        Saves the page showing a job's details.
+        :param job_id: Job ID.
+        :param page_source: HTML of the page with the job opened.
+        """
+        self.write_page(os.path.join(self.record_dir, "jobs", f"{job_id}.html.gz"), page_source)
+
+
+class ReplayElement:
+    """
+    WebElement stand-in backed by an lxml element.
+    """
+
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.element = element
+
+    @property
+    def text(self):
+        self.driver.round_trip()
+        return ReplayDriver.element_text(self.element)
+
+    def get_attribute(self, name):
+        self.driver.round_trip()
+        return self.element.get(name)
+
+    def click(self):
+        self.driver.round_trip()
+        self.driver.click(self.element)
+
+    def send_keys(self, *values):
+        self.driver.round_trip()
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise self.driver.no_such_element(value)
+        return elements[0]
+
+    def find_elements(self, by, value):
+        self.driver.round_trip()
+        return [ReplayElement(self.driver, e) for e in self.driver.select(by, value, self.element)]
+
+
+class ReplayDriver:
+    """
+    Serves a recording through the WebDriver calls used by `LinkedInScraper`.
+
+    Results pages are looked up by URL; if a URL was not recorded (e.g. a replay with
+    other filters), the recorded page with the same `start` offset is served. Clicking a
+    job card, or opening `/jobs/view/{job_id}`, shows the recorded page of that job.
+    Every WebDriver call counts as a round trip and can be delayed by `latency` seconds
+    to model the HTTP hop to chromedriver.
+    """
+
+    EMPTY_PAGE = "<html><body><nav class='global-nav'></nav></body></html>"
+
+    def __init__(self, record_dir, latency=0.0):
+        """
+        :param record_dir: Directory written by PageRecorder.
+        :param latency: Seconds added to every WebDriver call.
+        """
+        # lxml is only needed to replay recordings, so it is imported on demand
+        try:
+            from lxml import html
+            from selenium.common.exceptions import NoSuchElementException
+        except ImportError as e:
+            raise ImportError("Replaying recorded scans requires lxml (pip install lxml)") from e
+
+        self.html = html
+        self.no_such_element = NoSuchElementException
+        self.record_dir = os.path.expanduser(record_dir)
+        with open(os.path.join(self.record_dir, INDEX_FILE), encoding="utf-8") as f:
+            self.index = json.load(f)["search"]
+        self.by_offset = {}
+        for url, name in self.index.items():
+            self.by_offset.setdefault(page_offset(url), name)
+        self.latency = latency
+        self.round_trips = 0
+        self.url = "about:blank"
+        self.history = []
+        self.cookies = []
+        self.document = html.fromstring(self.EMPTY_PAGE)
+        self.source = self.EMPTY_PAGE
+
+    @staticmethod
+    def element_text(element):
+        """Approximates WebElement.text: whitespace-normalized text content."""
+        return " ".join(element.text_content().split())
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def read_page(self, *parts):
+        """
+        :return: HTML of a recorded page, or None if it was not recorded.
+        """
+        path = os.path.join(self.record_dir, *parts)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def load(self, url, source):
+        self.url = url
+        self.source = source if source is not None else self.EMPTY_PAGE
+        self.document = self.html.fromstring(self.source)
+
+    def select(self, by, value, context=None):
+        context = context if context is not None else self.document
+        if by == "tag name":
+            return list(context.iter(value)) if context is not self.document else self.document.xpath(f"//{value}")
+        return context.xpath(value)
+
+    def first(self, xpath, context=None):
+        nodes = (context if context is not None else self.document).xpath(xpath)
+        return nodes[0] if nodes else None
+
+    # WebDriver API
+
+    @property
+    def current_url(self):
+        self.round_trip()
+        return self.url
+
+    @property
+    def page_source(self):
+        self.round_trip()
+        return self.source
+
+    def get(self, url):
+        self.round_trip()
+        self.history.append(self.url)
+        job_path = urlparse(url).path
+        if job_path.startswith("/jobs/view/"):
+            job_id = job_path.rstrip("/").rsplit("/", 1)[-1]
+            self.load(url, self.read_page("jobs", f"{job_id}.html.gz"))
+            return
+        name = self.index.get(url)
+        if name is None and "/jobs/search" in url:
+            name = self.by_offset.get(page_offset(url))
+        self.load(url, self.read_page("search", name) if name else None)
+
+    def back(self):
+        self.round_trip()
+        if self.history:
+            previous = self.history.pop()
+            self.get(previous)
+            self.history.pop()
+
+    def find_elements(self, by, value):
+        self.round_trip()
+        return [ReplayElement(self, e) for e in self.select(by, value)]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise self.no_such_element(value)
+        return elements[0]
+
+    def click(self, element):
+        """Opens the recorded job page when a job card is clicked."""
+        job_id = element.get("data-occludable-job-id")
+        if job_id is None:
+            return
+        source = self.read_page("jobs", f"{job_id}.html.gz")
+        if source is not None:
+            search_url = self.url.split("&currentJobId=")[0]
+            self.load(f"{search_url}&currentJobId={job_id}", source)
+
+    def execute_script(self, script, *args):
+        """Runs the Python equivalent of the scripts the scraper sends to the browser."""
+        self.round_trip()
+        if script == extraction.PAGE_CARDS_SCRIPT:
+            xp = args[0]
+            cards = []
+            for card in self.document.xpath(xp["job_card"]):
+                title, company = self.first(xp["card_title"], card), self.first(xp["card_company"], card)
+                cards.append(
+                    {
+                        "job_id": card.get("data-occludable-job-id"),
+                        "title": self.element_text(title) if title is not None else None,
+                        "company": self.element_text(company) if company is not None else None,
+                    }
+                )
+            return cards
+        if script == extraction.CLICK_CARD_SCRIPT:
+            card = self.first(args[0])
+            if card is None:
+                return False
+            self.click(card)
+            return True
+        if script == extraction.SHOWN_JOB_SCRIPT:
+            xp = args[0]
+            shown = {"url": self.url}
+            for key, xpath_key in (("title", "job_title"), ("company", "company")):
+                node = self.first(xp[xpath_key])
+                shown[key] = self.element_text(node) if node is not None else None
+            return shown
+        if script in (extraction.JOB_DETAILS_SCRIPT, extraction.DESCRIPTION_SCRIPT):
+            xp = args[0] if script == extraction.JOB_DETAILS_SCRIPT else {"full_description": args[0]}
+            description = self.first(xp["full_description"])
+            full_description = (
+                " ".join(self.element_text(span) for span in description.iter("span") if span is not description)
+                if description is not None
+                else None
+            )
+            if script == extraction.DESCRIPTION_SCRIPT:
+                return full_description
+            values = {}
+            for key, xpath_key in (
+                ("title", "job_title"),
+                ("company", "company"),
+                ("primary_description", "primary_description"),
+            ):
+                node = self.first(xp[xpath_key])
+                values[key] = self.element_text(node) if node is not None else None
+            values["full_description"] = full_description
+            values["show_more"] = self.first(xp["show_more_button"]) is not None
+            return values
+        if "click()" in script and args and isinstance(args[0], ReplayElement):
+            self.click(args[0].element)
+        return None
+
+    def get_cookies(self):
+        self.round_trip()
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.round_trip()
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        self.round_trip()
+        self.cookies = []
+
+    def quit(self):
+        pass
@@ -0,0 +1,131 @@
+from automate_linkedin.utils import Colors
+
+"""
+Job Reports
+===========
+
+The `apply` and `stats` modes only read the database, so they live here rather than in
+`scraper.py`; importing this module does not load Selenium.
+"""
+
+
+def recommend_and_apply_jobs(cache, resume_config):
+    """
+    Recommends jobs based on ranking and suggests the best resume to use.
+    Allows users to manually mark jobs as applied or skipped.
+    :param cache: Database instance for querying job details.
+    :param resume_config: Dictionary containing resume information and their associated keywords.
+    """
+    resumes = resume_config["resumes"]
+    applications_limit = resume_config.get("applications", 0)
+    applications_completed = 0
+
+    # Reposts of one description share a cluster; suggest only its best-scored job, and
+    # none of it once any repost has been applied to. Only the printed columns are read,
+    # and pending jobs are found through idx_jobs_applied_points.
+    jobs = cache.query_jobs(
+        """
+        SELECT job_id, title, company, location, points, job_link, matched_keywords, reposts
+        FROM (
+            SELECT job_id, title, company, location, points, job_link, matched_keywords,
+                ROW_NUMBER() OVER cluster AS rank,
+                COUNT(*) OVER cluster - 1 AS reposts
+            FROM jobs
+            WHERE applied = 0 AND COALESCE(cluster_id, job_id) NOT IN (
+                SELECT COALESCE(cluster_id, job_id) FROM jobs WHERE applied = 1
+            )
+            WINDOW cluster AS (
+                PARTITION BY COALESCE(cluster_id, job_id) ORDER BY points DESC, date_posted DESC
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+        )
+        WHERE rank = 1
+        ORDER BY points DESC
+    """
+    )
+
+    print(
+        f"{Colors.OKCYAN}Applications to complete: {applications_limit}{Colors.ENDC}"
+    )
+    for job in jobs:
+        if applications_completed >= applications_limit:
+            print(
+                f"{Colors.OKGREEN}Congratulations! You applied for {applications_completed} jobs.{Colors.ENDC}"
+            )
+            break
+
+        job_id, title, company, location, points, job_link, matched_keywords, reposts = job
+        matched_keywords_list = (
+            matched_keywords.split(", ") if matched_keywords else []
+        )
+
+        # Recommend resume based on matched keywords
+        suggested_resume = select_resume(matched_keywords_list, resumes)
+
+        print(
+            f"{Colors.OKBLUE}---------------------------------------------------------------------------{Colors.ENDC}"
+        )
+        print(f"{Colors.HEADER} {title} | {company} | {location}")
+        print(f"{Colors.OKCYAN}{matched_keywords_list}{Colors.ENDC}")
+        print(f"Link: {Colors.OKBLUE}{job_link}{Colors.ENDC}")
+        if reposts:
+            print(f"{Colors.WARNING}Also posted as {reposts} other job(s){Colors.ENDC}")
+        print(f"Suggested Resume: {Colors.OKGREEN}{suggested_resume}{Colors.ENDC}")
+        print(
+            f"{Colors.OKBLUE}---------------------------------------------------------------------------{Colors.ENDC}"
+        )
+
+        # Prompt user input for application
+        user_input = (
+            input(
+                f" {Colors.BOLD} Did you apply for Job ID {job_id}? (yes/no): {Colors.ENDC}"
+            )
+            .strip()
+            .lower()
+        )
+        if user_input == "yes":
+            print(f"Marking Job ID {job_id} as applied...")
+            cache.update_job_as_applied(job_id)
+            applications_completed += 1
+        else:
+            print(f"{Colors.WARNING}Skipped Job ID {job_id}.{Colors.ENDC}")
+
+
+def select_resume(matched_keywords, resumes):
+    """
+    Selects the most appropriate resume based on matched keywords in job description.
+    :param matched_keywords: List of keywords found in the job description.
+    :param resumes: Dictionary of resumes and their associated keywords.
+    :return: Name of the best resume file.
+    """
+    best_resume = None
+    max_matches = 0
+
+    for resume, keywords in resumes.items():
+        matches = sum(
+            1
+            for keyword in matched_keywords
+            if keyword.lower() in map(str.lower, keywords)
+        )
+        if matches > max_matches:
+            best_resume = resume
+            max_matches = matches
+
+    return best_resume if best_resume else "default_resume.pdf"
+
+
+def generate_stats(cache):
+    """
+    Generates and displays statistics about the jobs in the database.
+    :param cache: Database instance for querying job details.
+    """
+    total_jobs = cache.query_jobs("SELECT COUNT(*) FROM jobs")[0][0]
+    applied_jobs = cache.query_jobs("SELECT COUNT(*) FROM jobs WHERE applied = 1")[0][0]
+    unique_companies = cache.query_jobs("SELECT COUNT(DISTINCT company) FROM jobs")[0][0]
+    unique_postings = cache.query_jobs("SELECT COUNT(DISTINCT COALESCE(cluster_id, job_id)) FROM jobs")[0][0]
+
+    print(f"{Colors.HEADER}Job Statistics:{Colors.ENDC}")
+    print(f"Total Jobs: {total_jobs}")
+    print(f"Total Applications: {applied_jobs}")
+    print(f"Unique Companies: {unique_companies}")
+    print(f"Unique Postings (Reposts Merged): {unique_postings}")
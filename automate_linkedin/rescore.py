@@ -0,0 +1,147 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from automate_linkedin.matcher import KeywordMatcher
+from automate_linkedin.utils import Colors
+
+"""
+Offline Re-scoring
+==================
+
+Recomputes `points` and `matched_keywords` for jobs already stored in `job_cache.db`
+after `job_filters.yaml` changes, without visiting LinkedIn again. Stored descriptions
+are read in chunks and scored across a process pool; results are written back in
+batched transactions. Jobs already scored with the current filters (same `score_hash`)
+are skipped.
+"""
+
+# Matcher used by the pool workers; built once per process by `init_worker`
+_worker_matcher = None
+
+
+def init_worker(matcher_config):
+    """
+    Builds the keyword matcher inside a pool worker process.
+    :param matcher_config: Plain dictionary from `KeywordMatcher.config()`.
+    """
+    global _worker_matcher
+    _worker_matcher = KeywordMatcher(
+        matcher_config["positive"],
+        matcher_config["negative"],
+        matcher_config["best"],
+        whole_words=matcher_config["whole_words"],
+    )
+
+
+def score_rows(rows, matcher=None):
+    """
+    Scores a chunk of stored jobs with the same rules as the scanner: the description
+    provides the points, and a negative keyword in the title marks the job irrelevant.
+    :param rows: List of (job_id, title, full_description) tuples.
+    :param matcher: KeywordMatcher to use; defaults to the worker's matcher.
+    :return: List of (points, matched_keywords, job_id) tuples.
+    """
+    matcher = matcher or _worker_matcher
+    results = []
+    for job_id, title, full_description in rows:
+        points, pos, _, _ = matcher.match(full_description or "")
+        level = matcher.match(title or "").points
+        if level < 0:
+            points = -1
+        results.append((points, ", ".join(pos), job_id))
+    return results
+
+
+class JobRescorer:
+    """
+    Re-applies the keyword filters to every stored job whose score is out of date.
+    """
+
+    def __init__(self, cache, filters, workers=None, chunk_size=500):
+        """
+        :param cache: JobCache instance holding the stored jobs.
+        :param filters: Dictionary containing the `description` keyword filters.
+        :param workers: Number of scoring processes. Defaults to the number of CPUs;
+            1 scores in the current process.
+        :param chunk_size: Number of jobs read, scored, and committed at a time.
+        """
+        self.cache = cache
+        self.matcher = KeywordMatcher.from_filters(filters)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def stale_chunks(self, score_hash):
+        """
+        Yields chunks of jobs not yet scored with `score_hash`, paging by job ID so rows
+        can be updated while the scan is in progress.
+        :param score_hash: Hash of the current filters.
+        """
+        last_job_id = ""
+        while True:
+            rows = self.cache.query_jobs(
+                """
+                SELECT jobs.job_id, jobs.title, job_descriptions.full_description
+                FROM jobs JOIN job_descriptions ON job_descriptions.job_rowid = jobs.rowid
+                WHERE jobs.job_id > ? AND jobs.score_hash IS NOT ?
+                ORDER BY jobs.job_id LIMIT ?
+            """,
+                (last_job_id, score_hash, self.chunk_size),
+            )
+            if not rows:
+                return
+            last_job_id = rows[-1][0]
+            yield rows
+
+    def save(self, results, score_hash):
+        """
+        Writes one chunk of new scores in a single transaction.
+        :param results: List of (points, matched_keywords, job_id) tuples.
+        :param score_hash: Hash of the filters the scores were computed with.
+        """
+        with self.cache.batch(flush_rows=len(results) + 1):
+            for points, matched_keywords, job_id in results:
+                self.cache.write(
+                    "UPDATE jobs SET points = ?, matched_keywords = ?, score_hash = ? WHERE job_id = ?",
+                    (points, matched_keywords, score_hash, job_id),
+                )
+
+    def run(self):
+        """
+        Re-scores all stale jobs and prints a summary.
+        :return: Number of jobs re-scored.
+        """
+        score_hash = self.matcher.config_hash()
+        total = self.cache.query_jobs("SELECT COUNT(*) FROM jobs")[0][0]
+        rescored = 0
+        start = time.perf_counter()
+
+        print(f"{Colors.HEADER}Re-scoring stored jobs with the current filters...{Colors.ENDC}")
+        if self.workers == 1:
+            for rows in self.stale_chunks(score_hash):
+                self.save(score_rows(rows, self.matcher), score_hash)
+                rescored += len(rows)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(self.matcher.config(),),
+            ) as executor:
+                # Keep a bounded number of chunks in flight so memory stays flat
+                pending = []
+                for rows in self.stale_chunks(score_hash):
+                    pending.append(executor.submit(score_rows, rows))
+                    if len(pending) >= self.workers * 2:
+                        results = pending.pop(0).result()
+                        self.save(results, score_hash)
+                        rescored += len(results)
+                for future in pending:
+                    results = future.result()
+                    self.save(results, score_hash)
+                    rescored += len(results)
+
+        elapsed = time.perf_counter() - start
+        print(f"{Colors.OKCYAN}Re-scored Jobs: {rescored}{Colors.ENDC}")
+        print(f"{Colors.WARNING}Unchanged Jobs (already scored with these filters): {total - rescored}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}Finished in {elapsed:.2f}s{Colors.ENDC}")
+        return rescored
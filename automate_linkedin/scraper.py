@@ -1,12 +1,165 @@
 import math
+import re
+import threading
 import time
-import random
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from automate_linkedin import reports
+from automate_linkedin.extraction import BulkExtractor
+from automate_linkedin.fetchers import create_fetcher
+from automate_linkedin.pipeline import FetchPipeline
+from automate_linkedin.matcher import KeywordMatcher
+from automate_linkedin.metrics import NULL_METRICS
+from automate_linkedin.replay import PageRecorder
+from automate_linkedin.session import SessionStore
 from automate_linkedin.utils import Colors
+from automate_linkedin.waits import JitterPolicy, PageWaiter
 from datetime import datetime, timedelta
 
+# Job shown by a results page (`currentJobId=...`) or a job page (`/jobs/view/...`)
+URL_JOB_ID = re.compile(r"(?:[?&]currentJobId=|/jobs/view/)(\d+)")
+
+# LinkedIn shows at most 40 pages of 25 results for a search
+RESULTS_PER_PAGE = 25
+MAX_PAGES = 40
+
+# Search URL codes of the list filters in `job_filters.yaml`
+JOB_TYPE_CODES = {
+    "Full-time": "F",
+    "Part-time": "P",
+    "Contract": "C",
+    "Internship": "I",
+    "Temporary": "T",
+}
+WORK_MODE_CODES = {"Remote": "1", "Hybrid": "2", "Onsite": "3"}
+EXPERIENCE_LEVEL_CODES = {
+    "Internship": "1",
+    "Entry level": "2",
+    "Associate": "3",
+    "Mid-Senior level": "4",
+    "Director": "5",
+    "Executive": "6",
+}
+
+
+def job_id_number(job_id):
+    """
+    :param job_id: Job ID as read from a job card.
+    :return: The job ID as an integer, or None if it is not numeric. LinkedIn assigns
+        increasing IDs, so newer postings have larger numbers.
+    """
+    try:
+        return int(job_id)
+    except (TypeError, ValueError):
+        return None
+
+
+def url_job_id(url):
+    """
+    :param url: URL of a results page or job page.
+    :return: ID of the job the URL shows, or None.
+    """
+    match = URL_JOB_ID.search(url or "")
+    return match.group(1) if match else None
+
+
+def normalize_company(company):
+    """
+    :param company: Company name as shown on LinkedIn or in `blacklisted_companies`
+        (also used for job titles).
+    :return: Case-folded name with runs of whitespace collapsed, for comparing names.
+    """
+    return " ".join(company.casefold().split())
+
+
+class SeenJobs:
+    """
+    Job IDs claimed during the current scan. Several searches (and parallel workers)
+    return overlapping results; the first to claim a job ID fetches it, everyone else
+    skips it, so each job's details are fetched at most once per scan.
+    """
+
+    def __init__(self):
+        self.job_ids = set()
+        self.lock = threading.Lock()
+
+    def claim(self, job_id):
+        """
+        :param job_id: Job ID found on a results page.
+        :return: True if the job had not been claimed before in this scan.
+        """
+        with self.lock:
+            if job_id in self.job_ids:
+                return False
+            self.job_ids.add(job_id)
+            return True
+
+
+class ScanState:
+    """
+    Counters and per-job outcome lists collected while scanning search results.
+    """
+
+    # Outcome -> list the job is collected in; saved jobs are only counted
+    OUTCOME_LISTS = {
+        "skipped": "skipped_jobs",
+        "duplicate": "duplicate_jobs",
+        "blacklisted": "blacklisted_jobs",
+        "irrelevant": "irrelavant_jobs",
+        "failed": "failed_jobs",
+    }
+
+    def __init__(self, max_jobs, seen_jobs=None, checkpoint=None):
+        """
+        :param max_jobs: Number of relevant jobs to save before the scan stops.
+        :param seen_jobs: Optional SeenJobs shared with other searches or workers.
+        :param checkpoint: Optional ScanCheckpoint that records every outcome as it happens.
+        """
+        self.max_jobs = max_jobs
+        self.seen_jobs = seen_jobs if seen_jobs is not None else SeenJobs()
+        self.total_scans = 0
+        self.jobs_scanned = 0
+        self.blacklisted_jobs, self.irrelavant_jobs, self.skipped_jobs = [], [], []
+        self.failed_jobs = []
+        self.duplicate_jobs = []
+        self.checkpoint = checkpoint
+        # Search URL and page of the card being processed, for the checkpoint
+        self.position = (None, None)
+        # (search URL, job ID) of the cards processed before the scan was resumed
+        self.restored_jobs = set()
+        self.loading_flag = False
+        self.skipping_flag = False
+        self.started_at = time.time()
+        self.finished_at = None
+
+    def add_outcome(self, job_id, outcome, details=None):
+        """
+        Collects the outcome of a card and records it in the checkpoint.
+        :param job_id: Job ID of the card.
+        :param outcome: One of "saved", "irrelevant", "blacklisted", "skipped", "duplicate" or "failed".
+        :param details: Optional dictionary to collect instead of the job ID.
+        """
+        if outcome in self.OUTCOME_LISTS:
+            getattr(self, self.OUTCOME_LISTS[outcome]).append(
+                details if details is not None else job_id
+            )
+        if self.checkpoint is not None:
+            search_url, page = self.position
+            self.checkpoint.record_job(search_url, page, job_id, outcome, details)
+
+    def limit_reached(self):
+        """
+        :return: True once `max_jobs` relevant jobs have been saved.
+        """
+        return self.jobs_scanned >= self.max_jobs
+
+    def jobs_per_minute(self):
+        """
+        :return: Job cards processed per minute since the scan started.
+        """
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return self.total_scans * 60 / elapsed if elapsed > 0 else 0.0
+
 
 class LinkedInScraper:
     """
@@ -14,38 +167,75 @@ class LinkedInScraper:
     filtering jobs based on user-defined criteria, and suggesting jobs for application.
     """
 
-    def __init__(self, driver, xpaths, filters, credentials):
+    def __init__(self, driver, xpaths, filters, credentials, scan_config=None, metrics=None):
         """
         Initializes the LinkedInScraper class with the necessary dependencies.
         :param driver: Selenium WebDriver instance.
         :param xpaths: Dictionary containing XPaths for interacting with the LinkedIn site.
         :param filters: Dictionary containing filters for job search and ranking.
         :param credentials: Dictionary containing login credentials for LinkedIn.
+        :param scan_config: Optional dictionary from `scan.yaml` with wait timeouts and jitter.
+        :param metrics: Optional `metrics.Metrics` that times each stage of the scan.
         """
+        scan_config = scan_config or {}
+        self.metrics = metrics or NULL_METRICS
         self.driver = driver
         self.xpaths = xpaths
         self.filters = filters
         self.credentials = credentials
+        self.waiter = PageWaiter(driver, xpaths, scan_config.get("waits"))
+        self.jitter = JitterPolicy(scan_config.get("jitter"))
+        self.session = SessionStore(scan_config.get("session"))
+        self.fetcher = create_fetcher(self, scan_config)
+        self.pipeline = FetchPipeline(self.fetcher, scan_config.get("pipeline"))
+        incremental_config = scan_config.get("incremental") or {}
+        self.incremental = incremental_config.get("enabled", False)
+        self.known_pages = max(1, incremental_config.get("known_pages", 1))
+        self.newest_job_id = None
+        record_dir = (scan_config.get("replay") or {}).get("record_dir")
+        self.recorder = PageRecorder(record_dir) if record_dir else None
+        self.detail_mode = scan_config.get("detail_mode", "pane")
+        self.extraction = scan_config.get("extraction", "bulk")
+        self.extractor = BulkExtractor(driver, xpaths, self.waiter)
+        self.page_cards = {}
+        self.search_url = None
+        self._matcher = None
+        self._matcher_filters = None
+        self._blacklist = None
+        self._blacklist_filters = None
 
     def login(self):
         """
         Logs into LinkedIn using credentials provided in the YAML file.
-        Navigates to the login page, enters credentials, and submits the form.
+        A saved session (cookies or Chrome profile) is reused when it is still valid;
+        otherwise navigates to the login page, enters credentials, submits the form,
+        and saves the new session for the next run.
         """
-        self.driver.get("https://www.linkedin.com/login")
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.xpaths["login"]["username"]))
-        )
-        self.driver.find_element(By.XPATH, self.xpaths["login"]["username"]).send_keys(
-            self.credentials["email"]
-        )
-        self.driver.find_element(By.XPATH, self.xpaths["login"]["password"]).send_keys(
-            self.credentials["password"]
-        )
-        self.driver.find_element(By.XPATH, self.xpaths["login"]["submit"]).click()
-        time.sleep(15)  # Wait for login to complete
-
-    def generate_search_url(self, filters):
+        start = time.perf_counter()
+        with self.metrics.span("login.restore"):
+            restored = self.session.restore(self.driver, self.waiter)
+        if restored:
+            print(f"{Colors.OKGREEN}Reused saved LinkedIn session ({time.perf_counter() - start:.1f}s).{Colors.ENDC}")
+            self.fetcher.on_login(self.driver)
+            return
+
+        with self.metrics.span("login.form"):
+            self.driver.get("https://www.linkedin.com/login")
+            self.waiter.wait_for("login", "login", "username")
+            self.driver.find_element(By.XPATH, self.xpaths["login"]["username"]).send_keys(
+                self.credentials["email"]
+            )
+            self.driver.find_element(By.XPATH, self.xpaths["login"]["password"]).send_keys(
+                self.credentials["password"]
+            )
+            self.driver.find_element(By.XPATH, self.xpaths["login"]["submit"]).click()
+            # Wait for LinkedIn to redirect away from the login form
+            self.waiter.wait_until("login", lambda driver: "/login" not in driver.current_url)
+        self.session.save(self.driver)
+        self.fetcher.on_login(self.driver)
+
+    @staticmethod
+    def generate_search_url(filters):
         """
         Generates a LinkedIn job search URL based on user-defined filters.
         :param filters: Dictionary containing filters such as keywords, location, etc.
@@ -89,54 +279,46 @@ class LinkedInScraper:
 
         # Add job type filter
         if "job_type" in filters:
-            job_types = {
-                "Full-time": "F",
-                "Part-time": "P",
-                "Contract": "C",
-                "Internship": "I",
-                "Temporary": "T",
-            }
             job_type_codes = ",".join(
-                [job_types[jt] for jt in filters["job_type"] if jt in job_types]
+                [JOB_TYPE_CODES[jt] for jt in filters["job_type"] if jt in JOB_TYPE_CODES]
             )
             params.append(f"f_JT={job_type_codes}")
 
         # Add work mode filter
         if "work_mode" in filters:
-            work_modes = {"Remote": "1", "Hybrid": "2", "Onsite": "3"}
             work_mode_codes = ",".join(
-                [work_modes[wm] for wm in filters["work_mode"] if wm in work_modes]
+                [WORK_MODE_CODES[wm] for wm in filters["work_mode"] if wm in WORK_MODE_CODES]
             )
             params.append(f"f_WT={work_mode_codes}")
 
         # Add experience level filter
         if "experience_level" in filters:
-            experience_levels = {
-                "Internship": "1",
-                "Entry level": "2",
-                "Associate": "3",
-                "Mid-Senior level": "4",
-                "Director": "5",
-                "Executive": "6",
-            }
             experience_codes = ",".join(
                 [
-                    experience_levels[el]
+                    EXPERIENCE_LEVEL_CODES[el]
                     for el in filters["experience_level"]
-                    if el in experience_levels
+                    if el in EXPERIENCE_LEVEL_CODES
                 ]
             )
             params.append(f"f_E={experience_codes}")
 
         return base_url + "&".join(params)
 
-    def search_jobs(self):
+    def search_jobs(self, filters=None):
         """
         Navigates to LinkedIn's job search page using the URL generated by filters.
+        Incremental scans sort the results by most recent first.
+        :param filters: Optional filters of a search profile. Defaults to `self.filters`.
         """
-        search_url = self.generate_search_url(self.filters)
-        self.driver.get(search_url)
-        time.sleep(2)  # Allow time for the page to load
+        self.search_url = self.generate_search_url(filters or self.filters)
+        if self.incremental:
+            self.search_url += "&sortBy=DD"
+        self.newest_job_id = None
+        with self.metrics.span("search"):
+            self.driver.get(self.search_url)
+            self.waiter.wait_for("search", "job_search", "total_jobs")
+        if self.recorder is not None:
+            self.recorder.record_search(self.search_url, self.driver.page_source)
 
     def parse_relative_time(self, relative_time):
         """
@@ -198,6 +380,59 @@ class LinkedInScraper:
             print(f"{Colors.FAIL}Error parsing primary description: {e}{Colors.ENDC}")
             return {"Location": None, "Posting Date": None, "Status": None}
 
+    def get_matcher(self, filters):
+        """
+        Returns the keyword matcher for the given filters, compiling it only once.
+        :param filters: Dictionary containing positive, negative, and best keywords.
+        :return: KeywordMatcher instance.
+        """
+        if self._matcher is None or self._matcher_filters is not filters:
+            self._matcher = KeywordMatcher.from_filters(filters)
+            self._matcher_filters = filters
+        return self._matcher
+
+    def get_blacklist(self, filters):
+        """
+        Returns the normalized names of the blacklisted companies, building the set only once.
+        :param filters: Dictionary containing `blacklisted_companies`.
+        :return: Frozenset of names normalized by `normalize_company`.
+        """
+        if self._blacklist is None or self._blacklist_filters is not filters:
+            self._blacklist = frozenset(
+                normalize_company(company) for company in filters.get("blacklisted_companies") or []
+            )
+            self._blacklist_filters = filters
+        return self._blacklist
+
+    def triage_card(self, job_id, filters):
+        """
+        Decides from the title and company on a job card whether the job can be rejected
+        without opening it: blacklisted companies, and titles whose negative keywords
+        outweigh the positive ones (the same title check `process_job` applies).
+        Cards are only available in bulk extraction mode, where `get_page_job_ids`
+        reads them for the whole page in one call.
+        :param job_id: Job ID of the card.
+        :param filters: Dictionary containing job search filters.
+        :return: Tuple of (outcome, details) for a rejected card, or None if the job has
+            to be opened.
+        """
+        card = self.page_cards.get(job_id)
+        if not card or not card["title"] or not card["company"]:
+            return None
+        details = {
+            "job_id": job_id,
+            "title": card["title"],
+            "company": card["company"],
+            "location": None,
+            "date_posted": None,
+        }
+        if normalize_company(card["company"]) in self.get_blacklist(filters):
+            return "blacklisted", details
+        level, _, neg, _ = self.calculate_description_points(card["title"], filters)
+        if level < 0:
+            return "irrelevant", dict(details, neg=neg)
+        return None
+
     def calculate_description_points(self, full_description, filters):
         """
         Calculates a score for the job based on the presence of positive, negative, and best keywords.
@@ -205,280 +440,479 @@ class LinkedInScraper:
         :param filters: Dictionary containing positive, negative, and best keywords.
         :return: Tuple containing points, positive words found, negative words found, and best words found.
         """
-        positive_words = filters["description"]["positive"]
-        negative_words = filters["description"]["negative"]
-        best_words = filters["description"]["best"]
-
-        points = 0
-        pos_words_found, neg_words_found, best_words_found = [], [], []
-
-        # Check for positive keywords
-        for word in positive_words:
-            if word.lower() in full_description.lower():
-                points += 1
-                pos_words_found.append(word)
-        # Check for negative keywords
-        for word in negative_words:
-            if word.lower() in full_description.lower():
-                points = - 1
-                neg_words_found.append(word)
-        # Check for best keywords
-        for word in best_words:
-            if word.lower() in full_description.lower():
-                points = 1
-                best_words_found.append(word)
-        return points, pos_words_found, neg_words_found, best_words_found
-
-    def extract_job_details(self, filters, cache):
+        return self.get_matcher(filters).match(full_description)
+
+    def get_total_results(self):
         """
-        Scrapes job details from LinkedIn and adds relevant jobs to the database.
-        Skips previously viewed jobs and blacklisted companies.
-        :param filters: Dictionary containing job search filters.
-        :param cache: Database instance for storing job details.
+        Reads the total number of results from the search page.
+        :return: Number of jobs matching the search, including those past the last page.
         """
         total_jobs_text = self.driver.find_element(
             By.XPATH, self.xpaths["job_search"]["total_jobs"]
         ).text
-        total_pages = min(
-            math.ceil(int(total_jobs_text.split()[0].replace(",", "")) / 25), 40
-        )
-        total_scans, jobs_scanned = 0, 0
-        blacklisted_jobs, irrelavant_jobs, skipped_jobs = [], [], []
+        return int(total_jobs_text.split()[0].replace(",", ""))
+
+    def get_total_pages(self, total_results=None):
+        """
+        Converts the total number of results to a page count.
+        LinkedIn shows at most 40 pages of 25 results for a search.
+        :param total_results: Result count; read from the search page if None.
+        :return: Number of result pages to scan.
+        """
+        if total_results is None:
+            total_results = self.get_total_results()
+        return min(math.ceil(total_results / RESULTS_PER_PAGE), MAX_PAGES)
 
-        blacklisted_companies = filters.get("blacklisted_companies", [])
+    def extract_job_details(self, filters, cache, pages=None, state=None, summary=True, cursor=None):
+        """
+        Scrapes job details from LinkedIn and adds relevant jobs to the database.
+        Skips previously viewed jobs and blacklisted companies. In incremental mode paging
+        stops after `known_pages` consecutive pages that hold only known jobs.
+        :param filters: Dictionary containing job search filters.
+        :param cache: Database instance for storing job details.
+        :param pages: Optional iterable of page numbers to scan. Defaults to every result page.
+        :param state: Optional ScanState to accumulate counters into.
+        :param summary: If False, the summary is left to the caller (e.g. the scan planner,
+            which prints it once after the last search).
+        :param cursor: Newest job ID of the last complete incremental scan of this search.
+            Jobs at or below it count as known when deciding whether to stop paging.
+        :return: ScanState with the counters and outcome lists of the scan.
+        """
+        if pages is None:
+            pages = range(self.get_total_pages())
+        if state is None:
+            state = ScanState(filters["max_jobs"])
 
-        loading_flag = False
-        skipping_flag = False
         print(f"{Colors.HEADER}Starting job scanning...{Colors.ENDC}")
-        for page in range(total_pages):
-            if jobs_scanned >= filters["max_jobs"]:
+        known_pages = 0
+        checkpoint = state.checkpoint
+        for page in pages:
+            if state.limit_reached():
+                break
+            # Pages finished before an interrupted scan was resumed are not loaded again
+            if checkpoint is not None and checkpoint.page_done(self.search_url, page):
+                continue
+            new_jobs = self.scan_page(page, filters, cache, state, cursor)
+            if new_jobs is None:
+                continue
+            if checkpoint is not None and not state.limit_reached():
+                checkpoint.complete_page(self.search_url, page)
+            if not self.incremental:
+                continue
+            # Results are sorted by date, so everything after a known page was seen before
+            known_pages = known_pages + 1 if new_jobs == 0 else 0
+            if known_pages >= self.known_pages:
+                print(
+                    f"{Colors.OKGREEN}Reached jobs seen in earlier scans on page {page + 1}; "
+                    f"stopping this search{Colors.ENDC}"
+                )
                 break
 
-            # Navigate to the correct page offset
-            page_offset = 25 * page
-            self.driver.get(self.driver.current_url + f"&start={page_offset}")
-            time.sleep(random.uniform(2, 5))  # Random sleep to avoid detection
+        state.finished_at = time.time()
+        if summary:
+            self.print_scan_summary(state)
+        return state
 
-            try:
-                job_cards = self.driver.find_elements(
-                    By.XPATH, self.xpaths["job_search"]["job_card"]
+    def scan_page(self, page, filters, cache, state, cursor=None):
+        """
+        Opens one page of search results and processes every job card on it.
+        The page is loaded once; each card is then opened in the details pane (or on its
+        own job page, depending on `detail_mode`) without navigating back in history.
+        :param page: Zero-based page number; LinkedIn pages hold 25 results each.
+        :param filters: Dictionary containing job search filters.
+        :param cache: Database instance for storing job details.
+        :param state: ScanState to accumulate counters into.
+        :param cursor: Optional newest job ID of the last complete scan of this search.
+        :return: Number of cards that are neither in the database nor at or below `cursor`,
+            or None if the page did not load.
+        """
+        # Navigate to the correct page offset
+        page_offset = RESULTS_PER_PAGE * page
+        search_url = self.search_url or self.driver.current_url
+        page_url = search_url + f"&start={page_offset}"
+        state.position = (search_url, page)
+        with self.metrics.span("page.load"):
+            self.driver.get(page_url)
+        with self.metrics.span("jitter"):
+            self.jitter.pause("page")  # Random pause to avoid detection
+
+        try:
+            with self.metrics.span("page.cards"):
+                self.waiter.wait_for("job_card", "job_search", "job_card")
+                job_ids = self.get_page_job_ids()
+            if self.recorder is not None:
+                self.recorder.record_search(page_url, self.driver.page_source)
+            state.loading_flag = False
+            # One indexed lookup for the whole page instead of a query per card
+            seen_job_ids = cache.seen_job_ids(job_ids)
+        except Exception:
+            if not state.loading_flag:
+                print(f"{Colors.WARNING}Loading Pages ...{Colors.ENDC}")
+                state.loading_flag = True
+            return None
+
+        # Track the newest posting of this search and count the cards not seen before
+        new_jobs = 0
+        for job_id in job_ids:
+            number = job_id_number(job_id)
+            if number is not None:
+                self.newest_job_id = max(self.newest_job_id or number, number)
+            if job_id not in seen_job_ids and (number is None or cursor is None or number > cursor):
+                new_jobs += 1
+        # Claim the new jobs up front; jobs another search of this scan already claimed
+        # are skipped so their details are not fetched twice
+        claimed = [
+            job_id for job_id in job_ids
+            if job_id not in seen_job_ids and state.seen_jobs.claim(job_id)
+        ]
+        # Cards whose title or company already rule the job out are never opened
+        triaged = {}
+        for job_id in claimed:
+            verdict = self.triage_card(job_id, filters)
+            if verdict is not None:
+                triaged[job_id] = verdict
+
+        # Fetchers that do not need the browser load all new jobs of the page concurrently
+        with self.metrics.span("page.prefetch"):
+            prefetched = self.pipeline.prefetch(
+                [job_id for job_id in claimed if job_id not in triaged]
+            )
+        claimed = set(claimed)
+
+        for job_id in job_ids:
+            if state.limit_reached():
+                print(
+                    f"{Colors.OKGREEN} Scanned {state.max_jobs} jobs as per configuration {Colors.ENDC}"
                 )
-                loading_flag = False
-                for card in job_cards:
-                    if jobs_scanned >= filters["max_jobs"]:
-                        print(
-                            f"{Colors.OKGREEN} Scanned {filters['max_jobs']} jobs as per configuration {Colors.ENDC}"
-                        )
-                        break
-
-                    total_scans += 1
-                    job_id = card.get_attribute("data-occludable-job-id")
-                    job_link = f"https://www.linkedin.com/jobs/view/{job_id}"
-
-                    # Skip jobs already viewed
-                    if cache.query_jobs(
-                        f"SELECT 1 FROM jobs WHERE job_id = '{job_id}'"
-                    ):
-                        skipped_jobs.append(job_id)
-                        if not skipping_flag:
-                            print(f"{Colors.WARNING} Skipping jobs previously viewed ...")
-                            skipping_flag = True
-                        continue
-                    # Scroll to the job card and click it
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView(true);", card
-                    )
-                    time.sleep(1)
-                    card.click()
-                    time.sleep(3)
-
-                    # Extract job details
-                    title = self.driver.find_element(
-                        By.XPATH, self.xpaths["job_search"]["job_title"]
-                    ).text
-                    company = self.driver.find_element(
-                        By.XPATH, self.xpaths["job_search"]["company"]
-                    ).text
-                    primary_description = self.driver.find_element(
-                        By.XPATH, self.xpaths["job_search"]["primary_description"]
-                    ).text
-                    primary_dict = self.parse_primary_description(primary_description)
-
-                    skipping_flag = False
-                    
-                    # Skip jobs from blacklisted companies
-                    if company.lower() in [c.lower() for c in blacklisted_companies]:
-                        print(
-                            f"{Colors.FAIL}Blacklisted job detected: {title} at {company}{Colors.ENDC}"
-                        )
-                        blacklisted_jobs.append(
-                            {
-                                "job_id": job_id,
-                                "title": title,
-                                "company": company,
-                                "location": primary_dict["Location"],
-                                "date_posted": primary_dict["Posting Date"],
-                            }
-                        )
-                        self.driver.back()
-                        time.sleep(2)
-                        continue
-
-                    try:
-                        # Expand full job description if applicable
-                        show_more_button = self.driver.find_element(
-                            By.XPATH, self.xpaths["job_search"]["show_more_button"]
-                        )
-                        self.driver.execute_script(
-                            "arguments[0].click();", show_more_button
-                        )
-                        time.sleep(2)
-                    except Exception:
-                        print(f"{Colors.WARNING}Show more button not found... {Colors.ENDC}")
-
-                    full_description_element = self.driver.find_element(
-                        By.XPATH, self.xpaths["job_search"]["full_description"]
-                    )
-                    full_description = " ".join(
-                        [
-                            span.text
-                            for span in full_description_element.find_elements(
-                                By.TAG_NAME, "span"
-                            )
-                        ]
-                    )
+                break
 
-                    # Calculate job relevance points
-                    points, pos, neg, best = self.calculate_description_points(
-                        full_description, filters
-                    )
-                    level, _, _, _ = self.calculate_description_points(
-                        title, filters
-                    )
-                    matched_keywords = [
-                        word
-                        for word in filters["description"]["positive"]
-                        if word.lower() in full_description.lower()
-                    ]
-
-                    if points > 0 and level >=0:
-                        # Save relevant job to database
-                        cache.add_job(
-                            job_id=job_id,
-                            title=title,
-                            company=company,
-                            location=primary_dict["Location"],
-                            date_posted=primary_dict["Posting Date"],
-                            points=points,
-                            matched_keywords=", ".join(matched_keywords),
-                            full_description=full_description,
-                            job_link=job_link,
-                        )
-
-                        # Display job details
-                        print(
-                            f"{Colors.OKBLUE}--------------------------------------------------------------------------------{Colors.ENDC}"
-                        )
-                        print(
-                            f"{Colors.HEADER}Title: {title} | Company: {company} | Job ID: {job_id}{Colors.ENDC}"
-                        )
-                        print(
-                            f"{Colors.OKGREEN}Location: {primary_dict['Location']} | Date Posted: {primary_dict['Posting Date']}{Colors.ENDC}"
-                        )
-                        print(
-                            f"{Colors.OKCYAN}Matched Keywords: {matched_keywords}{Colors.ENDC}"
-                        )
-                        print(
-                            f"{Colors.OKBLUE}--------------------------------------------------------------------------------{Colors.ENDC}"
-                        )
-                        jobs_scanned += 1
-                    else:
-                        print(f"{Colors.OKBLUE} Irrelavant Job {title} at {company}| {neg}{Colors.ENDC}")
-                        # Mark irrelevant job
-                        irrelavant_jobs.append(
-                            {
-                                "job_id": job_id,
-                                "title": title,
-                                "company": company,
-                                "location": primary_dict["Location"],
-                                "date_posted": primary_dict["Posting Date"],
-                                "neg": neg,
-                            }
-                        )
-                    self.driver.back()
-                    time.sleep(2)  # Avoid LinkedIn rate limiting
+            # Cards processed before the scan was resumed are already counted
+            if (search_url, job_id) in state.restored_jobs:
+                continue
+
+            state.total_scans += 1
+            self.metrics.count("jobs")
+
+            # Skip jobs already viewed
+            if job_id in seen_job_ids:
+                state.add_outcome(job_id, "skipped")
+                if not state.skipping_flag:
+                    print(f"{Colors.WARNING} Skipping jobs previously viewed ...")
+                    state.skipping_flag = True
+                continue
+
+            # Skip jobs already found by another search of this scan
+            if job_id not in claimed:
+                state.add_outcome(job_id, "duplicate")
+                continue
 
+            if job_id in triaged:
+                outcome, details = triaged[job_id]
+                print(
+                    f"{Colors.FAIL if outcome == 'blacklisted' else Colors.OKBLUE} "
+                    f"Rejected from card ({outcome}): {details['title']} at {details['company']}{Colors.ENDC}"
+                )
+                state.skipping_flag = False
+                state.add_outcome(job_id, outcome, details)
+                cache.mark_seen(job_id, outcome)
+                continue
+
+            try:
+                with self.metrics.span("job"):
+                    outcome = self.process_job(
+                        job_id, filters, cache, state, prefetched.get(job_id)
+                    )
             except Exception as e:
-                if not loading_flag:
-                    print(f"{Colors.WARNING}Loading Pages ...{Colors.ENDC}")
-                    loading_flag = True
+                # A single broken card must not take the rest of the page with it
+                print(f"{Colors.WARNING}Failed to scan job {job_id}: {type(e).__name__}{Colors.ENDC}")
+                cache.mark_seen(job_id, "failed")
+                state.add_outcome(job_id, "failed")
+                if self.detail_mode == "view" or not self.fetcher.uses_browser:
+                    continue
+                # Reload the results page so the remaining cards can still be opened
+                self.driver.get(page_url)
+                self.waiter.try_wait_until(
+                    "job_card", lambda driver: self.find_job_card(job_id, required=False)
+                )
+            else:
+                cache.mark_seen(job_id, outcome)
+            with self.metrics.span("jitter"):
+                self.jitter.pause("card")  # Avoid LinkedIn rate limiting
 
-        # Print scan summary
-        print(f"{Colors.HEADER}Job Scanning Complete{Colors.ENDC}")
-        print(f"{Colors.OKCYAN}Total Jobs Scanned: {total_scans}{Colors.ENDC}")
-        print(f"{Colors.OKCYAN}Total Relevant Jobs Saved: {jobs_scanned}{Colors.ENDC}")
-        print(f"{Colors.WARNING}Skipped Jobs (Previously Viewed): {len(skipped_jobs)}{Colors.ENDC}")
-        print(f"{Colors.FAIL}Blacklisted Jobs: {len(blacklisted_jobs)}{Colors.ENDC}")
-        print(f"{Colors.FAIL}Irrelevant Jobs: {len(irrelavant_jobs)}{Colors.ENDC}")
+        return new_jobs
 
-    def recommend_and_apply_jobs(self, cache, resume_config):
+    def get_page_job_ids(self):
         """
-        Recommends jobs based on ranking and suggests the best resume to use.
-        Allows users to manually mark jobs as applied or skipped.
-        :param cache: Database instance for querying job details.
-        :param resume_config: Dictionary containing resume information and their associated keywords.
+        Reads the job IDs of every card on the current results page.
+        IDs are collected up front so cards can be re-resolved later instead of holding
+        on to element references that go stale when the page re-renders.
+        In bulk extraction mode the card titles and companies are read in the same call
+        and kept in `self.page_cards`.
+        :return: List of job IDs in page order.
         """
-        resumes = resume_config["resumes"]
-        applications_limit = resume_config.get("applications", 0)
-        applications_completed = 0
+        if self.extraction == "bulk":
+            cards = self.extractor.page_cards()
+            self.page_cards = {card["job_id"]: card for card in cards}
+            return [card["job_id"] for card in cards]
 
-        jobs = cache.query_jobs(
-            "SELECT job_id, title, company, location, points, job_link, matched_keywords FROM jobs WHERE applied = 0 ORDER BY points DESC"
+        job_cards = self.driver.find_elements(
+            By.XPATH, self.xpaths["job_search"]["job_card"]
         )
+        return [card.get_attribute("data-occludable-job-id") for card in job_cards]
+
+    def find_job_card(self, job_id, required=True):
+        """
+        Looks up a job card on the results page by its `data-occludable-job-id`.
+        :param job_id: Job ID of the card.
+        :param required: When False, returns None instead of raising if the card is missing.
+        :return: WebElement of the card.
+        """
+        xpath = self.xpaths["job_search"]["job_card_by_id"].format(job_id=job_id)
+        if required:
+            return self.driver.find_element(By.XPATH, xpath)
+        cards = self.driver.find_elements(By.XPATH, xpath)
+        return cards[0] if cards else None
+
+    def open_job(self, job_id):
+        """
+        Shows the details of a job without leaving the results page's history entry.
+        In "pane" mode the card is clicked in place on the split-view results page; in
+        "view" mode the browser goes straight to `/jobs/view/{job_id}`.
+        :param job_id: Job ID to open.
+        :raises TimeoutException: If the details of this job are not shown in time.
+        """
+        expected = self.page_cards.get(job_id) or {}
+        if self.detail_mode == "view":
+            self.driver.get(f"https://www.linkedin.com/jobs/view/{job_id}")
+        elif self.extraction == "bulk":
+            self.extractor.click_card(job_id)
+        else:
+            for attempt in range(2):
+                try:
+                    card = self.find_job_card(job_id)
+                    expected = {}
+                    for key in ("title", "company"):
+                        elements = card.find_elements(By.XPATH, self.xpaths["job_search"][f"card_{key}"])
+                        expected[key] = elements[0].text if elements else None
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
+                    card.click()
+                    break
+                except StaleElementReferenceException:
+                    # The list re-rendered between lookup and click; resolve the card again
+                    if attempt:
+                        raise
+
+        # The URL changes on click, while the pane keeps showing the previous job until it
+        # re-renders: wait until the URL names this job and the pane shows its card's
+        # title and company
+        self.waiter.wait_until("job_details", lambda driver: self.shows_job(driver, job_id, expected))
+
+    def shows_job(self, driver, job_id, expected):
+        """
+        Checks whether the details of a job are on screen.
+        :param driver: WebDriver.
+        :param job_id: Job ID that was opened.
+        :param expected: Dictionary with the `title` and `company` on the job's card;
+            missing or None values are not checked.
+        :return: True once the URL points at the job and the details show a title and
+            company matching the card's. Neighbouring cards often share a title, so the
+            title alone does not tell the jobs apart.
+        """
+        if self.extraction == "bulk":
+            shown = self.extractor.shown_job()
+        else:
+            shown = {"url": driver.current_url}
+            if url_job_id(shown["url"]) == str(job_id):
+                for key, xpath in (("title", "job_title"), ("company", "company")):
+                    elements = driver.find_elements(By.XPATH, self.xpaths["job_search"][xpath])
+                    shown[key] = elements[0].text if elements else None
+        if url_job_id(shown.get("url")) != str(job_id) or not shown.get("title"):
+            return False
+        for key in ("title", "company"):
+            wanted = normalize_company(expected.get(key) or "")
+            found = normalize_company(shown.get(key) or "")
+            # Card titles may carry extra text such as "with verification"
+            if wanted and not (found and (wanted in found or found in wanted)):
+                return False
+        return True
+
+    def read_job_details(self):
+        """
+        Reads the open job's title, company, primary description and full description,
+        expanding the description first. In bulk extraction mode this is a single
+        `execute_script` call; otherwise every element is read with its own WebDriver call.
+        :return: Dictionary with `title`, `company`, `primary_description` and `full_description`.
+        """
+        if self.extraction == "bulk":
+            return self.extractor.job_details()
+
+        details = {
+            key: self.driver.find_element(By.XPATH, self.xpaths["job_search"][xpath_key]).text
+            for key, xpath_key in (
+                ("title", "job_title"),
+                ("company", "company"),
+                ("primary_description", "primary_description"),
+            )
+        }
+
+        try:
+            # Expand full job description if applicable
+            show_more_button = self.driver.find_element(
+                By.XPATH, self.xpaths["job_search"]["show_more_button"]
+            )
+            self.driver.execute_script(
+                "arguments[0].click();", show_more_button
+            )
+            self.waiter.wait_for("show_more", "job_search", "full_description")
+        except Exception:
+            print(f"{Colors.WARNING}Show more button not found... {Colors.ENDC}")
 
-        print(
-            f"{Colors.OKCYAN}Applications to complete: {applications_limit}{Colors.ENDC}"
+        full_description_element = self.driver.find_element(
+            By.XPATH, self.xpaths["job_search"]["full_description"]
         )
-        for job in jobs:
-            if applications_completed >= applications_limit:
-                print(
-                    f"{Colors.OKGREEN}Congratulations! You applied for {applications_completed} jobs.{Colors.ENDC}"
+        details["full_description"] = " ".join(
+            [
+                span.text
+                for span in full_description_element.find_elements(
+                    By.TAG_NAME, "span"
                 )
-                break
+            ]
+        )
+        return details
 
-            job_id, title, company, location, points, job_link, matched_keywords = job
-            matched_keywords_list = (
-                matched_keywords.split(", ") if matched_keywords else []
+    def process_job(self, job_id, filters, cache, state, details=None):
+        """
+        Opens a single job, scores it, and saves it to the database if it is relevant.
+        :param job_id: Job ID of the card to process.
+        :param filters: Dictionary containing job search filters.
+        :param cache: Database instance for storing job details.
+        :param state: ScanState to accumulate counters into.
+        :param details: Details already fetched by `pipeline.prefetch`, or the exception
+            raised while fetching them. Fetched through the pipeline if None.
+        :return: Outcome of the job: "saved", "irrelevant", or "blacklisted".
+        """
+        job_link = f"https://www.linkedin.com/jobs/view/{job_id}"
+
+        # Extract job details
+        if isinstance(details, Exception):
+            raise details
+        if details is None:
+            with self.metrics.span("job.fetch"):
+                details = self.pipeline.fetch_one(job_id)
+        title = details["title"]
+        company = details["company"]
+        primary_dict = self.parse_primary_description(details["primary_description"])
+
+        state.skipping_flag = False
+
+        # Skip jobs from blacklisted companies
+        if normalize_company(company) in self.get_blacklist(filters):
+            print(
+                f"{Colors.FAIL}Blacklisted job detected: {title} at {company}{Colors.ENDC}"
+            )
+            state.add_outcome(
+                job_id,
+                "blacklisted",
+                {
+                    "job_id": job_id,
+                    "title": title,
+                    "company": company,
+                    "location": primary_dict["Location"],
+                    "date_posted": primary_dict["Posting Date"],
+                }
             )
+            return "blacklisted"
+
+        full_description = details["full_description"]
 
-            # Recommend resume based on matched keywords
-            suggested_resume = self.select_resume(matched_keywords_list, resumes)
+        # Calculate job relevance points
+        with self.metrics.span("job.score"):
+            points, pos, neg, best = self.calculate_description_points(
+                full_description, filters
+            )
+            level, _, _, _ = self.calculate_description_points(
+                title, filters
+            )
+        matched_keywords = pos
+
+        if points > 0 and level >=0:
+            # Save relevant job to database
+            with self.metrics.span("job.store"):
+                cluster_id = cache.add_job(
+                    job_id=job_id,
+                    title=title,
+                    company=company,
+                    location=primary_dict["Location"],
+                    date_posted=primary_dict["Posting Date"],
+                    points=points,
+                    matched_keywords=", ".join(matched_keywords),
+                    full_description=full_description,
+                    job_link=job_link,
+                    score_hash=self.get_matcher(filters).config_hash(),
+                )
 
+            # Display job details
             print(
-                f"{Colors.OKBLUE}---------------------------------------------------------------------------{Colors.ENDC}"
+                f"{Colors.OKBLUE}--------------------------------------------------------------------------------{Colors.ENDC}"
             )
-            print(f"{Colors.HEADER} {title} | {company} | {location}")
-            print(f"{Colors.OKCYAN}{matched_keywords_list}{Colors.ENDC}")
-            print(f"Link: {Colors.OKBLUE}{job_link}{Colors.ENDC}")
-            print(f"Suggested Resume: {Colors.OKGREEN}{suggested_resume}{Colors.ENDC}")
             print(
-                f"{Colors.OKBLUE}---------------------------------------------------------------------------{Colors.ENDC}"
+                f"{Colors.HEADER}Title: {title} | Company: {company} | Job ID: {job_id}{Colors.ENDC}"
             )
-
-            # Prompt user input for application
-            user_input = (
-                input(
-                    f" {Colors.BOLD} Did you apply for Job ID {job_id}? (yes/no): {Colors.ENDC}"
-                )
-                .strip()
-                .lower()
+            print(
+                f"{Colors.OKGREEN}Location: {primary_dict['Location']} | Date Posted: {primary_dict['Posting Date']}{Colors.ENDC}"
             )
-            if user_input == "yes":
-                print(f"Marking Job ID {job_id} as applied...")
-                cache.update_job_as_applied(job_id)
-                applications_completed += 1
-            else:
-                print(f"{Colors.WARNING}Skipped Job ID {job_id}.{Colors.ENDC}")
+            print(
+                f"{Colors.OKCYAN}Matched Keywords: {matched_keywords}{Colors.ENDC}"
+            )
+            if cluster_id != job_id:
+                print(f"{Colors.WARNING}Repost of Job ID {cluster_id}{Colors.ENDC}")
+            print(
+                f"{Colors.OKBLUE}--------------------------------------------------------------------------------{Colors.ENDC}"
+            )
+            state.jobs_scanned += 1
+            state.add_outcome(job_id, "saved")
+            return "saved"
+        else:
+            print(f"{Colors.OKBLUE} Irrelavant Job {title} at {company}| {neg}{Colors.ENDC}")
+            # Mark irrelevant job
+            state.add_outcome(
+                job_id,
+                "irrelevant",
+                {
+                    "job_id": job_id,
+                    "title": title,
+                    "company": company,
+                    "location": primary_dict["Location"],
+                    "date_posted": primary_dict["Posting Date"],
+                    "neg": neg,
+                }
+            )
+            return "irrelevant"
+
+    def print_scan_summary(self, state):
+        """
+        Prints the counters collected during a scan.
+        :param state: ScanState of the finished scan.
+        """
+        print(f"{Colors.HEADER}Job Scanning Complete{Colors.ENDC}")
+        print(f"{Colors.OKCYAN}Total Jobs Scanned: {state.total_scans}{Colors.ENDC}")
+        print(f"{Colors.OKCYAN}Total Relevant Jobs Saved: {state.jobs_scanned}{Colors.ENDC}")
+        print(f"{Colors.WARNING}Skipped Jobs (Previously Viewed): {len(state.skipped_jobs)}{Colors.ENDC}")
+        print(f"{Colors.WARNING}Duplicate Jobs (Found by Another Search): {len(state.duplicate_jobs)}{Colors.ENDC}")
+        print(f"{Colors.FAIL}Blacklisted Jobs: {len(state.blacklisted_jobs)}{Colors.ENDC}")
+        print(f"{Colors.FAIL}Irrelevant Jobs: {len(state.irrelavant_jobs)}{Colors.ENDC}")
+        print(f"{Colors.FAIL}Failed Jobs: {len(state.failed_jobs)}{Colors.ENDC}")
+        self.pipeline.print_report()
+        self.waiter.print_report()
+
+    def recommend_and_apply_jobs(self, cache, resume_config):
+        """
+        Recommends jobs based on ranking and suggests the best resume to use.
+        See `reports.recommend_and_apply_jobs`.
+        :param cache: Database instance for querying job details.
+        :param resume_config: Dictionary containing resume information and their associated keywords.
+        """
+        reports.recommend_and_apply_jobs(cache, resume_config)
 
     def select_resume(self, matched_keywords, resumes):
         """
@@ -487,31 +921,11 @@ class LinkedInScraper:
         :param resumes: Dictionary of resumes and their associated keywords.
         :return: Name of the best resume file.
         """
-        best_resume = None
-        max_matches = 0
-
-        for resume, keywords in resumes.items():
-            matches = sum(
-                1
-                for keyword in matched_keywords
-                if keyword.lower() in map(str.lower, keywords)
-            )
-            if matches > max_matches:
-                best_resume = resume
-                max_matches = matches
-
-        return best_resume if best_resume else "default_resume.pdf"
+        return reports.select_resume(matched_keywords, resumes)
 
     def generate_stats(self, cache):
         """
         Generates and displays statistics about the jobs in the database.
         :param cache: Database instance for querying job details.
         """
-        total_jobs = cache.query_jobs("SELECT COUNT(*) FROM jobs")[0][0]
-        applied_jobs = cache.query_jobs("SELECT COUNT(*) FROM jobs WHERE applied = 1")[0][0]
-        unique_companies = cache.query_jobs("SELECT COUNT(DISTINCT company) FROM jobs")[0][0]
-
-        print(f"{Colors.HEADER}Job Statistics:{Colors.ENDC}")
-        print(f"Total Jobs: {total_jobs}")
-        print(f"Total Applications: {applied_jobs}")
-        print(f"Unique Companies: {unique_companies}")
+        reports.generate_stats(cache)
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import time
+from selenium.webdriver.common.by import By
+from automate_linkedin.utils import Colors
+
+
+class SessionStore:
+    """
+    Persists the LinkedIn login between runs so the login form is only used when needed.
+
+    Two mechanisms are supported and can be combined:
+    - A cookies file: cookies are saved after a successful login and restored into the
+      next browser session before the feed is opened.
+    - A Chrome profile (`user_data_dir`): Chrome itself keeps the session in the profile
+      directory. A profile can only be used by one browser at a time, so parallel scan
+      workers rely on the cookies file instead.
+
+    Before logging in, `restore` checks whether the restored session is still valid by
+    opening the feed; LinkedIn redirects to the login page or the auth wall when it is not.
+    """
+
+    BASE_URL = "https://www.linkedin.com"
+    FEED_URL = "https://www.linkedin.com/feed/"
+    # Cookie fields accepted by WebDriver's add_cookie
+    COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry")
+
+    def __init__(self, session_config=None):
+        """
+        :param session_config: `session` section of `scan.yaml` with `enabled`,
+            `cookies_file` and `user_data_dir`.
+        """
+        session_config = session_config or {}
+        self.enabled = session_config.get("enabled", True)
+        self.cookies_file = session_config.get("cookies_file", "linkedin_cookies.json")
+        self.user_data_dir = session_config.get("user_data_dir")
+
+    def chrome_arguments(self):
+        """
+        :return: Chrome command-line arguments needed to reuse the configured profile.
+        """
+        if not self.enabled or not self.user_data_dir:
+            return []
+        return [f"--user-data-dir={os.path.abspath(os.path.expanduser(self.user_data_dir))}"]
+
+    def load_cookies(self):
+        """
+        Reads the saved cookies, dropping any that have already expired.
+        :return: List of cookie dictionaries, empty if there is no usable cookies file.
+        """
+        if not self.enabled or not self.cookies_file or not os.path.exists(self.cookies_file):
+            return []
+        try:
+            with open(self.cookies_file, encoding="utf-8") as f:
+                cookies = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.WARNING}Ignoring unreadable cookies file {self.cookies_file}: {e}{Colors.ENDC}")
+            return []
+        now = time.time()
+        return [
+            {field: cookie[field] for field in self.COOKIE_FIELDS if field in cookie}
+            for cookie in cookies
+            if "expiry" not in cookie or cookie["expiry"] > now
+        ]
+
+    def save(self, driver):
+        """
+        Saves the browser's LinkedIn cookies. The file is replaced atomically and is only
+        readable by the current user, since it grants access to the account.
+        :param driver: Selenium WebDriver instance that is logged in.
+        """
+        if not self.enabled or not self.cookies_file:
+            return
+        cookies = [
+            {field: cookie[field] for field in self.COOKIE_FIELDS if field in cookie}
+            for cookie in driver.get_cookies()
+        ]
+        directory = os.path.dirname(os.path.abspath(self.cookies_file))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError as e:
+            # The scan can continue; the next run simply logs in with the form again
+            print(f"{Colors.WARNING}Could not save the LinkedIn session: {e}{Colors.ENDC}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cookies, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.cookies_file)
+        except OSError as e:
+            os.remove(tmp_path)
+            print(f"{Colors.WARNING}Could not save the LinkedIn session: {e}{Colors.ENDC}")
+
+    def is_logged_in(self, driver, waiter):
+        """
+        Opens the feed and checks that LinkedIn does not redirect to a login page and shows
+        the signed-in navigation bar (`login.logged_in` in `xpaths.yaml`).
+        :param driver: Selenium WebDriver instance.
+        :param waiter: PageWaiter used to wait for the redirect to settle.
+        :return: True if the session is valid.
+        """
+        logged_in_xpath = waiter.xpaths["login"]["logged_in"]
+        driver.get(self.FEED_URL)
+        return bool(
+            waiter.try_wait_until(
+                "session",
+                lambda d: "/feed" in d.current_url and d.find_elements(By.XPATH, logged_in_xpath),
+            )
+        )
+
+    def restore(self, driver, waiter):
+        """
+        Restores the saved session into the browser and checks that it is still valid.
+        :param driver: Selenium WebDriver instance.
+        :param waiter: PageWaiter used for the validity check.
+        :return: True if the browser is logged in and the login form can be skipped.
+        """
+        if not self.enabled:
+            return False
+        cookies = self.load_cookies()
+        if cookies:
+            # Cookies can only be added for the domain of the page currently open
+            driver.get(self.BASE_URL)
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        elif not self.user_data_dir:
+            return False
+        return self.is_logged_in(driver, waiter)
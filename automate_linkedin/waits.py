@@ -0,0 +1,146 @@
+import random
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from automate_linkedin.utils import Colors
+
+
+# Expected conditions that can be requested by name from `PageWaiter.wait_for`
+CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
+
+class PageWaiter:
+    """
+    Waits for page readiness by polling for elements instead of sleeping for a fixed time.
+
+    Every wait is tagged with a step name (e.g. "login", "job_details") so its duration
+    can be recorded and reported; the per-step timings show where the remaining latency
+    of a scan goes.
+    """
+
+    def __init__(self, driver, xpaths, wait_config=None):
+        """
+        :param driver: Selenium WebDriver instance.
+        :param xpaths: Dictionary containing XPaths for interacting with the LinkedIn site.
+        :param wait_config: `waits` section of `scan.yaml` with `default_timeout`,
+            `poll_frequency` and per-step `timeouts`.
+        """
+        wait_config = wait_config or {}
+        self.driver = driver
+        self.xpaths = xpaths
+        self.default_timeout = wait_config.get("default_timeout", 10)
+        self.poll_frequency = wait_config.get("poll_frequency", 0.2)
+        self.timeouts = dict(wait_config.get("timeouts", {}) or {})
+        self.timings = {}
+
+    def timeout_for(self, step):
+        """
+        :param step: Name of the step being waited for.
+        :return: Timeout in seconds configured for the step.
+        """
+        return self.timeouts.get(step, self.default_timeout)
+
+    def record(self, step, seconds):
+        """
+        Records how long a step waited.
+        :param step: Name of the step.
+        :param seconds: Duration of the wait in seconds.
+        """
+        self.timings.setdefault(step, []).append(seconds)
+
+    def wait_for(self, step, section, key, condition="present", timeout=None):
+        """
+        Waits for the element behind an `xpaths.yaml` entry.
+        :param step: Name of the step, used for timeouts and timing records.
+        :param section: Section of `xpaths.yaml` (e.g. "job_search").
+        :param key: Key inside the section (e.g. "job_title").
+        :param condition: One of "present", "visible" or "clickable".
+        :param timeout: Optional timeout overriding the configured one.
+        :return: The located WebElement.
+        :raises TimeoutException: If the element does not appear in time.
+        """
+        locator = (By.XPATH, self.xpaths[section][key])
+        return self.wait_until(step, CONDITIONS[condition](locator), timeout=timeout)
+
+    def wait_until(self, step, predicate, timeout=None):
+        """
+        Waits until `predicate(driver)` returns a truthy value.
+        :param step: Name of the step, used for timeouts and timing records.
+        :param predicate: Callable taking the driver, e.g. an expected condition.
+        :param timeout: Optional timeout overriding the configured one.
+        :return: The value returned by the predicate.
+        :raises TimeoutException: If the predicate stays falsy until the timeout.
+        """
+        timeout = self.timeout_for(step) if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(
+                self.driver, timeout, poll_frequency=self.poll_frequency
+            ).until(predicate)
+        finally:
+            self.record(step, time.perf_counter() - start)
+
+    def try_wait_until(self, step, predicate, timeout=None):
+        """
+        Same as `wait_until`, but returns None on timeout instead of raising.
+        """
+        try:
+            return self.wait_until(step, predicate, timeout=timeout)
+        except TimeoutException:
+            return None
+
+    def print_report(self):
+        """
+        Prints the number of waits and the mean and maximum wait time per step.
+        """
+        if not self.timings:
+            return
+        print(f"{Colors.HEADER}Wait Timings:{Colors.ENDC}")
+        for step, durations in sorted(self.timings.items()):
+            mean = sum(durations) / len(durations)
+            print(
+                f"{Colors.OKCYAN}{step}: {len(durations)} waits, "
+                f"mean {mean:.2f}s, max {max(durations):.2f}s, total {sum(durations):.1f}s{Colors.ENDC}"
+            )
+
+
+class JitterPolicy:
+    """
+    Adds deliberate random pauses between actions to keep the browsing pace human-like.
+
+    This is kept separate from `PageWaiter`: waits only last until the page is ready,
+    while jitter is an explicit, configurable anti-detection delay that can be tuned or
+    disabled on its own.
+    """
+
+    def __init__(self, jitter_config=None, rng=None):
+        """
+        :param jitter_config: `jitter` section of `scan.yaml` with `enabled` and a
+            `[min, max]` range in seconds per step.
+        :param rng: Optional random.Random instance, useful for reproducible runs.
+        """
+        jitter_config = dict(jitter_config or {})
+        self.enabled = jitter_config.pop("enabled", True)
+        self.ranges = {step: tuple(bounds) for step, bounds in jitter_config.items()}
+        self.rng = rng or random.Random()
+        self.total_seconds = 0.0
+
+    def pause(self, step):
+        """
+        Sleeps for a random duration within the range configured for the step.
+        :param step: Name of the step (e.g. "page", "card").
+        :return: Seconds slept.
+        """
+        if not self.enabled or step not in self.ranges:
+            return 0.0
+        low, high = self.ranges[step]
+        seconds = self.rng.uniform(low, high)
+        time.sleep(seconds)
+        self.total_seconds += seconds
+        return seconds
@@ -0,0 +1,143 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from automate_linkedin.pipeline import TokenBucket
+from automate_linkedin.planner import ScanPlanner
+from automate_linkedin.scraper import LinkedInScraper, ScanState, SeenJobs
+from automate_linkedin.utils import Colors
+
+
+class ScanWorkerPool:
+    """
+    Runs a scan across several browser sessions at once.
+
+    Every worker opens its own WebDriver session through `driver_factory`, logs in once,
+    and scans an interleaved shard of the result pages (worker 0 takes pages 0, N, 2N, ...,
+    worker 1 takes pages 1, N+1, ...). All workers write through the same JobCache, whose
+    lock serializes the writes, and draw from one request budget (TokenBucket), so the
+    configured `requests_per_minute` holds for the whole pool. With several search
+    profiles (see `planner.py`) every worker walks the same ordered plan, and one SeenJobs
+    set shared by all workers keeps overlapping searches from fetching a job twice. Because the browser is created by a factory, the pool can
+    run against a fake driver serving static HTML fixtures just as well as against Chrome.
+    """
+
+    def __init__(
+        self, driver_factory, xpaths, filters, credentials, workers=2, scan_config=None, metrics=None
+    ):
+        """
+        :param driver_factory: Callable returning a new WebDriver-like session.
+        :param xpaths: Dictionary containing XPaths for interacting with the LinkedIn site.
+        :param filters: Dictionary containing filters for job search and ranking.
+        :param credentials: Dictionary containing login credentials for LinkedIn.
+        :param workers: Number of browser sessions to run in parallel.
+        :param scan_config: Optional dictionary from `scan.yaml` with wait timeouts and jitter.
+        :param metrics: Optional `metrics.Metrics` shared by every worker.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.driver_factory = driver_factory
+        self.xpaths = xpaths
+        self.filters = filters
+        self.credentials = credentials
+        self.workers = workers
+        self.scan_config = scan_config
+        self.metrics = metrics
+        self.bucket = TokenBucket.from_config((scan_config or {}).get("pipeline"))
+        self.print_lock = threading.Lock()
+
+    def run(self, cache, checkpoint=None):
+        """
+        Scans all result pages with the worker pool and prints a throughput report.
+        :param cache: Database instance shared by every worker.
+        :param checkpoint: Optional ScanCheckpoint shared by every worker. The progress of
+            a resumed checkpoint is restored into the first worker's ScanState.
+        :return: List of ScanState objects, one per worker.
+        """
+        # Split the relevant-job budget evenly so the pool saves about `max_jobs` in total
+        max_jobs_per_worker = math.ceil(self.filters["max_jobs"] / self.workers)
+        seen_jobs = SeenJobs()
+        states = [
+            ScanState(max_jobs_per_worker, seen_jobs, checkpoint) for _ in range(self.workers)
+        ]
+        if checkpoint is not None and checkpoint.resumed:
+            checkpoint.restore(states[0])
+            for state in states[1:]:
+                state.restored_jobs = states[0].restored_jobs
+        planner = ScanPlanner(self.filters, cache)
+        plan = planner.plan()
+        planner.print_plan(plan)
+
+        started_at = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.run_worker, index, planner, plan, states[index])
+                for index in range(self.workers)
+            ]
+            failed = False
+            for index, future in enumerate(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed = True
+                    print(f"{Colors.FAIL}Worker {index} stopped with an error: {e}{Colors.ENDC}")
+        planner.save_cursors()
+        # A scan with a failed worker stays resumable
+        if checkpoint is not None and not failed:
+            checkpoint.finish()
+
+        self.print_report(states, time.time() - started_at)
+        return states
+
+    def run_worker(self, index, planner, plan, state):
+        """
+        Logs one browser session in and scans its shard of result pages of every search.
+        :param index: Worker number, used to pick the page shard.
+        :param planner: ScanPlanner whose cache is shared by every worker.
+        :param plan: List of SearchProfile tuples in scan order.
+        :param state: ScanState for this worker.
+        """
+        driver = self.driver_factory()
+        try:
+            scraper = LinkedInScraper(
+                driver, self.xpaths, self.filters, self.credentials, self.scan_config, self.metrics
+            )
+            scraper.pipeline.bucket = self.bucket
+            scraper.login()
+            state.started_at = time.time()
+            for profile in plan:
+                if state.limit_reached():
+                    break
+                planner.scan_profile(
+                    scraper,
+                    profile,
+                    state,
+                    pages=lambda total_pages: range(index, total_pages, self.workers),
+                    new_run=index == 0,
+                )
+            state.finished_at = time.time()
+            scraper.print_scan_summary(state)
+        finally:
+            driver.quit()
+
+    def print_report(self, states, elapsed):
+        """
+        Prints jobs per minute for every worker and for the whole pool.
+        :param states: ScanState objects returned by the workers.
+        :param elapsed: Wall-clock duration of the pool run in seconds.
+        """
+        total_scans = sum(state.total_scans for state in states)
+        total_saved = sum(state.jobs_scanned for state in states)
+        with self.print_lock:
+            print(f"{Colors.HEADER}Parallel Scan Report{Colors.ENDC}")
+            for index, state in enumerate(states):
+                print(
+                    f"{Colors.OKCYAN}Worker {index}: {state.total_scans} jobs scanned, "
+                    f"{state.jobs_scanned} saved, {state.jobs_per_minute():.1f} jobs/minute{Colors.ENDC}"
+                )
+            rate = total_scans * 60 / elapsed if elapsed > 0 else 0.0
+            print(
+                f"{Colors.OKGREEN}Total: {total_scans} jobs scanned, {total_saved} saved, "
+                f"{rate:.1f} jobs/minute{Colors.ENDC}"
+            )
@@ -0,0 +1,96 @@
+"""
+JobCache Write Benchmark
+========================
+
+Inserts synthetic jobs into a fresh database with the original write path (rollback
+journal, `synchronous=FULL`, one commit per row) and with WAL plus batched commits.
+
+USAGE:
+------
+    python benchmarks/bench_cache_writes.py --jobs 100000 --batch-rows 500
+"""
+
+import argparse
+import datetime
+import os
+import random
+import string
+import tempfile
+import time
+
+from automate_linkedin.cache import JobCache
+
+
+def synthetic_jobs(count, seed=7):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(8)) for _ in range(500)]
+    # Reuse a pool of descriptions so generating rows does not dominate the timings
+    descriptions = [" ".join(rng.choices(words, k=400)) for _ in range(200)]
+    now = datetime.datetime.now()
+    for index in range(count):
+        yield {
+            "job_id": str(4000000000 + index),
+            "title": " ".join(rng.choices(words, k=3)),
+            "company": rng.choice(words),
+            "location": rng.choice(words),
+            "date_posted": now - datetime.timedelta(hours=rng.randint(0, 24 * 30)),
+            "points": rng.randint(-1, 6),
+            "matched_keywords": ", ".join(rng.choices(words, k=3)),
+            "full_description": descriptions[index % len(descriptions)],
+            "job_link": f"https://www.linkedin.com/jobs/view/{4000000000 + index}",
+        }
+
+
+def run(label, jobs, db_path, journal_mode, synchronous, batch_rows=None):
+    cache = JobCache(db_path, journal_mode=journal_mode, synchronous=synchronous)
+    start = time.perf_counter()
+    if batch_rows:
+        with cache.batch(flush_rows=batch_rows, flush_seconds=60):
+            for job in synthetic_jobs(jobs):
+                cache.add_job(**job)
+    else:
+        for job in synthetic_jobs(jobs):
+            cache.add_job(**job)
+    elapsed = time.perf_counter() - start
+    cache.close()
+    print(f"{label:<40} {elapsed:8.2f}s  {jobs / elapsed:10.0f} jobs/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JobCache write benchmark")
+    parser.add_argument("--jobs", type=int, default=100000, help="Number of synthetic jobs")
+    parser.add_argument("--batch-rows", type=int, default=500, help="Rows per batched commit")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary databases")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        baseline = run(
+            "Per-row commit (DELETE journal, FULL)",
+            args.jobs,
+            os.path.join(tmp, "baseline.db"),
+            "DELETE",
+            "FULL",
+        )
+        wal = run(
+            "Per-row commit (WAL, NORMAL)",
+            args.jobs,
+            os.path.join(tmp, "wal.db"),
+            "WAL",
+            "NORMAL",
+        )
+        batched = run(
+            f"Batched {args.batch_rows} rows (WAL, NORMAL)",
+            args.jobs,
+            os.path.join(tmp, "batched.db"),
+            "WAL",
+            "NORMAL",
+            batch_rows=args.batch_rows,
+        )
+
+    print(f"Speedup WAL vs baseline:     {baseline / wal:6.1f}x")
+    print(f"Speedup batched vs baseline: {baseline / batched:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Description Storage Benchmark
+=============================
+
+Builds a database with the previous schema (version 10) from synthetic job ads, upgrades
+it (descriptions stay plain text in `jobs.full_description`), then moves them into the
+compressed, content-addressed `descriptions` table with `compress_descriptions`: with
+zlib, with zlib and a trained dictionary, and with zstd and a trained dictionary (if
+`zstandard` is installed). For every layout it prints the file size after VACUUM
+(including the full-text index), the size of the descriptions, the time to read every
+description and to export them to JSONL, and the time of a full scan of `jobs` that does
+not need the descriptions (as `database.py` analysis queries do).
+
+The ads are assembled from company blurbs, responsibility and requirement sentences,
+and shared benefits and equal-opportunity paragraphs; `--reposts` of them are exact
+copies under a new job ID.
+
+USAGE:
+------
+    python benchmarks/bench_descriptions.py --jobs 20000 --reposts 0.15
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from automate_linkedin.database import JobViewer
+from automate_linkedin.descriptions import load_zstandard
+from automate_linkedin.migrations import migrate
+
+VERBS = "Design Build Maintain Own Improve Develop Deploy Test Document Lead Support Scale Monitor Optimize Review".split()
+OBJECTS = (
+    "perception pipelines|motion planning software|data pipelines|REST APIs|simulation environments|"
+    "CI/CD workflows|embedded firmware|machine learning models|cloud infrastructure|customer integrations|"
+    "control systems|sensor calibration tools|internal dashboards|distributed services|test automation"
+).split("|")
+QUALIFIERS = (
+    "for our autonomous fleet|across multiple teams|in a fast-paced environment|with a focus on reliability|"
+    "using Python and C++|on AWS and Kubernetes|together with hardware engineers|from prototype to production|"
+    "for millions of users|with ROS2 and Isaac Sim"
+).split("|")
+SKILLS = (
+    "Python|C++|ROS|Kubernetes|Linux|computer vision|reinforcement learning|SQL|Go|Rust|PyTorch|"
+    "Docker|Terraform|CUDA|embedded systems|real-time systems|distributed systems|TypeScript"
+).split("|")
+INDUSTRIES = "robotics|logistics|healthcare|fintech|automotive|aerospace|retail|energy|agriculture".split("|")
+CITIES = "San Francisco|Boston|Austin|Seattle|New York|Pittsburgh|Denver|Chicago".split("|")
+BENEFIT_ITEMS = (
+    "medical, dental, and vision insurance|a 401(k) plan with company match|flexible paid time off|"
+    "paid parental leave|a yearly learning budget|commuter benefits|a home office stipend|"
+    "mental health support|company equity|wellness reimbursements|life and disability insurance"
+).split("|")
+
+
+def paragraph_variants(rng, count, template, items):
+    return [template.format(", ".join(rng.sample(items, 6))) for _ in range(count)]
+
+
+def synthetic_descriptions(count, reposts, seed=11):
+    rng = random.Random(seed)
+    companies = [f"Company{index}" for index in range(300)]
+    blurbs = {
+        company: (
+            f"{company} is a {rng.choice(INDUSTRIES)} company headquartered in {rng.choice(CITIES)}. "
+            f"Founded in {rng.randint(1990, 2022)}, we have grown to {rng.randint(20, 5000)} employees "
+            f"and work with customers in over {rng.randint(3, 60)} countries."
+        )
+        for company in companies
+    }
+    benefits = paragraph_variants(
+        rng, 12, "We offer competitive compensation and benefits, including {}. Salary is based on experience.",
+        BENEFIT_ITEMS,
+    )
+    equal_opportunity = [
+        f"{text} We are an equal opportunity employer and do not discriminate on the basis of race, religion, "
+        "color, national origin, gender, sexual orientation, age, marital status, veteran status, or disability "
+        "status. We will provide reasonable accommodations to qualified individuals with disabilities."
+        for text in ("", "We celebrate diversity and are committed to an inclusive workplace.",
+                     "All qualified applicants will receive consideration for employment.")
+    ]
+    descriptions = []
+    for _ in range(count):
+        if descriptions and rng.random() < reposts:
+            descriptions.append(rng.choice(descriptions))
+            continue
+        company = rng.choice(companies)
+        responsibilities = " ".join(
+            f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(QUALIFIERS)}." for _ in range(rng.randint(6, 12))
+        )
+        requirements = " ".join(
+            f"{rng.randint(1, 8)}+ years of experience with {rng.choice(SKILLS)} and {rng.choice(SKILLS)}."
+            for _ in range(rng.randint(4, 8))
+        )
+        descriptions.append(
+            f"About us: {blurbs[company]} Responsibilities: {responsibilities} Requirements: {requirements} "
+            f"{rng.choice(benefits)} {rng.choice(equal_opportunity)}"
+        )
+    return descriptions
+
+
+def build_legacy(path, descriptions):
+    connection = sqlite3.connect(path)
+    migrate(connection, target_version=10)
+    connection.executemany(
+        "INSERT INTO jobs (job_id, title, company, points, full_description) VALUES (?, ?, ?, ?, ?)",
+        [
+            (str(4000000000 + index), f"Engineer {index % 97}", f"Company{index % 300}", index % 7, text)
+            for index, text in enumerate(descriptions)
+        ],
+    )
+    connection.commit()
+    connection.execute("VACUUM")
+    connection.close()
+
+
+def timed(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(label, path, viewer, text_bytes, jobs, tmp):
+    stored = viewer.description_stats()["stored"]
+    read = timed(lambda: viewer.query_jobs("SELECT full_description FROM job_descriptions"))
+    export_path = os.path.join(tmp, "export.jsonl")
+    with contextlib.redirect_stdout(io.StringIO()):
+        export = timed(lambda: viewer.export(export_path, columns=["job_id", "full_description"]), repeat=1)
+    scan = timed(lambda: viewer.query_jobs("SELECT COUNT(*) FROM jobs WHERE title LIKE '%zz%'"))
+    print(
+        f"{label:<20} file {os.path.getsize(path) / 2**20:6.1f} MiB, descriptions {stored / 2**20:5.1f} MiB "
+        f"({text_bytes / stored:4.1f}x)  read {jobs / read:7.0f} jobs/s  export {jobs / export:7.0f} jobs/s  "
+        f"jobs scan {scan * 1000:5.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed description storage benchmark")
+    parser.add_argument("--jobs", type=int, default=20000, help="Number of synthetic jobs")
+    parser.add_argument("--reposts", type=float, default=0.15, help="Share of jobs repeating an earlier description")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary databases")
+    args = parser.parse_args()
+
+    descriptions = synthetic_descriptions(args.jobs, args.reposts)
+    text_bytes = sum(len(text.encode("utf-8")) for text in descriptions)
+    print(f"{args.jobs} jobs, {len(set(descriptions))} distinct descriptions, {text_bytes / 2**20:.1f} MiB of text")
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        path = os.path.join(tmp, "jobs.db")
+        build_legacy(path, descriptions)
+        start = time.perf_counter()
+        viewer = JobViewer(path)
+        migrated = time.perf_counter() - start
+        report("Plain text", path, viewer, text_bytes, args.jobs, tmp)
+
+        layouts = [("zlib", "zlib", False), ("zlib + dictionary", "zlib", True)]
+        try:
+            load_zstandard()
+            layouts += [("zstd + dictionary", "zstd", True)]
+        except ImportError:
+            print("zstd skipped (pip install zstandard)")
+        for label, codec, train in layouts:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                viewer.compress_descriptions(codec, train=train)
+            compressed = time.perf_counter() - start
+            viewer.vacuum()
+            report(label, path, viewer, text_bytes, args.jobs, tmp)
+            print(f"{'':<20} compressed in {compressed:.1f}s")
+        viewer.close()
+    print(f"Upgrade to version 11 took {migrated:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
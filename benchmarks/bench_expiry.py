@@ -0,0 +1,99 @@
+"""
+Expiring-Job Analysis Benchmark
+===============================
+
+Builds a synthetic database of pending jobs and compares the original per-row analysis
+(parse every date in Python, one UPDATE and commit per expiring job) with the set-based
+`JobViewer.boost_expiring_jobs`.
+
+USAGE:
+------
+    python benchmarks/bench_expiry.py --jobs 100000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from automate_linkedin.cache import JobCache
+from automate_linkedin.database import JobViewer
+
+
+def build_database(path, jobs, seed=7):
+    rng = random.Random(seed)
+    now = datetime.datetime.now()
+    cache = JobCache(path)
+    with cache.batch(flush_rows=5000, flush_seconds=60):
+        for index in range(jobs):
+            cache.add_job(
+                job_id=str(4000000000 + index),
+                title=f"Engineer {index}",
+                company=f"Company {index % 5000}",
+                location="Remote",
+                date_posted=now - datetime.timedelta(hours=rng.randint(0, 24 * 40)),
+                points=rng.randint(1, 6),
+                matched_keywords="Python",
+                full_description="",
+                job_link=f"https://www.linkedin.com/jobs/view/{4000000000 + index}",
+            )
+    cache.close()
+
+
+def legacy_analysis(viewer):
+    """
+    The loop `JobViewer.analyze_jobs` used before the set-based boost.
+    """
+    today = datetime.datetime.now()
+    expiring = 0
+    rows = viewer.query_jobs(
+        "SELECT job_id, title, company, date_posted, points FROM jobs WHERE applied = 0 ORDER BY points DESC"
+    )
+    for job_id, title, company, date_posted, points in rows:
+        if date_posted and (today - datetime.datetime.fromisoformat(date_posted)).days > 25:
+            expiring += 1
+            viewer.update_job_score(job_id, 5)
+    return expiring
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expiring-job analysis benchmark")
+    parser.add_argument("--jobs", type=int, default=100000, help="Number of synthetic pending jobs")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary databases")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        source = os.path.join(tmp, "source.db")
+        build_database(source, args.jobs)
+        legacy_path = os.path.join(tmp, "legacy.db")
+        boosted_path = os.path.join(tmp, "boosted.db")
+        shutil.copy(source, legacy_path)
+        shutil.copy(source, boosted_path)
+
+        viewer = JobViewer(legacy_path)
+        start = time.perf_counter()
+        legacy_count = legacy_analysis(viewer)
+        legacy_seconds = time.perf_counter() - start
+        viewer.close()
+
+        viewer = JobViewer(boosted_path)
+        start = time.perf_counter()
+        boosted_count = len(viewer.boost_expiring_jobs())
+        boosted_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        repeat_count = len(viewer.boost_expiring_jobs())
+        repeat_seconds = time.perf_counter() - start
+        viewer.close()
+
+    print(f"Pending jobs: {args.jobs}")
+    print(f"Per-row loop:         {legacy_seconds:8.3f}s ({legacy_count} jobs boosted)")
+    print(f"Set-based boost:      {boosted_seconds:8.3f}s ({boosted_count} jobs boosted)")
+    print(f"Set-based, second run:{repeat_seconds:8.3f}s ({repeat_count} jobs boosted)")
+    print(f"Speedup:              {legacy_seconds / boosted_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
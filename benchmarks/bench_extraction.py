@@ -0,0 +1,226 @@
+"""
+Extraction Benchmark
+====================
+
+Scans one saved results page (`fixtures/search_results.html`, 25 cards, with every card
+opening `fixtures/job_details.html` in the details pane) once with per-element WebDriver
+calls and once with bulk `execute_script` extraction. The fixtures are served by a small
+lxml-backed driver that counts WebDriver round trips and adds a fixed latency to each,
+like the HTTP hop to chromedriver.
+
+USAGE:
+------
+    python benchmarks/bench_extraction.py --latency-ms 5
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import tempfile
+import time
+
+from lxml import html
+
+from automate_linkedin import extraction
+from automate_linkedin.cache import JobCache
+from automate_linkedin.config import load_configs
+from automate_linkedin.scraper import LinkedInScraper, ScanState
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SEARCH_URL = "https://www.linkedin.com/jobs/search/?keywords=Robotics"
+
+
+def element_text(element):
+    """Approximates WebElement.text: whitespace-normalized text content."""
+    return " ".join(element.text_content().split())
+
+
+class FixtureElement:
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.element = element
+
+    @property
+    def text(self):
+        self.driver.round_trip()
+        return element_text(self.element)
+
+    def get_attribute(self, name):
+        self.driver.round_trip()
+        return self.element.get(name)
+
+    def click(self):
+        self.driver.round_trip()
+        self.driver.click(self.element)
+
+    def find_elements(self, by, value):
+        self.driver.round_trip()
+        if by == "tag name":
+            value = f".//{value}"
+        return [FixtureElement(self.driver, e) for e in self.element.xpath(value)]
+
+
+class FixtureDriver:
+    """
+    Serves the saved fixtures through the subset of the WebDriver API used by the scraper.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.round_trips = 0
+        self.url = "about:blank"
+        with open(os.path.join(FIXTURES, "search_results.html"), encoding="utf-8") as f:
+            self.search_page = f.read()
+        with open(os.path.join(FIXTURES, "job_details.html"), encoding="utf-8") as f:
+            self.details_template = f.read()
+        self.document = None
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def current_url(self):
+        self.round_trip()
+        return self.url
+
+    def get(self, url):
+        self.round_trip()
+        self.url = url
+        self.document = html.fromstring(self.search_page)
+
+    def find_elements(self, by, value):
+        self.round_trip()
+        return [FixtureElement(self, e) for e in self.document.xpath(value)]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            from selenium.common.exceptions import NoSuchElementException
+
+            raise NoSuchElementException(value)
+        return elements[0]
+
+    def click(self, element):
+        job_id = element.get("data-occludable-job-id")
+        if job_id is None:
+            return
+        title = element_text(element.xpath(".//a")[0])
+        company = element_text(element.xpath(".//*[contains(@class, 'subtitle')]")[0])
+        pane = self.document.get_element_by_id("job-details-pane")
+        for child in list(pane):
+            pane.remove(child)
+        pane.append(
+            html.fragment_fromstring(
+                self.details_template.format(
+                    title=title, company=company, company_slug=re.sub(r"\W+", "-", company.lower())
+                )
+            )
+        )
+        self.url = f"{SEARCH_URL}&currentJobId={job_id}"
+
+    def first(self, xpath, context=None):
+        nodes = (context if context is not None else self.document).xpath(xpath)
+        return nodes[0] if nodes else None
+
+    def execute_script(self, script, *args):
+        """Runs the Python equivalent of the scripts the scraper sends to the browser."""
+        self.round_trip()
+        if script == extraction.PAGE_CARDS_SCRIPT:
+            xp = args[0]
+            cards = []
+            for card in self.document.xpath(xp["job_card"]):
+                title, company = self.first(xp["card_title"], card), self.first(xp["card_company"], card)
+                cards.append(
+                    {
+                        "job_id": card.get("data-occludable-job-id"),
+                        "title": element_text(title) if title is not None else None,
+                        "company": element_text(company) if company is not None else None,
+                    }
+                )
+            return cards
+        if script == extraction.CLICK_CARD_SCRIPT:
+            card = self.first(args[0])
+            if card is None:
+                return False
+            self.click(card)
+            return True
+        if script == extraction.SHOWN_JOB_SCRIPT:
+            xp = args[0]
+            shown = {"url": self.url}
+            for key, xpath_key in (("title", "job_title"), ("company", "company")):
+                node = self.first(xp[xpath_key])
+                shown[key] = element_text(node) if node is not None else None
+            return shown
+        if script in (extraction.JOB_DETAILS_SCRIPT, extraction.DESCRIPTION_SCRIPT):
+            xp = args[0] if script == extraction.JOB_DETAILS_SCRIPT else {"full_description": args[0]}
+            description = self.first(xp["full_description"])
+            full_description = (
+                " ".join(element_text(span) for span in description.iter("span"))
+                if description is not None
+                else None
+            )
+            if script == extraction.DESCRIPTION_SCRIPT:
+                return full_description
+            values = {}
+            for key, xpath_key in (
+                ("title", "job_title"),
+                ("company", "company"),
+                ("primary_description", "primary_description"),
+            ):
+                node = self.first(xp[xpath_key])
+                values[key] = element_text(node) if node is not None else None
+            values["full_description"] = full_description
+            values["show_more"] = self.first(xp["show_more_button"]) is not None
+            return values
+        if "click()" in script:
+            self.click(args[0].element)
+        return None
+
+
+def run(mode, configs, latency, tmp):
+    driver = FixtureDriver(latency)
+    scan_config = dict(
+        configs["scan"], extraction=mode, jitter={"enabled": False}, pipeline={"requests_per_minute": 0}
+    )
+    filters = configs["job_filters"]
+    scraper = LinkedInScraper(driver, configs["xpaths"], filters, {}, scan_config)
+    scraper.search_url = SEARCH_URL
+    state = ScanState(1000)
+
+    # Keep the scraper's per-job output out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        cache = JobCache(os.path.join(tmp, f"{mode}.db"))
+        start = time.perf_counter()
+        scraper.scan_page(0, filters, cache, state)
+        elapsed = time.perf_counter() - start
+        cache.close()
+
+    jobs = state.total_scans - len(state.failed_jobs)
+    print(
+        f"{mode:<10} {jobs:3d} jobs  {driver.round_trips / jobs:6.1f} round trips/job  "
+        f"{elapsed * 1000 / jobs:7.1f} ms/job  ({len(state.failed_jobs)} failed)"
+    )
+    return driver.round_trips, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk vs per-element extraction benchmark")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Latency added to each WebDriver call")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary databases")
+    args = parser.parse_args()
+
+    configs = load_configs()
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        element_trips, element_time = run("elements", configs, args.latency_ms / 1000, tmp)
+        bulk_trips, bulk_time = run("bulk", configs, args.latency_ms / 1000, tmp)
+
+    print(f"Round trips: {element_trips} -> {bulk_trips} ({element_trips / bulk_trips:.1f}x fewer)")
+    print(f"Scan time:   {element_time:.2f}s -> {bulk_time:.2f}s ({element_time / bulk_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
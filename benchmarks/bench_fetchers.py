@@ -0,0 +1,99 @@
+"""
+HTTP Fetcher Benchmark
+======================
+
+Starts a local HTTP server that stands in for LinkedIn and serves
+`fixtures/job_details.html` at `/jobs/view/{job_id}/` after a fixed delay, then fetches
+the same jobs with `HttpFetcher` one at a time and with increasing concurrency.
+
+USAGE:
+------
+    python benchmarks/bench_fetchers.py --jobs 200 --delay-ms 100
+"""
+
+import argparse
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from automate_linkedin.config import load_configs
+from automate_linkedin.fetchers import HttpFetcher
+from automate_linkedin.pipeline import FetchPipeline
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def make_handler(template, delay):
+    class JobPageHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            match = re.match(r"^/jobs/view/(\d+)/?$", self.path)
+            if not match:
+                self.send_error(404)
+                return
+            time.sleep(delay)
+            body = (
+                "<html><body>"
+                + template.format(title=f"Robotics Engineer {match.group(1)}", company="Nuro", company_slug="nuro")
+                + "</body></html>"
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return JobPageHandler
+
+
+def run(xpaths, base_url, job_ids, concurrency):
+    fetcher = HttpFetcher(xpaths, {"base_url": base_url}, pool_size=concurrency)
+    start = time.perf_counter()
+    if concurrency == 1:
+        results = {job_id: fetcher.fetch_job(job_id) for job_id in job_ids}
+    else:
+        # No request budget, so only the concurrency limits the rate
+        results = FetchPipeline(fetcher, {"concurrency": concurrency}).prefetch(job_ids)
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+    failed = sum(isinstance(result, Exception) for result in results.values())
+    print(
+        f"concurrency {concurrency:>3}: {len(job_ids) / elapsed:8.1f} jobs/s  "
+        f"{elapsed:6.2f}s  ({failed} failed)"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP fetcher benchmark against a local server")
+    parser.add_argument("--jobs", type=int, default=200, help="Number of job pages to fetch")
+    parser.add_argument("--delay-ms", type=float, default=100.0, help="Server delay per page")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    args = parser.parse_args()
+
+    with open(os.path.join(FIXTURES, "job_details.html"), encoding="utf-8") as f:
+        template = f.read()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(template, args.delay_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    xpaths = load_configs(["xpaths"])["xpaths"]
+    job_ids = [str(4200000000 + index) for index in range(args.jobs)]
+    timings = {concurrency: run(xpaths, base_url, job_ids, concurrency) for concurrency in args.concurrency}
+    server.shutdown()
+
+    baseline = timings.get(1)
+    if baseline:
+        for concurrency, elapsed in timings.items():
+            if concurrency != 1:
+                print(f"Speedup at concurrency {concurrency}: {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
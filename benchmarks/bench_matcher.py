@@ -0,0 +1,99 @@
+"""
+Keyword Matcher Benchmark
+=========================
+
+Compares the original per-keyword loops of `calculate_description_points` with the
+compiled `KeywordMatcher` on synthetic job descriptions.
+
+USAGE:
+------
+    python benchmarks/bench_matcher.py --keywords 120 --size 8000 --jobs 200
+"""
+
+import argparse
+import random
+import string
+import time
+
+from automate_linkedin.matcher import KeywordMatcher
+
+
+def legacy_points(full_description, positive_words, negative_words, best_words):
+    """
+    The keyword loops as they were in `LinkedInScraper.calculate_description_points`,
+    plus the extra rescan that built `matched_keywords` in `extract_job_details`.
+    """
+    points = 0
+    pos_words_found, neg_words_found, best_words_found = [], [], []
+    for word in positive_words:
+        if word.lower() in full_description.lower():
+            points += 1
+            pos_words_found.append(word)
+    for word in negative_words:
+        if word.lower() in full_description.lower():
+            points = -1
+            neg_words_found.append(word)
+    for word in best_words:
+        if word.lower() in full_description.lower():
+            points = 1
+            best_words_found.append(word)
+    matched_keywords = [w for w in positive_words if w.lower() in full_description.lower()]
+    return points, pos_words_found, neg_words_found, best_words_found, matched_keywords
+
+
+def random_word(rng, low=3, high=10):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(low, high)))
+
+
+def build_corpus(rng, keyword_count, size, jobs):
+    keywords = [random_word(rng) for _ in range(keyword_count)]
+    keywords += [f"{random_word(rng)} {random_word(rng)}" for _ in range(keyword_count // 4)]
+    descriptions = []
+    for _ in range(jobs):
+        words = []
+        length = 0
+        while length < size:
+            word = rng.choice(keywords) if rng.random() < 0.02 else random_word(rng)
+            words.append(word.capitalize() if rng.random() < 0.1 else word)
+            length += len(word) + 1
+        descriptions.append(" ".join(words))
+    return keywords, descriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword matcher microbenchmark")
+    parser.add_argument("--keywords", type=int, default=120, help="Number of keywords per list")
+    parser.add_argument("--size", type=int, default=8000, help="Description size in characters")
+    parser.add_argument("--jobs", type=int, default=200, help="Number of descriptions")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keywords, descriptions = build_corpus(rng, args.keywords, args.size, args.jobs)
+    rng.shuffle(keywords)
+    third = len(keywords) // 3
+    positive, negative, best = keywords[:third], keywords[third:2 * third], keywords[2 * third:]
+
+    start = time.perf_counter()
+    for description in descriptions:
+        legacy_points(description, positive, negative, best)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(positive, negative, best, whole_words=True)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for description in descriptions:
+        matcher.match(description)
+    matcher_seconds = time.perf_counter() - start
+
+    print(f"Keywords: {len(keywords)} | Descriptions: {len(descriptions)} x ~{args.size} chars")
+    print(f"Legacy loops:    {legacy_seconds * 1000 / len(descriptions):8.3f} ms/job")
+    print(f"KeywordMatcher:  {matcher_seconds * 1000 / len(descriptions):8.3f} ms/job "
+          f"(compiled once in {build_seconds * 1000:.2f} ms)")
+    print(f"Speedup:         {legacy_seconds / matcher_seconds:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Pipeline Budget Benchmark
+=========================
+
+Fetches job pages from a local stand-in server through `FetchPipeline` with several
+request budgets and prints the achieved rate next to the configured one. The server can
+fail a share of the requests to exercise the retries and backoff.
+
+USAGE:
+------
+    python benchmarks/bench_pipeline.py --jobs 100 --budgets 600 1200 2400 --error-rate 0.1
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from automate_linkedin.config import load_configs
+from automate_linkedin.fetchers import HttpFetcher
+from automate_linkedin.pipeline import FetchPipeline
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def make_handler(template, delay, error_rate, seed=11):
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    class FlakyJobPageHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            match = re.match(r"^/jobs/view/(\d+)/?$", self.path)
+            time.sleep(delay)
+            with lock:
+                failed = rng.random() < error_rate
+            if not match or failed:
+                self.send_error(503 if match else 404)
+                return
+            body = (
+                "<html><body>"
+                + template.format(title=f"Robotics Engineer {match.group(1)}", company="Nuro", company_slug="nuro")
+                + "</body></html>"
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FlakyJobPageHandler
+
+
+def run(xpaths, base_url, job_ids, budget, args):
+    pipeline_config = {
+        "requests_per_minute": budget,
+        "burst": args.burst,
+        "concurrency": args.concurrency,
+        "retries": 2,
+        "backoff_base": 0.05,
+        "backoff_max": 1,
+    }
+    # Connection retries are left to the pipeline so every request counts against the budget
+    fetcher = HttpFetcher(xpaths, {"base_url": base_url, "retries": 0}, pool_size=args.concurrency)
+    pipeline = FetchPipeline(fetcher, pipeline_config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = pipeline.prefetch(job_ids)
+    fetcher.close()
+
+    failed = sum(isinstance(result, Exception) for result in results.values())
+    # The first `burst` requests are free; the rest are spread at the budgeted rate
+    expected = max(0, pipeline.requests - args.burst) * 60 / budget
+    print(
+        f"budget {budget:6d}/min: achieved {pipeline.requests_per_minute():7.1f}/min  "
+        f"{pipeline.requests} requests ({pipeline.retried} retried, {failed} failed)  "
+        f"elapsed {time.time() - pipeline.started_at:5.2f}s, ideal {expected:5.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch pipeline budget benchmark")
+    parser.add_argument("--jobs", type=int, default=100, help="Number of job pages to fetch")
+    parser.add_argument("--budgets", type=int, nargs="+", default=[600, 1200, 2400], help="Requests per minute")
+    parser.add_argument("--burst", type=int, default=5, help="Token-bucket burst size")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight at once")
+    parser.add_argument("--delay-ms", type=float, default=50.0, help="Server delay per page")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="Share of requests the server fails")
+    args = parser.parse_args()
+
+    with open(os.path.join(FIXTURES, "job_details.html"), encoding="utf-8") as f:
+        template = f.read()
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(template, args.delay_ms / 1000, args.error_rate)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    xpaths = load_configs(["xpaths"])["xpaths"]
+    job_ids = [str(4300000000 + index) for index in range(args.jobs)]
+    for budget in args.budgets:
+        run(xpaths, base_url, job_ids, budget, args)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Replay Benchmark
+================
+
+Runs a whole scan (search, every results page, opening and reading each job, scoring and
+database writes) against a recorded scan served by `replay.ReplayDriver`, and reports the
+throughput, the WebDriver round trips per job and the memory used.
+
+Record a real scan by setting `replay.record_dir` in `scan.yaml`, or let the benchmark
+build a synthetic recording from `fixtures/` (`--pages` results pages of 25 jobs each).
+Memory is measured in a second run with tracemalloc, which slows Python down and would
+skew the timings.
+
+USAGE:
+------
+    python benchmarks/bench_replay.py --pages 8 --latency-ms 2
+    python benchmarks/bench_replay.py --record-dir recordings/2026-10
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import resource
+import tempfile
+import time
+import tracemalloc
+
+from lxml import html
+
+from automate_linkedin.cache import JobCache
+from automate_linkedin.config import load_configs
+from automate_linkedin.planner import ScanPlanner
+from automate_linkedin.replay import PageRecorder, ReplayDriver
+from automate_linkedin.scraper import LinkedInScraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIRST_JOB_ID = 4100000000
+
+
+def build_recording(record_dir, search_url, pages):
+    """
+    Writes a synthetic recording: `pages` copies of the fixture results page with unique
+    job IDs, and for every card a job page with the details pane filled in.
+    """
+    with open(os.path.join(FIXTURES, "search_results.html"), encoding="utf-8") as f:
+        search_page = f.read()
+    with open(os.path.join(FIXTURES, "job_details.html"), encoding="utf-8") as f:
+        details_template = f.read()
+    search_page = re.sub(r"<small>[\d,]+ results</small>", f"<small>{pages * 25} results</small>", search_page)
+
+    recorder = PageRecorder(record_dir)
+    for page in range(pages):
+        source = re.sub(
+            rf"{FIRST_JOB_ID // 100}(\d\d)",
+            lambda match: str(FIRST_JOB_ID + page * 25 + int(match.group(1))),
+            search_page,
+        )
+        recorder.record_search(f"{search_url}&start={page * 25}", source)
+        document = html.fromstring(source)
+        for card in document.xpath("//li[@data-occludable-job-id]"):
+            title = " ".join(card.xpath(".//a")[0].text_content().split())
+            company = " ".join(card.xpath(".//*[contains(@class, 'subtitle')]")[0].text_content().split())
+            job_page = html.fromstring(source)
+            job_page.get_element_by_id("job-details-pane").append(
+                html.fragment_fromstring(
+                    details_template.format(
+                        title=title, company=company, company_slug=re.sub(r"\W+", "-", company.lower())
+                    )
+                )
+            )
+            recorder.record_job(card.get("data-occludable-job-id"), html.tostring(job_page, encoding="unicode"))
+
+
+def run(configs, record_dir, args, tmp, name):
+    driver = ReplayDriver(record_dir, args.latency_ms / 1000)
+    scan_config = dict(
+        configs["scan"],
+        extraction=args.extraction,
+        jitter={"enabled": False},
+        pipeline={"requests_per_minute": 0},
+        session={"enabled": False},
+        replay={"record_dir": None},
+    )
+    filters = dict(configs["job_filters"], max_jobs=args.max_jobs)
+    scraper = LinkedInScraper(driver, configs["xpaths"], filters, {}, scan_config)
+
+    # Keep the scraper's per-job output out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        cache = JobCache(os.path.join(tmp, f"{name}.db"))
+        start = time.perf_counter()
+        state = ScanPlanner(filters, cache).run(scraper)
+        cache.close()
+        elapsed = time.perf_counter() - start
+    return state, driver.round_trips, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scan benchmark on a recorded scan")
+    parser.add_argument("--record-dir", default=None, help="Recording to replay (default: synthetic)")
+    parser.add_argument("--pages", type=int, default=8, help="Results pages of the synthetic recording")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to each WebDriver call")
+    parser.add_argument("--extraction", choices=["bulk", "elements"], default="bulk", help="Extraction mode")
+    parser.add_argument("--max-jobs", type=int, default=100000, help="max_jobs for the scan")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary files")
+    args = parser.parse_args()
+
+    configs = load_configs()
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        record_dir = args.record_dir
+        if record_dir is None:
+            record_dir = os.path.join(tmp, "recording")
+            build_recording(record_dir, LinkedInScraper.generate_search_url(configs["job_filters"]), args.pages)
+
+        state, round_trips, elapsed = run(configs, record_dir, args, tmp, "timed")
+        tracemalloc.start()
+        run(configs, record_dir, args, tmp, "traced")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    jobs = max(state.total_scans, 1)
+    print(
+        f"{state.total_scans} jobs, {state.jobs_scanned} saved, {len(state.failed_jobs)} failed "
+        f"in {elapsed:.2f}s: {state.total_scans / elapsed:.1f} jobs/s, "
+        f"{elapsed * 1000 / jobs:.2f} ms/job, {round_trips / jobs:.1f} round trips/job"
+    )
+    # ru_maxrss is reported in kilobytes on Linux
+    print(
+        f"Peak Python allocations: {peak / 2**20:.1f} MiB, "
+        f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Rescore Benchmark
+=================
+
+Fills a fresh database with synthetic jobs and re-scores them with the filters from
+`job_filters.yaml`, first in a single process and then across a process pool. A third
+run with unchanged filters shows that already scored jobs are skipped.
+
+USAGE:
+------
+    python benchmarks/bench_rescore.py --jobs 50000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from automate_linkedin.cache import JobCache
+from automate_linkedin.config import load_configs
+from automate_linkedin.rescore import JobRescorer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_cache_writes import synthetic_jobs  # noqa: E402
+
+
+def run(label, cache, filters, workers):
+    start = time.perf_counter()
+    rescored = JobRescorer(cache, filters, workers=workers).run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {rescored:8d} jobs {elapsed:8.2f}s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline rescore benchmark")
+    parser.add_argument("--jobs", type=int, default=50000, help="Number of synthetic jobs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Scoring processes")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary database")
+    args = parser.parse_args()
+
+    filters = load_configs(["job_filters"], use_snapshot=False)["job_filters"]
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        cache = JobCache(os.path.join(tmp, "rescore.db"))
+        with cache.batch(flush_rows=1000, flush_seconds=60):
+            for job in synthetic_jobs(args.jobs):
+                cache.add_job(**job)
+
+        single = run("Single process", cache, filters, 1)
+        cache.write("UPDATE jobs SET score_hash = NULL")
+        pooled = run(f"{args.workers} processes", cache, filters, args.workers)
+        run("Unchanged filters", cache, filters, args.workers)
+        cache.close()
+
+    print(f"Speedup pool vs single process: {single / pooled:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
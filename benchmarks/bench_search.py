@@ -0,0 +1,114 @@
+"""
+Full-Text Search Benchmark
+==========================
+
+Fills a fresh database with synthetic jobs (the `jobs_fts` triggers index them as they
+are inserted), then runs the same questions as `LIKE '%...%'` scans over the descriptions
+and as ranked FTS5 searches through `JobViewer.search`, and prints the time per query.
+
+USAGE:
+------
+    python benchmarks/bench_search.py --jobs 50000 --words 500
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import string
+import tempfile
+import time
+
+from automate_linkedin.cache import JobCache
+from automate_linkedin.database import JobViewer
+
+# (FTS5 query, equivalent LIKE patterns)
+QUERIES = [
+    ('ROS2 "Isaac Sim"', ["%ros2%", "%isaac sim%"]),
+    ("kubernetes", ["%kubernetes%"]),
+    ('"motion planning" NOT senior', None),
+    ("perception", ["%perception%"]),
+]
+RARE_TERMS = ["ROS2", "Isaac Sim", "Kubernetes", "motion planning", "perception", "senior"]
+
+
+def synthetic_jobs(count, words_per_job, seed=5):
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10))) for _ in range(5000)]
+    # Zipf-like word frequencies, as in real text
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for index in range(count):
+        words = rng.choices(vocabulary, weights, k=words_per_job)
+        for term in RARE_TERMS:
+            if rng.random() < 0.03:
+                words.insert(rng.randrange(len(words)), term)
+        yield {
+            "job_id": str(4000000000 + index),
+            "title": " ".join(rng.choices(vocabulary[:300], k=3)),
+            "company": rng.choice(vocabulary[:1000]),
+            "location": "Remote",
+            "date_posted": None,
+            "points": rng.randint(-1, 6),
+            "matched_keywords": "",
+            "full_description": " ".join(words),
+            "job_link": f"https://www.linkedin.com/jobs/view/{4000000000 + index}",
+        }
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LIKE vs FTS5 search benchmark")
+    parser.add_argument("--jobs", type=int, default=20000, help="Number of synthetic jobs")
+    parser.add_argument("--words", type=int, default=400, help="Words per job description")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        db_path = os.path.join(tmp, "search.db")
+        with contextlib.redirect_stdout(io.StringIO()):
+            cache = JobCache(db_path)
+        start = time.perf_counter()
+        with cache.batch(flush_rows=1000, flush_seconds=60):
+            for job in synthetic_jobs(args.jobs, args.words):
+                cache.add_job(**job)
+        cache.close()
+        print(
+            f"Inserted and indexed {args.jobs} jobs in {time.perf_counter() - start:.1f}s, "
+            f"database {os.path.getsize(db_path) / 2**20:.0f} MiB"
+        )
+
+        viewer = JobViewer(db_path)
+        start = time.perf_counter()
+        viewer.rebuild_search_index()
+        print(f"Rebuilt the index from scratch in {time.perf_counter() - start:.1f}s")
+
+        for query, patterns in QUERIES:
+            fts_time, results = timed(lambda: viewer.search(query, limit=20), args.repeat)
+            line = f"{query:<32} FTS5 {fts_time * 1000:8.1f} ms ({len(results)} ranked results)"
+            if patterns:
+                like = " AND ".join(["job_descriptions.full_description LIKE ?"] * len(patterns))
+                like_time, rows = timed(
+                    lambda: viewer.query_jobs_params(
+                        f"""
+                        SELECT jobs.job_id FROM jobs JOIN job_descriptions ON job_descriptions.job_rowid = jobs.rowid
+                        WHERE {like} ORDER BY jobs.points DESC LIMIT 20
+                        """,
+                        patterns,
+                    ),
+                    args.repeat,
+                )
+                line += f"  LIKE {like_time * 1000:8.1f} ms  {like_time / fts_time:6.1f}x"
+            print(line)
+        viewer.close()
+
+
+if __name__ == "__main__":
+    main()
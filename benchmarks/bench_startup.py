@@ -0,0 +1,75 @@
+"""
+Startup Benchmark
+=================
+
+Measures the wall-clock time of `automate.py` for the modes that do not open a browser
+(`stats`, `apply`, `rescore`) against an empty database, the import time of the `scan`
+mode up to the point where Chrome would start, and the cost of loading the configuration
+files by parsing the YAML and from the snapshot.
+
+USAGE:
+------
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from automate_linkedin import config
+
+SCAN_IMPORTS = (
+    "import automate_linkedin.automate, automate_linkedin.browser, automate_linkedin.scraper, "
+    "automate_linkedin.workers, selenium.webdriver, webdriver_manager.chrome"
+)
+
+
+def time_command(command, cwd, runs, stdin=""):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command, cwd=cwd, input=stdin, text=True, check=True, stdout=subprocess.DEVNULL
+        )
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def time_config_load(loader, runs):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        loader()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="automate.py startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement (median is shown)")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary database")
+    args = parser.parse_args()
+
+    print("Process wall time (median):")
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for mode in ("stats", "apply", "rescore"):
+            command = [sys.executable, "-m", "automate_linkedin.automate", "--mode", mode]
+            if mode == "rescore":
+                command += ["--workers", "1"]
+            print(f"  --mode {mode:<10} {time_command(command, tmp, args.runs):6.3f}s")
+        scan = time_command([sys.executable, "-c", SCAN_IMPORTS], tmp, args.runs)
+        print(f"  --mode scan       {scan:6.3f}s  (imports only, before Chrome starts)")
+
+    print("Loading the configuration files in-process (median):")
+    config.load_configs()  # make sure the snapshot exists
+    parse = time_config_load(lambda: config.load_configs(use_snapshot=False), args.runs)
+    snapshot = time_config_load(config.load_configs, args.runs)
+    print(f"  Parse YAML        {parse:6.3f}s")
+    print(f"  Snapshot          {snapshot:6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,9 +25,12 @@ setup(
         "selenium",
         "webdriver-manager",
         "PyYAML",
-        "hydra-core",
         "pandas",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "http": ["requests", "lxml"],
+    },
     entry_points={
         "console_scripts": [
             "linkedin-job-automation=automate_linkedin.automate:main",